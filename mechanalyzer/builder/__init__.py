@@ -6,6 +6,7 @@ from mechanalyzer.builder._stereo import expand_mech_stereo
 from mechanalyzer.builder._stereo import remove_stereochemistry
 from mechanalyzer.builder._stereo import diastereomer_abstractions
 from mechanalyzer.builder._stereo import valid_enantiomerically
+from mechanalyzer.builder._sccs import select_sccs_combo
 from mechanalyzer.builder._update import update_spc_dct_from_reactions
 from mechanalyzer.builder._update import update_rxn_dct
 from mechanalyzer.builder._update import remove_spc_not_in_reactions
@@ -15,6 +16,7 @@ from mechanalyzer.builder._conn import connected_surfaces
 from mechanalyzer.builder._graph import pes_graphs_dct
 from mechanalyzer.builder._names import rxn_name_str
 from mechanalyzer.builder._names import remap_mechanism_names
+from mechanalyzer.builder._names import NameIndex
 from mechanalyzer.builder._names import functional_group_name_dct
 from mechanalyzer.builder._names import functional_group_name
 from mechanalyzer.builder._names import stereo_name_suffix
@@ -34,6 +36,7 @@ __all__ = [
     'remove_stereochemistry',
     'diastereomer_abstractions',
     'valid_enantiomerically',
+    'select_sccs_combo',
     'update_spc_dct_from_reactions',
     'update_rxn_dct',
     'remove_spc_not_in_reactions',
@@ -43,6 +46,7 @@ __all__ = [
     'pes_graphs_dct',
     'rxn_name_str',
     'remap_mechanism_names',
+    'NameIndex',
     'functional_group_name_dct',
     'functional_group_name',
     'stereo_name_suffix',
@@ -2,66 +2,208 @@
 """
 
 import copy
+import numpy
 import ioformat
 import automol.inchi
 import automol.geom
 import automol.graph
 from automol.graph import FunctionalGroup
 import automol.formula
+from mechanalyzer.parser import ich_cache
 
 
 # Name remaping function
-def remap_mechanism_names(mech_spc_dct, rxn_param_dct, map_dct):
+def remap_mechanism_names(mech_spc_dct, rxn_param_dct, map_dct,
+                          rxn_ktp_dct=None, spc_therm_dct=None,
+                          name_index=None):
     """ Change all of the names in a spc_dct and rxn_param_dct
-        according to the provided dictionary
+        according to the provided dictionary. Names missing from the
+        dictionary (or mapped to None) are kept; map_dct is not changed.
+
+        A rxn_ktp_dct and a spc_therm_dct of the same mechanism can be
+        remapped in the same call. For repeated renames of a mechanism, pass
+        the same NameIndex so that its names and rxns are only indexed once.
+
+        :param mech_spc_dct: species dictionary
+        :type mech_spc_dct: dict[str: dict]
+        :param rxn_param_dct: rate parameters of each rxn
+        :type rxn_param_dct: dict[rxn: params]
+        :param map_dct: new name of each species
+        :type map_dct: dict[str: str]
+        :param rxn_ktp_dct: rate constants of each rxn
+        :type rxn_ktp_dct: dict[rxn: ktp_dct]
+        :param spc_therm_dct: thermo of each species
+        :type spc_therm_dct: dict[str: thermo]
+        :param name_index: index of the names and rxns of the mechanism
+        :type name_index: NameIndex
+        :return: re_mech_spc_dct, re_rxn_param_dct, and also re_rxn_ktp_dct
+            and re_spc_therm_dct if either rxn_ktp_dct or spc_therm_dct
+            is given (None for the one that is not)
+        :rtype: tuple(dict)
     """
-    def remap_single_rxn(rxn, map_dct):
-        """ Remaps names for a single reaction
-        """
-        rcts, prds, thrd = rxn
-        re_rcts = remap_rcts_or_prds(rcts, map_dct)
-        re_prds = remap_rcts_or_prds(prds, map_dct)
 
-        return (re_rcts, re_prds, thrd)
+    if name_index is None:
+        name_index = NameIndex()
+    for dct in (mech_spc_dct, spc_therm_dct):
+        if dct is not None:
+            name_index.add_names(dct)
+    for dct in (rxn_param_dct, rxn_ktp_dct):
+        if dct is not None:
+            name_index.add_rxns(dct)
+    re_name_arr = name_index.renamed(map_dct)
+
+    re_mech_spc_dct = name_index.remap_spc_dct(mech_spc_dct, re_name_arr)
+    re_rxn_param_dct = name_index.remap_rxn_dct(rxn_param_dct, re_name_arr)
+    if rxn_ktp_dct is None and spc_therm_dct is None:
+        return re_mech_spc_dct, re_rxn_param_dct
+
+    re_rxn_ktp_dct, re_spc_therm_dct = None, None
+    if rxn_ktp_dct is not None:
+        re_rxn_ktp_dct = name_index.remap_rxn_dct(rxn_ktp_dct, re_name_arr)
+    if spc_therm_dct is not None:
+        re_spc_therm_dct = name_index.remap_spc_dct(
+            spc_therm_dct, re_name_arr)
+
+    return re_mech_spc_dct, re_rxn_param_dct, re_rxn_ktp_dct, re_spc_therm_dct
+
+
+class NameIndex:
+    """ Species names of a mechanism interned to integer ids, with the
+        reactants and products of each rxn stored as ids in one flat array.
+        A rename is then a lookup of the new name of each id followed by a
+        single gather over the ids of all of the rxns.
+
+        Names and rxns are added when first seen, so the same index can be
+        used for all of the dcts of a mechanism and for repeated renames.
+        All of the names and rxns of the dcts to remap have to be added
+        before the new names are built with renamed.
+    """
 
-    def remap_rcts_or_prds(spcs, map_dct):
-        """ Remaps names for a single set of species (rcts or prds)
+    def __init__(self, names=(), rxns=()):
+        """ :param names: species names to index (e.g., a mech_spc_dct)
+            :type names: iterable of str
+            :param rxns: rxn keys to index (e.g., a rxn_param_dct)
+            :type rxns: iterable of tuples (rcts, prds, third_bods)
         """
-        re_spcs = []
-        for spc in spcs:
-            # Remap species name if in map_dct
-            if map_dct.get(spc) is not None:
-                re_spcs.append(map_dct.get(spc))
-            # If species not in map dct, don't remap
-            else:
-                re_spcs.append(spc)
-        re_spcs = tuple(re_spcs)
-
-        return re_spcs
-
-    # Fill the map dict if any names are missing
-    for name in mech_spc_dct:
-        if name not in map_dct:
-            map_dct[name] = name
-
-    # Alter the names of the dictionary
-    re_mech_spc_dct = {}
-    for name, dct in mech_spc_dct.items():
-        re_mech_spc_dct[map_dct[name]] = dct
+        self.names = []  # [name of each id]
+        self.id_dct = {}  # {name: id}
+        self.rxn_pos_dct = {}  # {rxn: (rxn id, start in ids, nrcts, nprds)}
+        self.ids = []  # flat list of the rct and prd ids of all rxns
+        self.starts = []  # start of each rxn in ids
+        self._arrs = None  # (names, ids, starts) as arrays
+        self.add_names(names)
+        self.add_rxns(rxns)
+
+    def intern(self, name):
+        """ Id of a name, adding the name to the index if needed
+
+            :param name: species name
+            :type name: str
+            :rtype: int
+        """
+        idx = self.id_dct.get(name)
+        if idx is None:
+            idx = len(self.names)
+            self.id_dct[name] = idx
+            self.names.append(name)
+        return idx
+
+    def add_names(self, names):
+        """ Adds the names not yet in the index
+
+            :param names: species names
+            :type names: iterable of str
+        """
+        for name in names:
+            self.intern(name)
 
-    # Alter the names of the reactions
-    re_rxn_param_dct = {}
-    for rxn, params in rxn_param_dct.items():
-        #        rcts, prds, thrd = rxn
-        #        re_rxn = (
-        #            tuple(map_dct[rct] for rct in rcts),
-        #            tuple(map_dct[prd] for prd in prds),
-        #            thrd
-        #        )
-        re_rxn = remap_single_rxn(rxn, map_dct)
-        re_rxn_param_dct[re_rxn] = params
+    def add_rxns(self, rxns):
+        """ Adds the rxns not yet in the index
 
-    return re_mech_spc_dct, re_rxn_param_dct
+            :param rxns: rxn keys
+            :type rxns: iterable of tuples (rcts, prds, third_bods)
+        """
+        id_dct, ids = self.id_dct, self.ids
+        for rxn in rxns:
+            if rxn not in self.rxn_pos_dct:
+                rcts, prds, _ = rxn
+                self.rxn_pos_dct[rxn] = (
+                    len(self.starts), len(ids), len(rcts), len(prds))
+                self.starts.append(len(ids))
+                for name in rcts + prds:
+                    idx = id_dct.get(name)
+                    if idx is None:
+                        idx = self.intern(name)
+                    ids.append(idx)
+
+    def renamed(self, map_dct):
+        """ New name of each id; names missing from map_dct (or mapped to
+            None) are kept
+
+            :param map_dct: new name of each species
+            :type map_dct: dict[str: str]
+            :rtype: numpy.ndarray of str
+        """
+        re_names = numpy.empty(len(self.names), dtype=object)
+        for idx, name in enumerate(self.names):
+            re_name = map_dct.get(name)
+            re_names[idx] = name if re_name is None else re_name
+        return re_names
+
+    def remap_spc_dct(self, spc_dct, re_name_arr):
+        """ Copy of a dct keyed by species names with the keys renamed
+
+            :param spc_dct: dct keyed by species names
+            :type spc_dct: dict[str: obj]
+            :param re_name_arr: new name of each id, from self.renamed
+            :type re_name_arr: numpy.ndarray of str
+            :rtype: dict[str: obj]
+        """
+        re_spc_dct = {}
+        for name, val in spc_dct.items():
+            re_spc_dct[re_name_arr[self.id_dct[name]]] = val
+        return re_spc_dct
+
+    def remap_rxn_dct(self, rxn_dct, re_name_arr):
+        """ Copy of a dct keyed by rxns with the species of the keys renamed
+
+            :param rxn_dct: dct keyed by rxns (e.g., a rxn_param_dct)
+            :type rxn_dct: dict[tuple: obj]
+            :param re_name_arr: new name of each id, from self.renamed
+            :type re_name_arr: numpy.ndarray of str
+            :rtype: dict[tuple: obj]
+        """
+        name_arr, id_arr, start_arr = self._arrays()
+
+        # Rename the species of all the rxns at once and flag the rxns with
+        # a renamed species; the keys of the other rxns are reused
+        re_names = list(re_name_arr[id_arr])
+        changed = numpy.asarray(re_name_arr != name_arr, dtype=int)
+        nchanged = numpy.concatenate(([0], numpy.cumsum(changed[id_arr])))
+        end_arr = numpy.append(start_arr[1:], len(id_arr))
+        rxn_changed = nchanged[end_arr] > nchanged[start_arr]
+
+        re_rxn_dct = {}
+        for rxn, val in rxn_dct.items():
+            rxn_idx, start, nrcts, nprds = self.rxn_pos_dct[rxn]
+            if rxn_changed[rxn_idx]:
+                mid, end = start + nrcts, start + nrcts + nprds
+                rxn = (tuple(re_names[start:mid]), tuple(re_names[mid:end]),
+                       rxn[2])
+            re_rxn_dct[rxn] = val
+        return re_rxn_dct
+
+    def _arrays(self):
+        """ Names, flat ids and rxn starts as arrays, rebuilt only after
+            names or rxns are added
+        """
+        if (self._arrs is None or len(self._arrs[0]) != len(self.names) or
+                len(self._arrs[2]) != len(self.starts)):
+            name_arr = numpy.empty(len(self.names), dtype=object)
+            name_arr[:] = self.names
+            self._arrs = (name_arr, numpy.array(self.ids, dtype=int),
+                          numpy.array(self.starts, dtype=int))
+        return self._arrs
 
 
 # FUNCTIONAL NAME MAPPING
@@ -258,7 +400,7 @@ def functional_group_name(ich, name='', rename_rule_dct=None):
         if name:
             re_name = name
         else:
-            re_name = automol.inchi.formula_string(ich)
+            re_name = ich_cache.formula_string(ich)
             if c_cnt > 1:
                 conn_lbl = _conn_string(ich)
                 re_name += f'-{conn_lbl}'
@@ -270,21 +412,33 @@ def functional_group_name(ich, name='', rename_rule_dct=None):
 
 
 # FORMULA NAME MAPPING
-def formula_name_dct(spc_dct):
+def formula_name_dct(spc_dct, spc_names=None):
     """ Build a name mapping dictionary that maps according to
         the stoichiometry of the species
+
+        Species are named by formula in the order of the spc_dct: the first
+        species with a formula gets the formula string and the next ones
+        get formula(2), formula(3), ... Names already used by the species
+        that are not renamed are skipped.
+
+        :param spc_dct: species dictionary
+        :type spc_dct: dict[str: dict]
+        :param spc_names: names of the species to rename; all by default
+        :type spc_names: tuple(str)
+        :return map_dct: new name for each renamed species
+        :rtype: dict[str: str]
     """
 
-    # Generate the bookkeeping dictionaries to assign names
-    fml_cnt_dct = formula_count_dct(spc_dct)
-    _ich_name_dct = ich_name_dct(spc_dct)
+    spc_names = set(spc_dct if spc_names is None else spc_names)
+    used_names = set(name for name in spc_dct if name not in spc_names)
 
-    # Generate unique name from stoichiometry if species not present
     map_dct = {}
+    fml_cnt_dct = {}
     for name, dct in spc_dct.items():
-        _ich = dct['ich']
-        if _ich not in _ich_name_dct:
-            re_name, fml_cnt_dct = formula_name(_ich, fml_cnt_dct, spc_dct)
+        if name in spc_names:
+            re_name, fml_cnt_dct = formula_name(
+                dct['inchi'], fml_cnt_dct, used_names)
+            used_names.add(re_name)
             map_dct[name] = re_name
 
     return map_dct
@@ -300,8 +454,8 @@ def formula_count_dct(spc_dct):
 
     fml_count_dct = {}
     for dct in spc_dct.values():
-        _, fml_count_dct = formula_name(
-            dct['inchi'], fml_count_dct, spc_dct)
+        fml_str = ich_cache.formula_string(dct['inchi'])
+        fml_count_dct[fml_str] = fml_count_dct.get(fml_str, 0) + 1
 
     return fml_count_dct
 
@@ -316,28 +470,23 @@ def formula_name(ich, fml_cnt_dct, spc_dct):
 
         Also, updates the overall formula dictionary
         which contains a count of how many times the
-        formula appears in some mechanism.
+        formula appears in some mechanism. Names in
+        spc_dct (any container of names) are skipped
+        and the count moves past them, so repeated
+        calls never test the same name twice.
     """
 
-    fml_str = automol.inchi.formula_string(ich)
+    fml_str = ich_cache.formula_string(ich)
 
-    if fml_str in fml_cnt_dct:
+    fml_cnt = fml_cnt_dct.get(fml_str, 0) + 1
+    name = fml_str if fml_cnt == 1 else fml_str + f'({fml_cnt})'
 
-        fml_cnt_dct[fml_str] += 1
-
-        fml_cnt = fml_cnt_dct[fml_str]
+    # If the number is in the dictionary, increase by one
+    # happen when you have A(5), A(6), A(9)...A(7) miss throws off count
+    while name in spc_dct:
+        fml_cnt += 1
         name = fml_str + f'({fml_cnt})'
-
-        name += f'({fml_cnt})'
-
-        # If the number is in the dictionary, increase by one
-        # happen when you have A(5), A(6), A(9)...A(7) miss throws off count
-        while name in spc_dct:
-            fml_cnt += 1
-            name = fml_str + f'({fml_cnt})'
-    else:
-        fml_cnt_dct[fml_str] = 1
-        name = fml_str
+    fml_cnt_dct[fml_str] = fml_cnt
 
     return name, fml_cnt_dct
 
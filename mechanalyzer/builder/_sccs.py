@@ -0,0 +1,206 @@
+""" Select the stereo-specific surfaces (S-CCSs) of a stereo-expanded
+    mechanism that give the smallest set of species
+
+    One S-CCS has to be chosen for each connected surface (CCS). Rather than
+    enumerating all combinations, a depth-first branch-and-bound search is
+    run over the species sets, stored as bit masks, starting from a greedy
+    selection. Mirror-image selections are skipped at the root of the search.
+"""
+
+import time
+
+
+def select_sccs_combo(ccs_sccs_spc_dct, max_nodes=None, max_time=None):
+    """ Find the combination of (CCS, S-CCS) pairs, one per CCS, with the
+        fewest unique species, which means it has the least number of
+        enantiomers.
+
+        The selection is the same as the first smallest combination of an
+        exhaustive enumeration. If the search is stopped by max_nodes or
+        max_time, the best selection found so far is returned.
+
+        Nothing is printed; the number of nodes visited and whether the
+        search was stopped are returned so that callers can report them.
+
+        :param ccs_sccs_spc_dct: InChIs of the species of each S-CCS
+        :type ccs_sccs_spc_dct: dict[int: dict[int: tuple(str)]]
+        :param max_nodes: max number of nodes of the search tree to visit
+        :type max_nodes: int
+        :param max_time: max time of the search (s)
+        :type max_time: float
+        :return best_combo: (CCS, S-CCS) pairs, CCSs with several S-CCSs first
+        :rtype: tuple((int, int))
+        :return best_combo_ichs: InChIs of the species of all pairs
+        :rtype: tuple(str)
+        :return nodes: number of nodes of the search tree visited
+        :rtype: int
+        :return stopped: whether max_nodes or max_time stopped the search
+        :rtype: bool
+    """
+
+    # Index the species and build a bit mask of each S-CCS
+    spc_idx_dct = {}
+    for sccs_dct in ccs_sccs_spc_dct.values():
+        for ichs in sccs_dct.values():
+            for ich in ichs:
+                spc_idx_dct.setdefault(ich, len(spc_idx_dct))
+
+    def _mask(ichs):
+        mask = 0
+        for ich in ichs:
+            mask |= 1 << spc_idx_dct[ich]
+        return mask
+
+    # CCSs with one S-CCS are always part of the combination
+    multi_ccss, single_idxs = [], ()
+    base_mask = 0
+    for ccs in sorted(ccs_sccs_spc_dct):
+        sccs_dct = ccs_sccs_spc_dct[ccs]
+        if len(sccs_dct) == 1:
+            sccs, ichs = next(iter(sccs_dct.items()))
+            single_idxs += ((ccs, sccs),)
+            base_mask |= _mask(ichs)
+        else:
+            sccss = sorted(sccs_dct)
+            multi_ccss.append(
+                (ccs, sccss, [_mask(sccs_dct[sccs]) for sccs in sccss]))
+
+    # Branch on the last CCS first, which gives the same order of the
+    # combinations as the exhaustive enumeration
+    multi_ccss.reverse()
+    nccs = len(multi_ccss)
+    opt_masks = [masks for _, _, masks in multi_ccss]
+    # species in every S-CCS of the CCSs from each depth on
+    rem_mand_masks = [0] * (nccs + 1)
+    for depth in range(nccs - 1, -1, -1):
+        mand_mask = opt_masks[depth][0]
+        for mask in opt_masks[depth][1:]:
+            mand_mask &= mask
+        rem_mand_masks[depth] = rem_mand_masks[depth + 1] | mand_mask
+
+    # Greedy selection as the first upper bound
+    greedy_sel, union = [], base_mask
+    for masks in opt_masks:
+        new_counts = [_count(mask & ~union) for mask in masks]
+        opt = new_counts.index(min(new_counts))
+        greedy_sel.append(opt)
+        union |= masks[opt]
+    # a tie with the greedy selection is still taken if found first
+    best = {'count': _count(union) + 1, 'sel': greedy_sel}
+
+    root_opts = _root_options(
+        multi_ccss, ccs_sccs_spc_dct, spc_idx_dct, base_mask)
+
+    nodes = 0
+    stopped = False
+    start = time.time()
+
+    def _lower_bound(depth, union):
+        """ Count of the union plus the fewest new species of the most
+            demanding remaining CCS
+        """
+        union |= rem_mand_masks[depth]
+        max_new = 0
+        for masks in opt_masks[depth:]:
+            min_new = min(_count(mask & ~union) for mask in masks)
+            max_new = max(max_new, min_new)
+        return _count(union) + max_new
+
+    def _search(depth, union, sel):
+        nonlocal nodes, stopped
+        nodes += 1
+        if ((max_nodes is not None and nodes > max_nodes) or
+                (max_time is not None and nodes % 1000 == 0 and
+                 time.time() - start > max_time)):
+            stopped = True
+        if stopped:
+            return
+        if depth == nccs:
+            count = _count(union)
+            if count < best['count']:
+                best['count'], best['sel'] = count, list(sel)
+            return
+        if _lower_bound(depth, union) >= best['count']:
+            return
+        opts = root_opts if depth == 0 else range(len(opt_masks[depth]))
+        for opt in opts:
+            sel.append(opt)
+            _search(depth + 1, union | opt_masks[depth][opt], sel)
+            sel.pop()
+
+    _search(0, base_mask, [])
+
+    best_combo = tuple(
+        (ccs, sccss[opt])
+        for (ccs, sccss, _), opt in reversed(list(zip(multi_ccss,
+                                                      best['sel']))))
+    best_combo += single_idxs
+    best_combo_ichs = ()
+    for ccs, sccs in best_combo:
+        best_combo_ichs += tuple(ccs_sccs_spc_dct[ccs][sccs])
+
+    return best_combo, best_combo_ichs, nodes, stopped
+
+
+def _count(mask):
+    """ Number of species in a bit mask
+    """
+    return bin(mask).count('1')
+
+
+def _root_options(multi_ccss, ccs_sccs_spc_dct, spc_idx_dct, base_mask):
+    """ S-CCSs to try for the first CCS of the search. If the mirror image
+        of every S-CCS is also an S-CCS of the same CCS, and the fixed CCSs
+        are their own mirror images, each mirror-image combination has the
+        same species count: only the first S-CCS of each mirror pair is kept
+    """
+
+    if not multi_ccss:
+        return ()
+
+    def _mirror_mask(ichs):
+        mask = 0
+        for ich in ichs:
+            mirror_ich = mirror_inchi(ich)
+            if mirror_ich not in spc_idx_dct:
+                return None
+            mask |= 1 << spc_idx_dct[mirror_ich]
+        return mask
+
+    # all the species of the fixed CCSs must be mirrored in that set
+    base_ichs = [ich for ich, idx in spc_idx_dct.items()
+                 if base_mask >> idx & 1]
+    all_opts = range(len(multi_ccss[0][2]))
+    if _mirror_mask(base_ichs) != base_mask:
+        return all_opts
+
+    root_opts = all_opts
+    for depth, (ccs, sccss, masks) in enumerate(multi_ccss):
+        mirror_opts = []
+        for sccs in sccss:
+            mirror_mask = _mirror_mask(ccs_sccs_spc_dct[ccs][sccs])
+            if mirror_mask not in masks:
+                return all_opts
+            mirror_opts.append(masks.index(mirror_mask))
+        if depth == 0:
+            root_opts = tuple(opt for opt in all_opts
+                              if opt <= mirror_opts[opt])
+
+    return root_opts
+
+
+def mirror_inchi(ich):
+    """ InChI of the mirror image of a species, swapping the /m0 and /m1
+        layers; species without an /m layer are their own mirror image
+
+        :param ich: InChI string
+        :type ich: str
+        :rtype: str
+    """
+
+    layers = ich.split('/')
+    for idx, layer in enumerate(layers):
+        if layer in ('m0', 'm1'):
+            layers[idx] = 'm1' if layer == 'm0' else 'm0'
+
+    return '/'.join(layers)
@@ -1,12 +1,12 @@
 """ Check mechanisms for various flaws/inconsistencies
 """
 
-from collections import Counter as counter
+import pandas as pd
 from chemkin_io.writer._util import format_rxn_name
 
 
 def run_all_checks(rxn_param_dct, rxn_ktp_dct, k_thresholds,
-                   rxn_num_threshold):
+                   rxn_num_threshold, spc_idx_dct=None):
     """ Run all mechanism checks and output a string describing the results.
         Optionally write a text file with the string.
 
@@ -21,6 +21,8 @@ def run_all_checks(rxn_param_dct, rxn_ktp_dct, k_thresholds,
         :param rxn_num_threshold: # of reactions at and below
             which a species is considered "lone"
         :type rxn_num_threshold: int
+        :param spc_idx_dct: species index of the mechanism; built if not given
+        :type spc_idx_dct: dct {spc1: idx_dct1, spc2: ...}
         :return total_str: description of all the checks performed
         :rtype: str
     """
@@ -30,42 +32,138 @@ def run_all_checks(rxn_param_dct, rxn_ktp_dct, k_thresholds,
         """
         return '\n' + '+' * 100 + '\n'
 
-    total_str = separator()
+    check_dct = get_all_checks(rxn_param_dct, rxn_ktp_dct, k_thresholds,
+                               rxn_num_threshold, spc_idx_dct=spc_idx_dct)
 
-    # Large rate constants
-    large_rxn_ktp_dcts = get_large_kts(rxn_ktp_dct, k_thresholds)
-    total_str += write_large_kts(large_rxn_ktp_dcts, k_thresholds)
+    total_str = separator()
+    total_str += write_large_kts(check_dct['large_kts'], k_thresholds)
     total_str += separator()
-
-    # Negative rate constants
-    negative_rxn_ktp_dct = get_negative_kts(rxn_ktp_dct)
-    total_str += write_negative_kts(negative_rxn_ktp_dct)
+    total_str += write_negative_kts(check_dct['negative_kts'])
     total_str += separator()
-
-    # Duplicate (more than 2) reactions
-    duplicate_rxns = get_duplicates(rxn_param_dct)
-    total_str += write_duplicates(duplicate_rxns)
+    total_str += write_duplicates(check_dct['duplicates'])
     total_str += separator()
-
-    # Mismatching rate expressions
-    mismatched_rxns = get_mismatches(rxn_param_dct)
-    total_str += write_mismatches(mismatched_rxns)
+    total_str += write_mismatches(check_dct['mismatches'])
     total_str += separator()
-
-    # Lone species
-    lone_spcs = get_lone_spcs(rxn_param_dct, rxn_num_threshold)
-    total_str += write_lone_spcs(lone_spcs, rxn_num_threshold)
+    total_str += write_lone_spcs(check_dct['lone_spcs'], rxn_num_threshold)
     total_str += separator()
-
-    # Sources and sinks
-    source_spcs, sink_spcs = get_sources_and_sinks(rxn_param_dct)
-    total_str += write_sources_and_sinks(source_spcs, sink_spcs)
+    total_str += write_sources_and_sinks(check_dct['sources'],
+                                         check_dct['sinks'])
     total_str += separator()
 
     return total_str
 
 
-def get_sources_and_sinks(rxn_param_dct):
+def get_all_checks(rxn_param_dct, rxn_ktp_dct, k_thresholds,
+                   rxn_num_threshold, spc_idx_dct=None):
+    """ Run all mechanism checks and return their results. The species index
+        is built once and shared by all species-based checks.
+
+        :param rxn_param_dct: rate constant parameters for a mechanism
+        :type rxn_param_dct: dct
+            {rxn1: (param_tuple1, param_tuple2, ...), rxn2: ...}
+        :param rxn_ktp_dct: rate constant values for a mechanism
+        :type rxn_ktp_dct: dct {rxn1: ktp_dct1, rxn2: ...}
+        :param k_thresholds: rate constant thresholds
+            for uni-, bi-, and ter-molecular reactions
+        :type k_thresholds: list [float, float, float]
+        :param rxn_num_threshold: # of reactions at and below
+            which a species is considered "lone"
+        :type rxn_num_threshold: int
+        :param spc_idx_dct: species index of the mechanism; built if not given
+        :type spc_idx_dct: dct {spc1: idx_dct1, spc2: ...}
+        :return check_dct: results of each check, keyed by 'large_kts',
+            'negative_kts', 'duplicates', 'mismatches', 'lone_spcs',
+            'sources', 'sinks', and 'spc_idx_dct'; the values are those
+            returned by the corresponding get_* function
+        :rtype: dct
+    """
+
+    if spc_idx_dct is None:
+        spc_idx_dct = build_spc_idx_dct(rxn_param_dct)
+
+    source_spcs, sink_spcs = get_sources_and_sinks(
+        rxn_param_dct, spc_idx_dct=spc_idx_dct)
+    check_dct = {
+        'large_kts': get_large_kts(rxn_ktp_dct, k_thresholds),
+        'negative_kts': get_negative_kts(rxn_ktp_dct),
+        'duplicates': get_duplicates(rxn_param_dct),
+        'mismatches': get_mismatches(rxn_param_dct),
+        'lone_spcs': get_lone_spcs(rxn_param_dct, rxn_num_threshold,
+                                   spc_idx_dct=spc_idx_dct),
+        'sources': source_spcs,
+        'sinks': sink_spcs,
+        'spc_idx_dct': spc_idx_dct}
+
+    return check_dct
+
+
+def build_spc_idx_dct(rxn_param_dct):
+    """ Index, in a single pass over the reactions, where each species of a
+        mechanism appears as a reactant, as a product, and as a third body
+
+        Reactions are listed in mechanism order and only once per list, even
+        if a species appears in them more than once. The count is the number
+        of times a species appears as a reactant or product, counting
+        repeats (e.g., OH+OH counts twice). Species are ordered by their
+        first appearance in the mechanism.
+
+        :param rxn_param_dct: rate constant parameters for a mechanism
+        :type rxn_param_dct: dct
+            {rxn1: (param_tuple1, param_tuple2, ...), rxn2: ...}
+        :return spc_idx_dct: for each species, the reactions in which it is a
+            reactant ('rcts'), a product ('prds'), either of these ('rxns'),
+            or a third body ('thrd_bods'), and its number of appearances as a
+            reactant or product ('count')
+        :rtype: dct {spc1: idx_dct1, spc2: ...}
+    """
+
+    def _add(spc, key, rxn):
+        """ Add a rxn to the list of a species unless it was just added
+        """
+        if spc not in spc_idx_dct:
+            spc_idx_dct[spc] = {'rcts': [], 'prds': [], 'rxns': [],
+                                'thrd_bods': [], 'count': 0}
+        rxns = spc_idx_dct[spc][key]
+        if not rxns or rxns[-1] is not rxn:
+            rxns.append(rxn)
+
+    spc_idx_dct = {}
+    for rxn in rxn_param_dct.keys():
+        rcts, prds, thrd_bods = rxn
+        for key, spcs in (('rcts', rcts), ('prds', prds)):
+            for spc in spcs:
+                _add(spc, key, rxn)
+                _add(spc, 'rxns', rxn)
+                spc_idx_dct[spc]['count'] += 1
+        for thrd_bod in thrd_bods:
+            if thrd_bod:  # if it's not None, try to read it
+                stripped_thrd_bod = _strip_thrd_bod(thrd_bod, rxn)
+                if stripped_thrd_bod:  # will be None for '+M' or '(+M)'
+                    _add(stripped_thrd_bod, 'thrd_bods', rxn)
+
+    return spc_idx_dct
+
+
+def spc_idx_df(spc_idx_dct):
+    """ Tabulate the number of reactions of each species in a species index
+
+        :param spc_idx_dct: species index of a mechanism
+        :type spc_idx_dct: dct {spc1: idx_dct1, spc2: ...}
+        :return idx_df: number of reactions in which each species is a
+            reactant, a product, either of these, or a third body, and its
+            number of appearances as a reactant or product
+        :rtype: pandas.DataFrame indexed by species
+    """
+
+    columns = ('rcts', 'prds', 'rxns', 'thrd_bods')
+    data = [[len(idx_dct[col]) for col in columns] + [idx_dct['count']]
+            for idx_dct in spc_idx_dct.values()]
+
+    return pd.DataFrame(data, index=list(spc_idx_dct.keys()),
+                        columns=list(columns) + ['count'])
+
+
+def get_sources_and_sinks(rxn_param_dct, spc_idx_dct=None):
     """ Get species that only appear as reactants (sources) or
         only appear as products (sinks). Output sources and sinks and
         the reaction keys for all reactions in which each species
@@ -74,6 +172,8 @@ def get_sources_and_sinks(rxn_param_dct):
         :param rxn_param_dct: rate constant parameters for a mechanism
         :type rxn_param_dct: dct
             {rxn1: (param_tuple1, param_tuple2, ...), rxn2: ...}
+        :param spc_idx_dct: species index of the mechanism; built if not given
+        :type spc_idx_dct: dct {spc1: idx_dct1, spc2: ...}
         :return source_species: species that only appear
             as reactants and associated reactions
         :rtype: dct {spc1: [rxn1, rxn2, ...], spc2: ...}
@@ -82,23 +182,18 @@ def get_sources_and_sinks(rxn_param_dct):
         :rtype: dct {spc1: [rxn1, rxn2, ...], spc2: ...}
     """
 
-    # Get lists of source and sink species
+    if spc_idx_dct is None:
+        spc_idx_dct = build_spc_idx_dct(rxn_param_dct)
+
     # Sorted to make the writer test succeed
-    all_rcts, all_prds = _get_rcts_prds(rxn_param_dct)
-    sources = sorted(list(set(all_rcts) - set(all_prds)))
-    sinks = sorted(list(set(all_prds) - set(all_rcts)))
-
-    # Store the reaction name(s) for each source or sink species
-    source_spcs = {spc: [] for spc in sources}
-    sink_spcs = {spc: [] for spc in sinks}
-    for spc in sources:
-        for rxn in rxn_param_dct.keys():
-            if spc in rxn[0]:
-                source_spcs[spc].append(rxn)
-    for spc in sinks:
-        for rxn in rxn_param_dct.keys():
-            if spc in rxn[1]:
-                sink_spcs[spc].append(rxn)
+    source_spcs = {}
+    sink_spcs = {}
+    for spc in sorted(spc_idx_dct.keys()):
+        idx_dct = spc_idx_dct[spc]
+        if idx_dct['rcts'] and not idx_dct['prds']:
+            source_spcs[spc] = list(idx_dct['rcts'])
+        elif idx_dct['prds'] and not idx_dct['rcts']:
+            sink_spcs[spc] = list(idx_dct['prds'])
 
     return source_spcs, sink_spcs
 
@@ -172,7 +267,7 @@ def get_negative_kts(rxn_ktp_dct):
     return negative_rxn_ktp_dct
 
 
-def get_lone_spcs(rxn_param_dct, threshold):
+def get_lone_spcs(rxn_param_dct, threshold, spc_idx_dct=None):
     """ Get species that are considered "lone" species based on only
         being included in a small number of reactions
         (the cutoff for which is set by threshold).
@@ -186,27 +281,23 @@ def get_lone_spcs(rxn_param_dct, threshold):
         :param threshold: number of reactions at and below which
             a species is considered "lone"
         :type threshold: int
+        :param spc_idx_dct: species index of the mechanism; built if not given
+        :type spc_idx_dct: dct {spc1: idx_dct1, spc2: ...}
         :return lone_spcs: dictionary containing
             each lone species and its reactions
         :rtype: dct {lone_spc1: [rxn1, rxn2, ...], lone_spc2: ...}
 
     """
 
-    # Get the number of reactions that each species participates in
-    all_rcts, all_prds = _get_rcts_prds(rxn_param_dct)
-    spc_counts = dict(counter(all_rcts + all_prds))
+    if spc_idx_dct is None:
+        spc_idx_dct = build_spc_idx_dct(rxn_param_dct)
 
-    # Filter by the threshold
+    # Filter by the number of times each species is a reactant or product;
+    # species that are only third bodies have a count of zero and are skipped
     lone_spcs = {}
-    for spc, count in spc_counts.items():
-        if count <= threshold:
-            lone_spcs[spc] = []
-
-    # Store the reaction name(s) for each lone species
-    for spc, dct in lone_spcs.items():
-        for rxn in rxn_param_dct.keys():
-            if spc in rxn[0] or spc in rxn[1]:  # whether spc in prds or rcts
-                dct.append(rxn)
+    for spc, idx_dct in spc_idx_dct.items():
+        if 0 < idx_dct['count'] <= threshold:
+            lone_spcs[spc] = list(idx_dct['rxns'])
 
     return lone_spcs
 
@@ -223,7 +314,6 @@ def get_duplicates(rxn_param_dct):
 
     duplicate_rxns = {}
     for rxn, params in rxn_param_dct.items():
-        
         if len(params) > 2:
             duplicate_rxns[rxn] = len(params)
 
@@ -293,7 +383,7 @@ def get_mismatches(rxn_param_dct):
     return mismatched_rxns
 
 
-def get_missing_spcs(rxn_param_dct, spc_dct):
+def get_missing_spcs(rxn_param_dct, spc_dct, spc_idx_dct=None):
     """ Compares a rxn_param_dct and a spc_dct to find missing species
 
         :param rxn_param_dct: rate constant parameters for a mechanism
@@ -301,43 +391,18 @@ def get_missing_spcs(rxn_param_dct, spc_dct):
             {rxn1: (param_tuple1, param_tuple2, ...), rxn2: ...}
         :param spc_dct: info on species
         :type spc_dct: dct {spc1: info_dct1, spc2: ...}
+        :param spc_idx_dct: species index of the mechanism; built if not given
+        :type spc_idx_dct: dct {spc1: idx_dct1, spc2: ...}
         :return missing_from_csv: list of species missing from the spc_csv
         :rtype: list [spc1, spc2, ...]
         :return missing_from_mech: list of species missing from the mechanism
         :rtype: list [spc1, spc2, ...]
     """
 
-    def strip_thrd_bod(thrd_bod, rxn):
-        """ Strip the third body notation from a species name
-        """
-
-        if thrd_bod in ('(+M)', '+M'):
-            stripped_thrd_bod = None
-        elif thrd_bod[0] == '(':
-            stripped_thrd_bod = thrd_bod[2:-1]
-        elif thrd_bod[0] == '+':
-            stripped_thrd_bod = thrd_bod[1:]
-        else:
-            stripped_thrd_bod = None
-            print(f'The third body could not be read for the reaction {rxn}')
-
-        return stripped_thrd_bod
-
-    # Get the mechanism species
-    mech_spcs = []
-    for rxn in rxn_param_dct.keys():
-        rcts, prds, thrd_bods = rxn
-        for spc in rcts:
-            mech_spcs.append(spc)
-        for spc in prds:
-            mech_spcs.append(spc)
-        for thrd_bod in thrd_bods:
-            if thrd_bod:  # if it's not None, try to read it
-                stripped_thrd_bod = strip_thrd_bod(thrd_bod, rxn)
-                if stripped_thrd_bod:  # will be None for '+M' or '(+M)'
-                    mech_spcs.append(stripped_thrd_bod)
-
-    mech_spcs = set(mech_spcs)
+    # Get the mechanism species, including species given as third bodies
+    if spc_idx_dct is None:
+        spc_idx_dct = build_spc_idx_dct(rxn_param_dct)
+    mech_spcs = set(spc_idx_dct.keys())
 
     # Get the spc_dct spcs
     csv_spcs = set(spc_dct.keys())
@@ -618,27 +683,21 @@ def _write_rxn_ktp_dct(rxn_ktp_dct):
     return output_str
 
 
-def _get_rcts_prds(rxn_param_dct):
-    """ Gets lists of all reactants and products in a mechanism
-        (both lists may contain duplicates)
-
-    :param rxn_param_dct: rate constant parameters for a mechanism
-    :return all_rcts: all reactants in the mechanism
-    :rtype: list [rct1, rct2, ...]
-    :return all_prds: all products in the mechanism
-    :rtype: list [prd1, prd2, ...]
+def _strip_thrd_bod(thrd_bod, rxn):
+    """ Strip the third body notation from a species name
     """
 
-    all_rcts = []
-    all_prds = []
-    for rxn in rxn_param_dct.keys():
-        rcts, prds, _ = rxn
-        for rct in rcts:
-            all_rcts.append(rct)
-        for prd in prds:
-            all_prds.append(prd)
+    if thrd_bod in ('(+M)', '+M'):
+        stripped_thrd_bod = None
+    elif thrd_bod[0] == '(':
+        stripped_thrd_bod = thrd_bod[2:-1]
+    elif thrd_bod[0] == '+':
+        stripped_thrd_bod = thrd_bod[1:]
+    else:
+        stripped_thrd_bod = None
+        print(f'The third body could not be read for the reaction {rxn}')
 
-    return all_rcts, all_prds
+    return stripped_thrd_bod
 
 
 def get_molecularity(rxn):
@@ -41,7 +41,8 @@ class SortMech:
 
         # Extract data from mech info
         [formula_dct_lst, formulas, rct_names_lst,
-            prd_names_lst, thrdbdy_lst, rxn_name_lst, param_vals] = mech_info(rxn_param_dct, spc_dct)
+            prd_names_lst, thrdbdy_lst, rxn_name_lst, param_vals] = mech_info(
+                rxn_param_dct, spc_dct)
 
         rxn_index = list(zip(rxn_name_lst, thrdbdy_lst))
 
@@ -52,35 +53,32 @@ class SortMech:
             dtype=int)
         molecularity = numpy.array(
             list(map(len, rct_names_lst)), dtype=int) + isthrdbdy
-        n_of_prods = list(map(len, prd_names_lst))
+        n_of_prods = numpy.array(list(map(len, prd_names_lst)), dtype=int)
         rct_names_lst_ordered = order_rct_bystoich(
             rct_names_lst, spc_dct=spc_dct)  # put heavier reactant first
         prd_names_lst_ordered = order_rct_bystoich(
             prd_names_lst, spc_dct=spc_dct)  # put heavier product first
         rct_1, rct_2 = extract_spc(rct_names_lst_ordered)
-        data = numpy.array(
-            [rct_names_lst, prd_names_lst,
-             rct_names_lst_ordered, prd_names_lst_ordered,
-             rct_1, rct_2, molecularity, n_of_prods, pes_lst, formulas,
-             isthrdbdy, thrdbdy_lst, param_vals, rxn_name_lst],
-            dtype=object).T
+        # each column is set at once from the lists above
         self.mech_df = pd.DataFrame(
-            data, index=rxn_index,
-            columns=['rct_names_lst', 'prd_names_lst', 'rct_names_lst_ord',
-                     'prd_names_lst_ord', 'r1', 'r2', 'molecularity',
-                     'N_of_prods', 'pes_fml', 'formulas', 'isthrdbdy',
-                     'thrdbdy', 'param_vals', 'rxn_names'])
-
-        # reindex pes
-        df_pes = pd.DataFrame(
-            index=self.mech_df.index, columns=['pes'])
-        pes_index = 1
-        for _, pes_fml in self.mech_df.groupby('pes_fml'):
-            rxns = pes_fml.index
-            df_pes['pes'][rxns] = pes_index
-            pes_index += 1
-        # Concatenate the new portion of dataframe
-        self.mech_df = pd.concat([self.mech_df, df_pes], axis=1)
+            {'rct_names_lst': rct_names_lst,
+             'prd_names_lst': prd_names_lst,
+             'rct_names_lst_ord': rct_names_lst_ordered,
+             'prd_names_lst_ord': prd_names_lst_ordered,
+             'r1': rct_1, 'r2': rct_2,
+             'molecularity': molecularity,
+             'N_of_prods': n_of_prods,
+             'pes_fml': pes_lst,
+             'formulas': formulas,
+             'isthrdbdy': isthrdbdy,
+             'thrdbdy': thrdbdy_lst,
+             'param_vals': param_vals,
+             'rxn_names': rxn_name_lst},
+            index=pd.Index(rxn_index, tupleize_cols=False))
+
+        # index pes by ascending formula number
+        self.mech_df['pes'] = self.mech_df.groupby(
+            'pes_fml', sort=True).ngroup().values + 1
 
         self.spc_dct = spc_dct  # set for later use
         # empty list for initialization (otherwise pylint warning)
@@ -234,8 +232,6 @@ class SortMech:
             self.mech_df = pd.concat(
                 [self.mech_df, self.chnl('')], axis=1)  # add subpes
             self.mech_df['prompt'] = ''
-        # deepcopy
-        mech_df = copy.deepcopy(self.mech_df)
         # check that all species selected are in the species dictionary
         if any(i not in self.spc_dct.keys() for i in species_list):
             print('Error in ISOLATE_SPECIES: ',
@@ -244,68 +240,51 @@ class SortMech:
 
         # For all reactions in dataframe: check if species in selected list.
         # Otherwise remove the reaction
-        spc_list = []
-
-        for rxn in mech_df.index:
-            rcts = list(mech_df['rct_names_lst'][rxn])
-            prds = list(mech_df['prd_names_lst'][rxn])
-            # Check if one species in the list is among reactants or products
-            # of the reaction considered
-            if filtertype in ['submech', 'submech_prompt']:
-                _rchk = any(
-                    rct == _spc for _spc in species_list for rct in rcts)
-                _pchk = any(
-                    prd == _spc for _spc in species_list for prd in prds)
-                chk = int(_rchk or _pchk)
-
-            elif filtertype == 'submech_ext':
-                # filter out bimol/bimol reactions if some bimol rcts/prds are not in the species list
-                # equivalent to saying: at least all reactants (also single react works) or all products
-                # must be in the species list
-                chk = 0
-                chk += int(all(any(rct == _spc for _spc in species_list)
-                               for rct in rcts))
-                chk += int(all(any(prd == _spc for _spc in species_list)
-                               for prd in prds))*int(len(prds) <= 2)
-
-            if filtertype == 'submech_prompt' and chk >= 1:
-                # subpes list to keep
-                # rxn is bimol on both sides
-                if len(rcts) == 2 and len(prds) == 2:
-                    mech_df['prompt'][rxn] = 'RAD_GEN'
-                elif len(prds) > 2 and any(pr in species_list for pr in prds):
-                    mech_df['prompt'][rxn] = 'PROMPT_LUMPED'
-                # rxn is unimol deco/formation of the radical
-                elif ((len(rcts) == 1 and rcts[0] in species_list and len(prds) == 2) or
-                      (len(prds) == 1 and prds[0] in species_list and len(rcts) == 2)):
-                    mech_df['prompt'][rxn] = 'RAD_DECO'
-
-                continue  # next for loop
-
-            if chk >= 1:  # keep reaction and add to species list
-                spc_list.extend(rcts)
-                spc_list.extend(prds)
-            elif chk == 0:  # reaction filtered out
-                mech_df = mech_df.drop(index=[rxn])
-
+        species_set = set(species_list)
+        rcts_lst = self.mech_df['rct_names_lst'].values
+        prds_lst = self.mech_df['prd_names_lst'].values
+        keep = numpy.ones(len(self.mech_df), dtype=bool)
+        if filtertype in ['submech', 'submech_prompt']:
+            # one species in the list is among reactants or products
+            keep = numpy.array(
+                [not species_set.isdisjoint(rcts + prds)
+                 for rcts, prds in zip(rcts_lst, prds_lst)], dtype=bool)
+        elif filtertype == 'submech_ext':
+            # filter out bimol/bimol reactions if some bimol rcts/prds are not in the species list
+            # equivalent to saying: at least all reactants (also single react works) or all products
+            # must be in the species list
+            keep = numpy.array(
+                [species_set.issuperset(rcts) or
+                 (species_set.issuperset(prds) and len(prds) <= 2)
+                 for rcts, prds in zip(rcts_lst, prds_lst)], dtype=bool)
+        mech_df = self.mech_df[keep].copy()
+
+        spc_set = set()
         if filtertype == 'submech_prompt':
+            # label the reactions producing/consuming the radicals
+            mech_df['prompt'] = [
+                _prompt_label(rcts, prds, species_set)
+                for rcts, prds in zip(mech_df['rct_names_lst'].values,
+                                      mech_df['prd_names_lst'].values)]
             # submech_prompt: if RAD_GEN/RAD_DECO in list, keep the rxns
-            for _, subpes_df in mech_df.groupby(['pes', 'subpes']):
-                if any(pr in ['RAD_GEN', 'RAD_DECO', 'PROMPT_LUMPED'] for pr in subpes_df['prompt'].values):
-                    [spc_list.extend(list(rcts_tup))
-                     for rcts_tup in mech_df['rct_names_lst'].values]
-                    [spc_list.extend(list(prds_tup))
-                     for prds_tup in mech_df['prd_names_lst'].values]
-                else:
-                    # drop the corrisponding pes/subpes
-                    mech_df = mech_df.drop(index=subpes_df.index)
+            # of the subpes; otherwise drop the corresponding pes/subpes
+            is_prompt = mech_df['prompt'].isin(
+                ['RAD_GEN', 'RAD_DECO', 'PROMPT_LUMPED']).values
+            keep = numpy.ones(len(mech_df), dtype=bool)
+            grp_idxs = mech_df.groupby(['pes', 'subpes']).indices
+            for _, idxs in sorted(grp_idxs.items()):
+                if not is_prompt[idxs].any():
+                    keep[idxs] = False
+                elif not spc_set:
+                    # species of all reactions still in the mechanism when
+                    # the first subpes with prompt channels is found
+                    spc_set = _names_in_rxns(mech_df[keep])
+            mech_df = mech_df[keep]
+        else:
+            spc_set = _names_in_rxns(mech_df)
 
-        # filter spc_list: unique elements
-        spc_list = list(set(spc_list))
         # new spc_dct
-        spc_dct_val = list(map(self.spc_dct.get, spc_list))
-        spc_dct = dict(zip(spc_list, spc_dct_val))
-        # print('line 298 in sort_fct', mech_df)
+        spc_dct = {spc: self.spc_dct.get(spc) for spc in spc_set}
         return mech_df, spc_dct
 
     def conn_chn(self, conn_chn_df):
@@ -319,12 +298,7 @@ class SortMech:
         :rtype: dataframe[int][tuple]
         """
 
-        pes_dct_df = pd.DataFrame(
-            index=self.mech_df.index,
-            columns=['chnl', 'pes_chnl_tuple'],
-            # columns=['pes_dct', 'pes_chnl_tuple', 'pes_chnl'],
-            dtype=object)
-
+        subpes_dct, chnl_dct, chnl_tuple_dct = {}, {}, {}
         for _, peslist in self.mech_df.groupby('pes'):
             idx_start = 0
             # Set the names lists for the rxns and species needed below
@@ -335,28 +309,27 @@ class SortMech:
             connchnls = pes.find_conn_chnls(
                 pes_rct_names_lst, pes_prd_names_lst, pes_rxn_name_lst)
 
-            # Write subpes in conn_chn_df
+            # Assign the subpes and the channel indices
             for key, value in connchnls.items():
-                rxns = peslist.iloc[value].sort_values(
-                    by=['rxn_names'], ascending=False).index
-                conn_chn_df['subpes'][rxns] = key+1
                 # reorder by rxn name before assigning the channel index
-
-                for chnl_idx, rxn in enumerate(rxns):
-                    rxn_name = tuple(
-                        (peslist['rct_names_lst'][rxn],
-                         peslist['prd_names_lst'][rxn]))
-                    pes_dct_df['chnl'][rxn] = chnl_idx+idx_start+1
-                    # pes_dct_df['pes_dct'][rxn] = (fml_str, pes_index, key)
-                    pes_dct_df['pes_chnl_tuple'][rxn] = (
-                        chnl_idx+idx_start, rxn_name)
-                    # pes_dct_df['pes_chnl'][rxn] = ','.join(
-                    #    [str(pes_index+1), str(key+1),
-                    #     str(chnl_idx+idx_start+1)])
-
-                idx_start += len(rxns)
-
-        conn_chn_df = pd.concat([conn_chn_df, pes_dct_df], axis=1)
+                chnl_df = peslist.iloc[value].sort_values(
+                    by=['rxn_names'], ascending=False)
+                chnl_rxns = zip(chnl_df.index,
+                                chnl_df['rct_names_lst'].values,
+                                chnl_df['prd_names_lst'].values)
+                for chnl_idx, (rxn, rcts, prds) in enumerate(chnl_rxns):
+                    subpes_dct[rxn] = key+1
+                    chnl_dct[rxn] = chnl_idx+idx_start+1
+                    chnl_tuple_dct[rxn] = (chnl_idx+idx_start, (rcts, prds))
+
+                idx_start += len(chnl_df)
+
+        rxns = conn_chn_df.index
+        conn_chn_df = pd.DataFrame(
+            {'subpes': [subpes_dct.get(rxn) for rxn in rxns],
+             'chnl': [chnl_dct.get(rxn) for rxn in rxns],
+             'pes_chnl_tuple': [chnl_tuple_dct.get(rxn) for rxn in rxns]},
+            index=rxns)
 
         return conn_chn_df
 
@@ -388,15 +361,14 @@ class SortMech:
 
         # if species list is not found: do nothing, species entry remain empty
         if len(self.species_list) > 0:
-            for rxn in reac_sp_df.index:
-                rcts = list(self.mech_df['rct_names_lst'][rxn])
-                prds = list(self.mech_df['prd_names_lst'][rxn])
-                # check species hierarchically
-                for sp_i in self.species_list:
-                    if ((any(sp_i == rct for rct in rcts) or
-                         any(sp_i == prd for prd in prds))
-                            and isinstance(reac_sp_df['species'][rxn], float)):
-                        reac_sp_df['species'][rxn] = sp_i
+            # check species hierarchically
+            first_spc_lst = _first_in_hierarchy(
+                self.mech_df['rct_names_lst'].values,
+                self.mech_df['prd_names_lst'].values,
+                self.species_list)
+            reac_sp_df['species'] = [
+                sp_i if sp_i is not None else numpy.nan
+                for sp_i in first_spc_lst]
         return reac_sp_df
 
     def group_submech(self, submech_df):
@@ -416,16 +388,14 @@ class SortMech:
         # lbl as submech_df columns -> so it works with both submech and submech_ext
         lbl_col = submech_df.columns[0]
 
-        for rxn in submech_df.index:
-            rcts = list(self.mech_df['rct_names_lst'][rxn])
-            prds = list(self.mech_df['prd_names_lst'][rxn])
-            # check species hierarchically (hierarchy fixed in species list)
-            for sp_i in self.species_list:
-                _rchk = any(sp_i == rct for rct in rcts)
-                _pchk = any(sp_i == prd for prd in prds)
-                _isfloat = isinstance(submech_df[lbl_col][rxn], float)
-                if (_rchk or _pchk) and _isfloat:
-                    submech_df[lbl_col][rxn] = self.species_subset_df[sp_i]
+        # check species hierarchically (hierarchy fixed in species list)
+        first_spc_lst = _first_in_hierarchy(
+            self.mech_df['rct_names_lst'].values,
+            self.mech_df['prd_names_lst'].values,
+            self.species_list)
+        submech_df[lbl_col] = [
+            self.species_subset_df[sp_i] if sp_i is not None else numpy.nan
+            for sp_i in first_spc_lst]
 
         return submech_df
 
@@ -440,25 +410,26 @@ class SortMech:
         # 2. if PES is rad_deco: renames as rad_deco_radname
         # 3. if PES produces hot radical: adds it to a group ['grp N']
         #       then specifies the name in ['groupname'] nb add to same list if same subpes
-        submech_df['submech_prompt'] = 'unclassified'
+        prompt_lbl_dct = {}  # labels other than 'unclassified'
         grps = []
         species_deco_dct = dict.fromkeys(self.species_list)
         # filter by RAD_DECO: save the pes/subpes value
         hot_df = self.mech_df[self.mech_df['prompt'] == 'RAD_DECO']
-        for rxn in hot_df.index:
+        hot_rxns = zip(hot_df.index, hot_df['rct_names_lst'].values,
+                       hot_df['prd_names_lst'].values, hot_df['pes'].values,
+                       hot_df['subpes'].values)
+        for rxn, rcts, prds, pes_idx, subpes_idx in hot_rxns:
             for sp in self.species_list:
-                if sp in (hot_df['rct_names_lst'][rxn][0], hot_df['prd_names_lst'][rxn][0]):
-                    species_deco_dct[sp] = '{}:{}'.format(
-                        hot_df['pes'][rxn], hot_df['subpes'][rxn])
-                    submech_df['submech_prompt'][rxn] = 'RAD_DECO_{}'.format(
-                        sp)
+                if sp in (rcts[0], prds[0]):
+                    species_deco_dct[sp] = '{}:{}'.format(pes_idx, subpes_idx)
+                    prompt_lbl_dct[rxn] = 'RAD_DECO_{}'.format(sp)
 
         prompt_df = self.mech_df[self.mech_df['prompt'] == 'PROMPT_LUMPED']
-        for rxn in prompt_df.index:
+        for rxn, prds in zip(prompt_df.index,
+                             prompt_df['prd_names_lst'].values):
             for sp in self.species_list:
-                if sp in prompt_df['prd_names_lst'][rxn]:
-                    submech_df['submech_prompt'][rxn] = 'PROMPT_LUMPED_{}'.format(
-                        sp)
+                if sp in prds:
+                    prompt_lbl_dct[rxn] = 'PROMPT_LUMPED_{}'.format(sp)
 
         grp_dct_template = {'grp': 0, 'idxs': [], 'peds': [], 'hot': []}
         grpN = 0
@@ -475,6 +446,7 @@ class SortMech:
                 grp_dct['idxs'].append('{}:{}'.format(pes, subpes))
 
                 for rxn in subpesdf.index:
+                    rxn_ped = None
                     # sp in products
                     if any(sp in subpesdf['prd_names_lst'][rxn] for sp in self.species_list):
                         sp = self.species_list[[
@@ -488,7 +460,7 @@ class SortMech:
                         p1, p2 = subpesdf['prd_names_lst'][rxn]
                         # switch rcts and prds
                         rxn_ped = '{}+{}={}+{}'.format(p1, p2, r1, r2)
-                    submech_df['submech_prompt'][rxn] = 'RAD_GEN_{}'.format(sp)
+                    prompt_lbl_dct[rxn] = 'RAD_GEN_{}'.format(sp)
                     peds.append(rxn_ped)
                     # deal with hotspecies
                     hotpes = species_deco_dct[sp]
@@ -506,6 +478,9 @@ class SortMech:
             grps.append(grp_dct)
 
         self.grps = grps
+        submech_df['submech_prompt'] = [
+            prompt_lbl_dct.get(rxn, 'unclassified')
+            for rxn in submech_df.index]
 
         return submech_df
 
@@ -640,11 +615,9 @@ class SortMech:
         :rtype: dataframe[str][tuple]
         """
         # assign multiplicity values to each reactant
-        for rxn in reac_mult_df.index:
-            mult = 1
-            rcts = self.mech_df['rct_names_lst'][rxn]
-            mult = get_mult(rcts, self.spc_dct)
-            reac_mult_df['mult'][rxn] = str(mult)
+        reac_mult_df['mult'] = [
+            str(get_mult(rcts, self.spc_dct))
+            for rcts in self.mech_df['rct_names_lst'].values]
 
         return reac_mult_df
 
@@ -660,14 +633,14 @@ class SortMech:
             dataframe[class][rxn]
         :rtype: dataframe[str][tuple]
         """
-        for rxn in rxncl_broad_df.index:
-            rcts = self.mech_df['rct_names_lst_ord'][rxn]
-            prds = self.mech_df['prd_names_lst_ord'][rxn]
-            _smol = (self.mech_df['molecularity'][rxn] == 1)
-            _tbody = (self.mech_df['molecularity'][rxn] == 2
-                      and self.mech_df['isthrdbdy'][rxn] == 1)
-
-            if _smol or _tbody:
+        molecularity = self.mech_df['molecularity'].values
+        isthrdbdy = self.mech_df['isthrdbdy'].values
+        is_unimol = (molecularity == 1) | ((molecularity == 2) & (isthrdbdy == 1))
+        rxn_class_broad_lst = []
+        for rcts, prds, _unimol in zip(
+                self.mech_df['rct_names_lst_ord'].values,
+                self.mech_df['prd_names_lst_ord'].values, is_unimol):
+            if _unimol:
                 # unimolecular reaction classification
                 rxn_class_broad = submech.classify_unimol(
                     rcts, prds, self.spc_dct)
@@ -675,7 +648,8 @@ class SortMech:
                 # bimolecular reaction classification
                 rxn_class_broad = submech.classify_bimol(
                     rcts, prds, self.spc_dct)
-            rxncl_broad_df['rxn_class_broad'][rxn] = rxn_class_broad
+            rxn_class_broad_lst.append(rxn_class_broad)
+        rxncl_broad_df['rxn_class_broad'] = rxn_class_broad_lst
 
         return rxncl_broad_df
 
@@ -697,6 +671,7 @@ class SortMech:
         self.mech_df = pd.concat([self.mech_df, self.chnl('')], axis=1)
 
         # 2. Graph classification or each subpes
+        rclass_dct = {}
         for _, subpes_df in self.mech_df.groupby(['pes', 'subpes']):
             # sort by molecularity: analyze first unimolecular isomerizations,
             # unimolecular decompositions, and then bimolecular reactions
@@ -705,23 +680,21 @@ class SortMech:
             # REFER TO REORDERED SPECIES NAMES,
             # OTHERWISE YOU MAY HAVE INCONSISTENT SPECIES NAMING
             # subpes species list
-            species_subpes = list(set(
+            species_subpes = list(dict.fromkeys(
                 list(subpes_df['rct_names_lst_ord'].values) +
                 list(subpes_df['prd_names_lst_ord'].values)))
 
-            # build dataframe: elementary reactivity matrix
-            _nsubpes = len(species_subpes)
-            elem_reac_df = pd.DataFrame(
-                numpy.zeros((_nsubpes, _nsubpes), dtype='<U32'),
-                index=species_subpes,
-                columns=species_subpes)
+            # elementary reactivity matrix, stored by species pair
+            elem_reac_dct = {}
 
             # graph classification
-            for rxn in subpes_df.index:
-                rct_names = subpes_df['rct_names_lst'][rxn]
-                prd_names = subpes_df['prd_names_lst'][rxn]
-                rct_names_ord = subpes_df['rct_names_lst_ord'][rxn]
-                prd_names_ord = subpes_df['prd_names_lst_ord'][rxn]
+            subpes_rxns = zip(
+                subpes_df.index,
+                subpes_df['rct_names_lst'].values,
+                subpes_df['prd_names_lst'].values,
+                subpes_df['rct_names_lst_ord'].values,
+                subpes_df['prd_names_lst_ord'].values)
+            for rxn, rct_names, prd_names, rct_names_ord, prd_names_ord in subpes_rxns:
                 # Exclude rxns with more than 2 rcts or prds (not elementary!)
                 if len(rct_names) < 3 and len(prd_names) < 3:
 
@@ -730,25 +703,28 @@ class SortMech:
 
                 else:
                     rclass = 'unclassified - lumped'
-                rxncl_graph_df['rxn_class_graph'][rxn] = rclass
+                rclass_dct[rxn] = rclass
 
                 # store values in the elementary reactivity matrix
                 # (for now contaminated with isomerizations)
 
-                elem_reac_df[rct_names_ord][prd_names_ord] = rclass
-                elem_reac_df[prd_names_ord][rct_names_ord] = rclass
+                elem_reac_dct[(rct_names_ord, prd_names_ord)] = rclass
+                elem_reac_dct[(prd_names_ord, rct_names_ord)] = rclass
 
             # 3. classify well skipping channels
             # reclassify the unclassified reactions A->B+C, B+C->D, B+C->E+F
             for rxn in subpes_df.index:
-                if rxncl_graph_df['rxn_class_graph'][rxn] == 'unclassified':
+                if rclass_dct[rxn] == 'unclassified':
 
                     # call external function for WS channel classification
 
                     rxn_type_ws = classify_ws(
-                        subpes_df, elem_reac_df, species_subpes, rxn)
+                        subpes_df, elem_reac_dct, species_subpes, rxn)
                     if rxn_type_ws is not None:
-                        rxncl_graph_df['rxn_class_graph'][rxn] = rxn_type_ws
+                        rclass_dct[rxn] = rxn_type_ws
+
+        rxncl_graph_df['rxn_class_graph'] = [
+            rclass_dct.get(rxn, numpy.nan) for rxn in rxncl_graph_df.index]
 
         return rxncl_graph_df
 
@@ -762,10 +738,9 @@ class SortMech:
         :rtype: dataframe[float][tuple]
         """
         # extract maximum value for each ktp dictionary
-        for rxn in rxn_maxvals_df.index:
-            param_vals_dct = self.mech_df['param_vals'][rxn]
-            max_val = get_max_aligned_values(param_vals_dct)
-            rxn_maxvals_df['rxn_max_vals'][rxn] = max_val
+        rxn_maxvals_df['rxn_max_vals'] = [
+            get_max_aligned_values(param_vals_dct)
+            for param_vals_dct in self.mech_df['param_vals'].values]
 
         return rxn_maxvals_df
 
@@ -780,12 +755,9 @@ class SortMech:
         :rtype: dataframe[float][tuple]
         """
         # extract maximum ratio for each set ktp dictionary
-        for rxn in rxn_maxratio_df.index:
-            param_vals_dct = self.mech_df['param_vals'][rxn]
-            # get the ratio:
-            param_ratio_dct = get_aligned_rxn_ratio_dct(param_vals_dct)
-            max_val = get_max_aligned_values(param_ratio_dct)
-            rxn_maxratio_df['rxn_max_ratio'][rxn] = max_val
+        rxn_maxratio_df['rxn_max_ratio'] = [
+            get_max_aligned_values(get_aligned_rxn_ratio_dct(param_vals_dct))
+            for param_vals_dct in self.mech_df['param_vals'].values]
 
         return rxn_maxratio_df
 
@@ -807,12 +779,9 @@ class SortMech:
                     'cmts_inline': comments to write on same line of reaction
         """
 
-        # df for comments_top and comments_inline
-        ept_df = numpy.zeros((len(self.mech_df.index), 1), dtype=str)
-        df_cmts_top = pd.DataFrame(
-            ept_df, index=self.mech_df.index, columns=['cmts_top'])
-        df_cmts_inline = pd.DataFrame(
-            ept_df, index=self.mech_df.index, columns=['cmts_inline'])
+        # comments_top and comments_inline of each reaction
+        cmts_top = dict.fromkeys(self.mech_df.index, '')
+        cmts_inline = dict.fromkeys(self.mech_df.index, '')
 
         try:
             n_headers = int(hierarchy[-1])
@@ -828,25 +797,25 @@ class SortMech:
                 # Write rxn class as top header comments
                 rxnclass = cmts_string(
                     name, labels[hierarchy[:n_headers]], 'class_head')
-                idx0 = rdf.index[0]
-                df_cmts_top['cmts_top'][idx0] = rxnclass
+                cmts_top[rdf.index[0]] = rxnclass
 
                 # Write inline comments if necessary
                 if n_headers < len(hierarchy)-1:
                     for name2, rdf2 in rdf.groupby(hierarchy[n_headers:-1]):
                         rxnclass = cmts_string(
                             name2, labels[hierarchy[n_headers:-1]], 'subclass')
-                        df_cmts_inline['cmts_inline'][rdf2.index] = rxnclass
+                        cmts_inline.update(
+                            dict.fromkeys(rdf2.index, rxnclass))
         else:
             # Write only inline comments
             for name, rdf in self.mech_df.groupby(hierarchy[n_headers:-1]):
                 rxnclass = cmts_string(
                     name, labels[hierarchy[n_headers:-1]], 'class')
-                df_cmts_inline['cmts_inline'][rdf.index] = rxnclass
+                cmts_inline.update(dict.fromkeys(rdf.index, rxnclass))
 
-        # Concatenate DFs
-        self.mech_df = pd.concat(
-            [self.mech_df, df_cmts_top, df_cmts_inline], axis=1)
+        # Add the comments columns
+        self.mech_df['cmts_top'] = list(cmts_top.values())
+        self.mech_df['cmts_inline'] = list(cmts_inline.values())
 
     # OUTPUT DATAFRAMES and DICTIONARIES #
     def return_mech_df(self):
@@ -903,6 +872,67 @@ class SortMech:
 
         return pes_dct
 
+
+def _prompt_label(rcts, prds, species_set):
+    """ label a reaction as radical generation (RAD_GEN), radical
+        decomposition (RAD_DECO), or lumped prompt channel (PROMPT_LUMPED)
+
+    :param rcts: reactant names
+    :param prds: product names
+    :param species_set: set of the radicals considered
+
+    :returns: label; '' if the reaction is none of the above
+    :rtype: str
+    """
+    # rxn is bimol on both sides
+    if len(rcts) == 2 and len(prds) == 2:
+        label = 'RAD_GEN'
+    elif len(prds) > 2 and not species_set.isdisjoint(prds):
+        label = 'PROMPT_LUMPED'
+    # rxn is unimol deco/formation of the radical
+    elif ((len(rcts) == 1 and rcts[0] in species_set and len(prds) == 2) or
+          (len(prds) == 1 and prds[0] in species_set and len(rcts) == 2)):
+        label = 'RAD_DECO'
+    else:
+        label = ''
+
+    return label
+
+
+def _names_in_rxns(mech_df):
+    """ set of all reactant and product names of the reactions in mech_df
+    """
+    spc_set = set()
+    for rcts in mech_df['rct_names_lst'].values:
+        spc_set.update(rcts)
+    for prds in mech_df['prd_names_lst'].values:
+        spc_set.update(prds)
+
+    return spc_set
+
+
+def _first_in_hierarchy(rcts_lst, prds_lst, species_list):
+    """ for each reaction, find the first species of species_list that is
+        among its reactants or products
+
+    :param rcts_lst: reactant names of each reaction
+    :param prds_lst: product names of each reaction
+    :param species_list: species in hierarchical order
+
+    :returns: species found for each reaction; None if no species found
+    :rtype: list
+    """
+    rank_dct = {}
+    for rank, spc in enumerate(species_list):
+        rank_dct.setdefault(spc, rank)
+    first_spc_lst = []
+    for rcts, prds in zip(rcts_lst, prds_lst):
+        ranks = [rank_dct[spc] for spc in rcts + prds if spc in rank_dct]
+        first_spc_lst.append(species_list[min(ranks)] if ranks else None)
+
+    return first_spc_lst
+
+
 # FUNCTIONS FOR RXN GRAPH CLASSIFICATION #
 
 
@@ -953,12 +983,13 @@ def classify_graph(spc_dct, rct_names, prd_names):
     return rclass
 
 
-def classify_ws(subpes_df, elem_reac_df, species_subpes, rxn):
+def classify_ws(subpes_df, elem_reac_dct, species_subpes, rxn):
     """ classifies well skipping channels of a given subpes
         WARNING: STILL UNDER CONSTRUCTION - SOME TEMPORARY FEATURES
 
     :param subpes_df: dataframe with subpes info
-    :param elem_reac_df: dataframe with elementary reaction channels of subpes
+    :param elem_reac_dct: elementary reaction classes of the subpes,
+        {(spcs1, spcs2): rclass}, stored in both directions
     :param species_subpes: list of subpes species
     :param rxn: string with rxn belonging to the subpes
 
@@ -966,24 +997,27 @@ def classify_ws(subpes_df, elem_reac_df, species_subpes, rxn):
     :rtype: str
     """
     # derive unimolecular species list
-    mult_species_subpes = pd.Series(
-        list(map(len, species_subpes)), index=species_subpes)
-    unimol_species = mult_species_subpes[mult_species_subpes == 1].index
+    unimol_species = [spc for spc in species_subpes if len(spc) == 1]
+
+    def _elem_types(names):
+        """ classes of the elementary channels connecting names to the
+            unimolecular species of the subpes
+        """
+        rxn_types = (elem_reac_dct.get((names, spc), '')
+                     for spc in unimol_species)
+        return [rxn_type for rxn_type in rxn_types
+                if rxn_type not in ('', 'unclassified')]
 
     rct_names = subpes_df['rct_names_lst_ord'][rxn]
     prd_names = subpes_df['prd_names_lst_ord'][rxn]
     # reactants: if bimolecular, find the label of the elementary reaction
     # going to unimolecular species; if unimol, label is 'isom'
     # isolate A+B->C and C->A+B connections
-    rxn_types = elem_reac_df[rct_names][unimol_species]
-    rxn_types = rxn_types[rxn_types != 'unclassified']
-    rxn_types_1 = rxn_types[rxn_types != '']
+    rxn_types_1 = _elem_types(rct_names)
+    rxn_types_2 = _elem_types(prd_names)
 
-    rxn_types = elem_reac_df[prd_names][unimol_species]
-    rxn_types = rxn_types[rxn_types != 'unclassified']
-    rxn_types_2 = rxn_types[rxn_types != '']
-
-    try:
+    rxn_type_ws = None
+    if rxn_types_1 and rxn_types_2:
         # TEMPORARY: SHOULD RECONSTRUCT FULL PATH FROM REACTANTS TO PRODUCTS
         rxn_type_1 = rxn_types_1[0]
         # TEMPORARY: SHOULD RECONSTRUCT FULL PATH FROM REACTANTS TO PRODUCTS
@@ -991,10 +1025,8 @@ def classify_ws(subpes_df, elem_reac_df, species_subpes, rxn):
 
         # WRITE THE REACTION TYPE STRING
         rxn_type_ws = rxn_type_1 + '-' + rxn_type_2 + ' (WS)'
-        return rxn_type_ws
 
-    except IndexError:
-        return None
+    return rxn_type_ws
 
 
 # FUNCTIONS FOR COMMENTS - CALLED BY THE SORTER #
@@ -1158,16 +1190,15 @@ def mech_info(rxn_param_dct, spc_dct):
 
         return formula_dct_lst, formula_str_lst, rxn_name_lst
 
-    if not all([isinstance(val, dict) or isinstance(val, list) for val in rxn_param_dct.values()]):
+    if all(isinstance(val, (dict, list)) for val in rxn_param_dct.values()):
+        rxn_ktp_dct = rxn_param_dct  # it means you already provided a ktp dct as input
+    else:
         print(
             '*Warning: ktp dct vals for sorting purposes derived at [300, 1000, 1500, 2000] K at 1 atm')
-        rxn_ktp_dct = calc_rates.eval_rxn_param_dct(rxn_param_dct, [numpy.array([300, 1000, 1500, 2000])],
-                                                    [1])
-        for key, val in rxn_ktp_dct.items():
-            if isinstance(val, dict):
-                rxn_ktp_dct[key] = [val]
-    else:
-        rxn_ktp_dct = rxn_param_dct  # it means you already provided a ktp dct as input
+        rxn_ktp_dct = calc_rates.eval_rxn_param_dct(
+            rxn_param_dct, [numpy.array([300, 1000, 1500, 2000])], [1])
+        rxn_ktp_dct = {rxn: (val if not isinstance(val, dict) else [val])
+                       for rxn, val in rxn_ktp_dct.items()}
 
     # Extract info from dictionary
     rcts, prds, thrdbdy = zip(*rxn_param_dct.keys())
@@ -1182,4 +1213,4 @@ def mech_info(rxn_param_dct, spc_dct):
 
     return [formula_dct, formula_str,
             rct_names, prd_names, thrdbdy_lst,
-            rxn_name, list(rxn_ktp_dct.values())]
+            rxn_name, [rxn_ktp_dct[rxn] for rxn in rxn_param_dct]]
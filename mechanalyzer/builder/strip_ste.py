@@ -82,11 +82,10 @@ def align_rxns(iso_sets_rxns_ich):
     # Check to see if any reactions match
     algn_rxns = algn_iso_sets_rxns
     for iso_set in algn_iso_sets_rxns:
-        iso_set_copy = copy.deepcopy(iso_set)
+        rxn_idx = compare.RxnIndex(iso_set)
         for rxn in iso_set.keys():
-            iso_set_copy.pop(rxn)  # remove current rxn so no false matches
-            matching_rxn, rev_rate = compare.assess_rxn_match(
-                rxn, iso_set_copy)
+            rxn_idx.remove(rxn)  # remove current rxn so no false matches
+            matching_rxn, _ = compare.assess_rxn_match(rxn, rxn_idx)
             if matching_rxn:
                 print('matching rxn found where it should not be!')
 
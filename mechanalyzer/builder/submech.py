@@ -5,15 +5,16 @@ Functions for
 """
 
 import sys
-import copy
 import numpy
 import pandas as pd
 import automol
 from mechanalyzer.parser._util import get_mult
+from mechanalyzer.parser import ich_cache
 
 # list of formulas for products/reactants identified for the sublcasses
 FMLS_SET = numpy.array(['H1', 'O1', 'H1O1', 'O2', 'H1O2', 'C1H3'])
 # atoms order: C, H, O, N, S, CL
+ELEMENTS = ('C', 'H', 'O', 'N', 'S', 'Cl')
 STOICH_DEFAULT = [0, 2, 2, 0, 0, 0]
 STOICH_DCT_ADD = {
     'FUEL': [0, 0, 0, 0, 0, 0],
@@ -29,31 +30,32 @@ STOICH_DCT_ADD = {
     'R_O4': [0, -1, 4, 0, 0, 0],
     'R_O3-H': [0, -2, 3, 0, 0, 0]}
 
+
 def species_subset_ext(fuel, spc_dct, stoich_limit=STOICH_DEFAULT):
     """ call species_subset but and also extract all species
         below stoich: stoich_fuel+stoich_limit
     """
     # extract species subset
-    species_list, species_subset_df = species_subset(fuel, spc_dct)
+    fml_df = extract_fml_df(spc_dct)
+    species_list, species_subset_df = species_subset(
+        fuel, spc_dct, fml_df=fml_df)
     # add all stoichiometries below that of interest
-    # filter extracted species from spc_dct first
-    spc_dct_reduced = copy.deepcopy(spc_dct)
-    [spc_dct_reduced.pop(sp) for sp in species_list]
-    fml_df_reduced = extract_fml_df(spc_dct_reduced)
+    # filter extracted species from the formula table first
+    fml_df_reduced = fml_df.drop(species_list)
 
-    fml_df = extract_fml_df(spc_dct)
-    stoich_fuel = fml_df.loc[fuel][['nC', 'nH', 'nO', 'nN', 'nS', 'nCl']].values
+    stoich_fuel = fml_df.loc[fuel, _count_columns(ELEMENTS)].to_numpy()
     stoich = stoich_fuel + stoich_limit
 
     # extract desired species and assign labels
     species = extract_species_sub(stoich, fml_df_reduced)
-    series = pd.Series('SUBFUEL', index=species)
-    species_subset_df = species_subset_df.append(series)
+    series = pd.Series('SUBFUEL', index=species, dtype=object)
+    species_subset_df = pd.concat([species_subset_df, series])
     species_list += species
 
     return species_list, species_subset_df
 
-def species_subset(fuel, spc_dct):
+
+def species_subset(fuel, spc_dct, fml_df=None):
     """ Given the name of a fuel in a spc_dct, it finds all species
         involved in its combustion mech by stoichiometry
 
@@ -69,85 +71,117 @@ def species_subset(fuel, spc_dct):
         :type fuel: str
         :param spc_dct: species dict
         :type spc_dct: dict[]
+        :param fml_df: formula table of spc_dct, if already built
+        :type fml_df: pandas.DataFrame
         :rtype: pandas.dataframe
     """
 
-    species_list = []
-    species_subset_df = pd.Series()
-
     # extract formulas
-    fml_df = extract_fml_df(spc_dct)
+    if fml_df is None:
+        fml_df = extract_fml_df(spc_dct)
+    fml_idx = formula_index(fml_df)
 
     # Generate list of stoichiometries to extract and the corresponding labels
-    stoich_fuel = fml_df.loc[fuel][['nC', 'nH', 'nO', 'nN', 'nS', 'nCl']].values
+    stoich_fuel = fml_df.loc[fuel, _count_columns(ELEMENTS)].to_numpy()
 
     # extract desired species and assign labels
-
+    species_list = []
+    series_lst = []
     for stoich_type, stoich in STOICH_DCT_ADD.items():
-        species = extract_species(stoich+stoich_fuel, fml_df)
-        series = pd.Series(stoich_type, index=species)
-        species_subset_df = species_subset_df.append(series)
+        species = fml_idx.get(tuple(stoich+stoich_fuel), [])
+        series_lst.append(pd.Series(stoich_type, index=species, dtype=object))
         species_list += species
+    species_subset_df = pd.concat(series_lst)
 
     return species_list, species_subset_df
 
 
-def extract_fml_df(spc_dct):
+def extract_fml_df(spc_dct, elements=ELEMENTS):
     """ Given species dictionary, builds a formula Pandas dataframe:
             index = species names; columns 'fml' (stoichiometry)
-            'nC','nH','nO' (number of C/H/O atmoms in the formula)
+            'nC','nH','nO',... (number of atoms of each element in
+            the formula, as integers)
+        Transition states and global entries are not included.
 
         :param spc_dct:
         :type spc_dct: dict[]
+        :param elements: elements to count, in the order of the columns
+        :type elements: tuple(str)
+        :rtype: pandas.DataFrame
     """
 
-    fml_df = pd.DataFrame(index=list(spc_dct.keys()),
-                          columns=['fml', 'nC', 'nH', 'nO', 'nN', 'nS', 'nCl'])
-    for key in spc_dct.keys():
-        if 'ts' not in key and 'global' not in key:
-            ich = spc_dct[key]['inchi']
-            fml_dct = automol.inchi.formula(ich)
-            fml_df['fml'][key] = automol.formula.string2(fml_dct)
-            fml_df['nC'][key] = automol.formula.element_count(fml_dct, 'C')
-            fml_df['nH'][key] = automol.formula.element_count(fml_dct, 'H')
-            fml_df['nO'][key] = automol.formula.element_count(fml_dct, 'O')
-            fml_df['nN'][key] = automol.formula.element_count(fml_dct, 'N')
-            fml_df['nS'][key] = automol.formula.element_count(fml_dct, 'S')
-            fml_df['nCl'][key] = automol.formula.element_count(fml_dct, 'Cl')
+    names = [name for name in spc_dct
+             if 'ts' not in name and 'global' not in name]
+    fml_dcts = [ich_cache.formula(spc_dct[name]['inchi']) for name in names]
+
+    counts = numpy.zeros((len(names), len(elements)), dtype=int)
+    for idx, fml_dct in enumerate(fml_dcts):
+        counts[idx] = [fml_dct.get(elem, 0) for elem in elements]
+
+    fml_df = pd.DataFrame(
+        counts, index=names, columns=_count_columns(elements))
+    fml_df.insert(
+        0, 'fml', [automol.formula.string2(fml_dct) for fml_dct in fml_dcts])
 
     return fml_df
 
 
-def extract_species(n_at, fml_df):
+def formula_index(fml_df, elements=ELEMENTS):
+    """ Groups the species of a formula dataframe by stoichiometry
+
+        :param fml_df: dataframe built by extract_fml_df
+        :type fml_df: pandas.DataFrame
+        :param elements: elements of the stoichiometry tuples
+        :type elements: tuple(str)
+        :returns: species names, in the order of fml_df, for each
+            tuple of atom counts
+        :rtype: dict[tuple(int): list(str)]
+    """
+
+    fml_idx = {}
+    counts = fml_df[_count_columns(elements)].to_numpy()
+    for name, n_at in zip(fml_df.index, map(tuple, counts.tolist())):
+        fml_idx.setdefault(n_at, []).append(name)
+
+    return fml_idx
+
+
+def extract_species(n_at, fml_df, elements=ELEMENTS):
     """ Extracts species corresponding to a given stoichiometry n_CHONSCl
         from the formulas dataframe.
 
-        :param n_cho: numpy array [x,y,z,...] where
+        :param n_at: numpy array [x,y,z,...] where
             x = n of C atoms, y = n of H atoms, ...
-        :type: n_cho: numpy.ndarray
+        :type: n_at: numpy.ndarray
         :param fml_df: dataframe with
             index = species names; columns 'fml' (stoichiometry),
             'nC','nH','nO' (number of C/H/O atmoms in the formula)
+        :param elements: elements of n_at
+        :type elements: tuple(str)
         :returns: list of species with the corresponding n_CHONSCl
     """
 
-    species_set = list(fml_df[(fml_df['nC'] == n_at[0]) & (
-        fml_df['nH'] == n_at[1]) & (fml_df['nO'] == n_at[2]) & (
-        fml_df['nN'] == n_at[3]) & (fml_df['nS'] == n_at[4]) & (
-        fml_df['nCl'] == n_at[5])].index)
+    counts = fml_df[_count_columns(elements)].to_numpy()
+    mask = (counts == numpy.asarray(n_at)).all(axis=1)
 
-    return species_set
+    return list(fml_df.index[mask])
 
-def extract_species_sub(n_at, fml_df):
+
+def extract_species_sub(n_at, fml_df, elements=ELEMENTS):
     """ as above but leq
     """
 
-    species_set = list(fml_df[(fml_df['nC'] <= n_at[0]) & (
-        fml_df['nH'] <= n_at[1]) & (fml_df['nO'] <= n_at[2]) & (
-        fml_df['nN'] <= n_at[3]) & (fml_df['nS'] <= n_at[4]) & (
-        fml_df['nCl'] <= n_at[5])].index)
+    counts = fml_df[_count_columns(elements)].to_numpy()
+    mask = (counts <= numpy.asarray(n_at)).all(axis=1)
+
+    return list(fml_df.index[mask])
+
+
+def _count_columns(elements):
+    """ Names of the atom count columns of the formula dataframe
+    """
+    return [f'n{elem}' for elem in elements]
 
-    return species_set
 
 def classify_unimol(rcts, prds, spc_dct):
     """ Classifies unimolecular reaction from reactants and products names:
@@ -168,7 +202,7 @@ def classify_unimol(rcts, prds, spc_dct):
     """
 
     # extract formula dictionary
-    fml_df = extract_fml_df(spc_dct)
+    fml_df = extract_fml_df(_rxn_spc_dct(rcts, prds, spc_dct))
     mult_rcts = get_mult(rcts, spc_dct)
     mult_prds = get_mult(prds, spc_dct)
 
@@ -221,7 +255,7 @@ def classify_bimol(rcts, prds, spc_dct):
     """
 
     # extract formula dictionary
-    fml_df = extract_fml_df(spc_dct)
+    fml_df = extract_fml_df(_rxn_spc_dct(rcts, prds, spc_dct))
 
     # extracts reactants and products multiplicity
     mult_rcts = get_mult(rcts, spc_dct)
@@ -270,6 +304,12 @@ def classify_bimol(rcts, prds, spc_dct):
     return rxn_class_broad
 
 
+def _rxn_spc_dct(rcts, prds, spc_dct):
+    """ Entries of the spc_dct for the reactants and products
+    """
+    return {name: spc_dct[name] for name in tuple(rcts) + tuple(prds)}
+
+
 def classify_isom_bim(rcts, prds, fml_df):
     """ Check if an A+B=C+D reaction is a bimolecular isomerization
         of the kind A+R=B+R by checking
@@ -367,8 +407,8 @@ def set_flag_habs(spc_rct, spc_prd, fml_df, stoich_add):
         :type: stoich_add:
     """
 
-    stoich_rct = fml_df.loc[spc_rct][['nC', 'nH', 'nO']].values
-    stoich_prd = fml_df.loc[spc_prd][['nC', 'nH', 'nO']].values
+    stoich_rct = fml_df.loc[spc_rct, ['nC', 'nH', 'nO']].to_numpy()
+    stoich_prd = fml_df.loc[spc_prd, ['nC', 'nH', 'nO']].to_numpy()
     stoich_prd_target = stoich_rct+stoich_add
 
     return all(stoich_prd == stoich_prd_target)
@@ -3,6 +3,7 @@
 from operator import mod
 import sys
 import copy
+import hashlib
 import mess_io
 import mechanalyzer
 
@@ -18,14 +19,16 @@ def multipes_prompt_dissociation_ktp_dct(list_strs_dct, model, bf_thresh):
     """
     if isinstance(model, list):
         model = model[0]
+    # each MESS file is parsed only once, whatever the chains of PESs
+    mess_cache = {}
     # SET UP A LIST OF PED FILES AND HOT FILES DEPENDING ON THE INPUT
     rxn_type_dct = {'ped': [], 'pedhot': [], 'hot': []}
     # base ktp dct: valid for any model. contains rxns on hot PESs (unmodified by prompt)
     # and PED rxns
     rxn_ktp_dct_full0 = {}
     for strs_dct in list_strs_dct:
-        ped_spc, _ = mess_io.reader.ped.ped_names(strs_dct['inp'])
-        hot_spc_en = mess_io.reader.hoten.get_hot_species(strs_dct['inp'])
+        ped_spc, hot_spc_en = cached_parse(
+            inp_species, mess_cache, strs_dct['inp'])
         if ped_spc and hot_spc_en:
             rxn_type_dct['pedhot'].append(strs_dct)
         elif ped_spc and not hot_spc_en:
@@ -33,7 +36,8 @@ def multipes_prompt_dissociation_ktp_dct(list_strs_dct, model, bf_thresh):
         elif hot_spc_en and not ped_spc:
             rxn_type_dct['hot'].append(strs_dct)
 
-        rxn_ktp_dct_full0.update(extract_ktp_dct(strs_dct['ktp_out']))
+        rxn_ktp_dct_full0.update(cached_parse(
+            extract_ktp_dct, mess_cache, strs_dct['ktp_out']))
 
     # FOR EACH PED: CHECK IF OVERLAP WITH INTERMEDIATE PESs;
     # THEN FOR THE ONE IDENTIFIED CHECK OVERLAP WITH HOT OR INTERMEDIATE PESs, ITERATIVELY
@@ -49,7 +53,7 @@ def multipes_prompt_dissociation_ktp_dct(list_strs_dct, model, bf_thresh):
     # IN THESE CASES AN 'INTERMEDIATE' PES CAN NEVER BE A BEGINNING OR AN END
     rxn_ktp_dct_full = rxn_chains_calc(
         rxn_type_dct['ped'], rxn_type_dct['pedhot'], rxn_type_dct['hot'],
-        model, bf_thresh)
+        model, bf_thresh, mess_cache=mess_cache)
     print(rxn_ktp_dct_full.keys(), rxn_ktp_dct_full0.keys())
     # Add in the prompt versions of the reactions
     # pop values in rxn_ktp_dct_full0
@@ -63,8 +67,9 @@ def multipes_prompt_dissociation_ktp_dct(list_strs_dct, model, bf_thresh):
     return rxn_ktp_dct_full
 
 
-def rxn_chains_calc(PES_0, PES_i, PES_end, model, bf_thresh):
+def rxn_chains_calc(PES_0, PES_i, PES_end, model, bf_thresh, mess_cache=None):
     """ generate reaction chains of successive prompt/hot PESs
+        mess_cache: dct of the parsed MESS files, shared by all chains
     """
     def listconnected(PES_str0, PESs_str):
         retlist = []
@@ -75,9 +80,10 @@ def rxn_chains_calc(PES_0, PES_i, PES_end, model, bf_thresh):
     def isconnected(ped_spc_str, hot_en_spc_str):
         """ return true if ped species is hot species of the following PES """
         connected = []
-        ped_spc_all, _ = mess_io.reader.ped.ped_names(ped_spc_str['inp'])
-        hot_spc_en = mess_io.reader.hoten.get_hot_species(
-            hot_en_spc_str['inp'])
+        ped_spc_all, _ = cached_parse(
+            inp_species, mess_cache, ped_spc_str['inp'])
+        _, hot_spc_en = cached_parse(
+            inp_species, mess_cache, hot_en_spc_str['inp'])
         for ped_spc in ped_spc_all:
             frags = []
             [frags.extend(fragset.split('+')) for fragset in ped_spc]
@@ -100,7 +106,7 @@ def rxn_chains_calc(PES_0, PES_i, PES_end, model, bf_thresh):
                     pes0['inp'], pes0['ktp_out'],
                     pes0['ped'], pes0['ke_out'],
                     hot_strs_dct['inp'], hot_strs_dct['log'],
-                    model, bf_thresh)
+                    model, bf_thresh, mess_cache=mess_cache)
 
                 # update dct
                 rxn_ktp_dct_ped.update(
@@ -120,7 +126,8 @@ def rxn_chains_calc(PES_0, PES_i, PES_end, model, bf_thresh):
                 pes0['inp'], pes0['ktp_out'],
                 pes0['ped'], pes0['ke_out'],
                 pedhot_i['inp'], pedhot_i['log'],
-                model, bf_thresh, hot_ped_str=pedhot_i['ped'], hot_ke_out_str=pedhot_i['ke_out'])
+                model, bf_thresh, hot_ped_str=pedhot_i['ped'], hot_ke_out_str=pedhot_i['ke_out'],
+                mess_cache=mess_cache)
             # you need the reaction ktp dictionary as a new input
             # you need the starting energy distribution of the products of pedhot_i
             prompt_ktp_dct = copy.deepcopy(rxn_ktp_dct)
@@ -139,7 +146,8 @@ def rxn_chains_calc(PES_0, PES_i, PES_end, model, bf_thresh):
                         prompt_ktp_dct, pednew,
                         pedhot_i['inp'], pedhot_i['log'],
                         model, bf_thresh, hot_ped_str=pedhot_i['ped'],
-                        hot_ke_out_str=pedhot_i['ke_out'], ene_bw=ene_bw)
+                        hot_ke_out_str=pedhot_i['ke_out'], ene_bw=ene_bw,
+                        mess_cache=mess_cache)
 
                     # replace rxns every time
                     rxn_ktp_dct.update(prompt_ktp_dct)
@@ -156,7 +164,7 @@ def rxn_chains_calc(PES_0, PES_i, PES_end, model, bf_thresh):
                     prompt_ktp_dct, _, _ = prompt_chain_ktp_dct(
                         prompt_ktp_dct, pednew,
                         hot_strs_dct['inp'], hot_strs_dct['log'],
-                        model, bf_thresh)
+                        model, bf_thresh, mess_cache=mess_cache)
 
                     rxn_ktp_dct.update(prompt_ktp_dct)
 
@@ -179,15 +187,16 @@ def rxn_chains_calc(PES_0, PES_i, PES_end, model, bf_thresh):
 def prompt_chain_ktp_dct(rxn_ktp_dct, ene_start_df_dct,
                          pedhot_inp_str, pedhot_log_str,
                          model, bf_thresh, hot_ped_str=None,
-                         hot_ke_out_str=None, ene_bw=0):
+                         hot_ke_out_str=None, ene_bw=0, mess_cache=None):
     """ Starts from rxn_ktp_dct
         rxn_ktp_dct: ktp dct to update with prompt fractions
         ene_start_df_dct: starting energy distribution for hotspecies (dct keys)
+        mess_cache: dct of the parsed MESS files, see cached_parse
 
     """
     # HOTEN INFO
-    hot_frag_dct, hot_spc_en, hoten_dct, fne_bf = \
-        hot_info(pedhot_inp_str, pedhot_log_str)
+    hot_frag_dct, hot_spc_en, hoten_dct, fne_bf = cached_parse(
+        hot_info, mess_cache, pedhot_inp_str, pedhot_log_str)
 
     # Derive Branching Fractions, Calculate Prompt Rates
     # Merge Prompt Rates with Thermal Rates
@@ -219,30 +228,33 @@ def prompt_chain_ktp_dct(rxn_ktp_dct, ene_start_df_dct,
         if hot_ke_out_str and hot_ped_str:
             # frag1 è hotspecies - devi prendere quella distribuzione dalle hot
             pedhot_df_dct, ene_bw = build_pedhot_df_dct(pedhot_inp_str, hot_ped_str, hot_ke_out_str,
-                                                        spc, ene_start_df_dct[spc], ene_bw, model)
+                                                        spc, ene_start_df_dct[spc], ene_bw, model,
+                                                        mess_cache=mess_cache)
 
     return full_prompt_rxn_ktp_dct, pedhot_df_dct, ene_bw
 
 def prompt_dissociation_ktp_dct(ped_inp_str, ped_out_str,
                                 ped_ped_str, ped_ke_out_str,
                                 hot_inp_str, hot_log_str,
-                                model, bf_thresh, hot_ped_str=None, hot_ke_out_str=None):
+                                model, bf_thresh, hot_ped_str=None, hot_ke_out_str=None,
+                                mess_cache=None):
     """ Parses the MESS files and generates the rate constants
         from a prompt dissociation process
+        mess_cache: dct of the parsed MESS files, see cached_parse
     """
 
     # PED INFO
     ped_spc, ped_dct, dof_dct, \
-        dos_df, energy_dct = ped_info(
-            ped_inp_str, ped_ped_str, ped_ke_out_str)
+        dos_df, energy_dct = cached_parse(
+            ped_info, mess_cache, ped_inp_str, ped_ped_str, ped_ke_out_str)
 
     # HOTEN INFO
-    hot_frag_dct, hot_spc_en, hoten_dct, fne_bf = \
-        hot_info(hot_inp_str, hot_log_str)
+    hot_frag_dct, hot_spc_en, hoten_dct, fne_bf = cached_parse(
+        hot_info, mess_cache, hot_inp_str, hot_log_str)
 
     # OBTAIN ALL OF THE RATE CONSTANTS FROM THE OUTPUT FILES
     # put dictionaries together
-    rxn_ktp_dct = extract_ktp_dct(ped_out_str)
+    rxn_ktp_dct = cached_parse(extract_ktp_dct, mess_cache, ped_out_str)
 
     # Derive Branching Fractions, Calculate Prompt Rates
     # Merge Prompt Rates with Thermal Rates
@@ -291,7 +303,8 @@ def prompt_dissociation_ktp_dct(ped_inp_str, ped_out_str,
         if hot_ke_out_str and hot_ped_str:
             # frag1 è hotspecies - devi prendere quella distribuzione dalle hot
             pedhot_df_dct, ene_bw = build_pedhot_df_dct(hot_inp_str, hot_ped_str, hot_ke_out_str,
-                                                        frag1, ped_df_frag1, ene_bw, model)
+                                                        frag1, ped_df_frag1, ene_bw, model,
+                                                        mess_cache=mess_cache)
 
     return full_prompt_rxn_ktp_dct, pedhot_df_dct, ene_bw
 
@@ -323,13 +336,14 @@ def calc_bf_ktp(full_prompt_rxn_ktp_dct, model, bf_thresh,
     return full_prompt_rxn_ktp_dct
 
 def build_pedhot_df_dct(hot_inp_str, hot_ped_str, hot_ke_out_str,
-                        starthotfrag, starthotfrag_df, ene_bw, model):
+                        starthotfrag, starthotfrag_df, ene_bw, model,
+                        mess_cache=None):
 
     pedhot_df_dct = {}
 
     hot_ped_spc, hot_ped_dct, hot_dof_dct, \
-        hot_dos_df, hot_energy_dct = ped_info(
-            hot_inp_str, hot_ped_str, hot_ke_out_str)
+        hot_dos_df, hot_energy_dct = cached_parse(
+            ped_info, mess_cache, hot_inp_str, hot_ped_str, hot_ke_out_str)
     # starting energy distribution
     starthot_df = starthotfrag_df
 
@@ -363,6 +377,41 @@ def build_pedhot_df_dct(hot_inp_str, hot_ped_str, hot_ke_out_str,
     return pedhot_df_dct, ene_bw
 
 
+def cached_parse(parser, mess_cache, *strs):
+    """ Calls parser(*strs) on MESS file strings; if a cache dct is given,
+        the result is stored under the parser name and the hashes of the
+        strings, so each set of files is parsed only once per run.
+        A copy is returned every time, since the prompt functions may
+        modify the parsed dataframes and dictionaries
+
+        :param parser: function parsing the MESS file strings
+        :type parser: function
+        :param mess_cache: parsed MESS files of the current run, or None
+        :type mess_cache: dict
+        :param strs: MESS file strings
+        :type strs: str
+        :return: copy of the object returned by parser
+    """
+    if mess_cache is None:
+        return parser(*strs)
+
+    key = (parser.__name__,) + tuple(
+        hashlib.sha256(mess_str.encode()).hexdigest() for mess_str in strs)
+    if key not in mess_cache:
+        mess_cache[key] = parser(*strs)
+
+    return copy.deepcopy(mess_cache[key])
+
+
+def inp_species(inp_str):
+    """ PED and hot species of a MESS input
+    """
+    ped_spc, _ = mess_io.reader.ped.ped_names(inp_str)
+    hot_spc_en = mess_io.reader.hoten.get_hot_species(inp_str)
+
+    return ped_spc, hot_spc_en
+
+
 def ped_info(ped_inp_str, ped_ped_str, ped_ke_out_str):
     """ file strings
         wellreac: str if you want PEDs of well->bimol 
@@ -4,8 +4,6 @@
 """
 
 import sys
-from tokenize import Single
-from tracemalloc import start
 from scipy.interpolate import interp1d
 import numpy as np
 import pandas as pd
@@ -23,6 +21,8 @@ def ped_df_rescale(starthot_df, ped_df_fromhot):
         :return ped_df: ped_df weighted on hot_df distribution
         :rtype: df[P][T]:series(en: prob(en))
         sum(ped_df_fromhot(E';E)*starthot_df(E)), E is the starting hoten, E' is the prod en
+        The distributions are put on a common energy vector and summed
+        together (see weighted_ped_sum)
     """
     # sort indexes
     starthot_df = starthot_df.sort_index()
@@ -34,61 +34,33 @@ def ped_df_rescale(starthot_df, ped_df_fromhot):
     T_del = []
     for temp in temps:
         for pressure in pressures:
-            
             # initial distribution: sort and fit
             starthot = starthot_df[pressure][temp].sort_index()
             # rescale values based on probability - too low probability excluded
             starthot = starthot[starthot > max(starthot)*1e-4] # 99.99%
             # refit starthot to derive the weight factors later
-            
             f_starthot = interp1d(
                 starthot.index, starthot.values, bounds_error=False, 
                 kind='cubic', fill_value=(starthot.values[0], starthot.values[-1]))
-            
+
             # reduce the energy range of ped_fromhot
-            
             ped_fromhot = ped_df_fromhot[pressure][temp].sort_index()
-            ped_fromhot_0 = ped_fromhot
-            # print('before: ', ped_fromhot, '\n')
             ped_fromhot = ped_fromhot.iloc[(starthot.index[0] <= ped_fromhot.index)*(ped_fromhot.index <= starthot.index[-1])]
-            # print('after: ', ped_fromhot, '\n')
             # set new energy vector from min and max energies in peden_fromhot
-            min_en_fromhot = min([min(ped_fromhot.iloc[i].index) for i in np.arange(0, len(ped_fromhot))])
-            max_en_fromhot = min([max(ped_fromhot.iloc[i].index) for i in np.arange(0, len(ped_fromhot))])
+            min_en_fromhot = min(ped.index.min() for ped in ped_fromhot)
+            max_en_fromhot = min(ped.index.max() for ped in ped_fromhot)
             ene_vect = np.arange(min_en_fromhot, max_en_fromhot, 0.5)
-            prob_vect = np.zeros(ene_vect.shape)
-            if temp == 1300 and pressure == 0.01:
-                print(temp, pressure, starthot, '\n')
-                print(ped_fromhot_0, '\n', ped_fromhot)
-                
-            # weight factor from fitted starthot
-            for starten in ped_fromhot.index:
-                weightfactor = f_starthot(starten)
-                hoten = ped_fromhot[starten].index
-                pedhot = ped_fromhot[starten].values
-                # interpolate values
-                if len(hoten) > 3:
-                    f_ped_fromhot = interp1d(
-                        hoten, pedhot, bounds_error=False, 
-                        kind='cubic', fill_value=(0., 0.))
-                    prob_vect += f_ped_fromhot(ene_vect)*weightfactor
-                    
-                elif 1 >= len(hoten) >= 3:
-                    # find max val of hoten and set that one
-                    idx_max = np.argmax(pedhot)
-                    # find where hoten is closest and add 1
-                    idx = np.argmin(ene_vect - hoten[idx_max])
-                    single_1 = np.zeros(ene_vect.shape)
-                    single_1[idx] = pedhot[idx_max]
-                    prob_vect += single_1*weightfactor
+
+            # weight factors from fitted starthot
+            weightfactors = f_starthot(ped_fromhot.index)
+            prob_vect = weighted_ped_sum(
+                ped_fromhot.values, weightfactors, ene_vect)
 
             # renormalize and put in dataframe
             prob_vect /= np.trapz(prob_vect, x=ene_vect)
             ped_df[pressure][temp] = pd.Series(prob_vect, index=ene_vect)
             if ped_df[pressure][temp].empty:
                 T_del.append(temp)
-            if temp == 1300 and pressure == 0.01:
-                print(ped_df[pressure][temp], '\n')
 
     ped_df = ped_df.drop(index=list(set(T_del)))
 
@@ -134,16 +106,19 @@ def bf_tp_df_full(ped_df, hotbf_df):
             if len(hoten) > 3:
                 ene_vect = ped.index
                 ped_vect = ped.values
-                # Series to allocate
-                bf_series = pd.Series(0, index=allspecies, dtype=float)
-                for spc in allspecies:
-                    hoten_spc = hotbf_df[pressure][temp][spc][hoten]
-                    f_hoten = interp1d(
-                        hoten_spc.index, hoten_spc.values, bounds_error=False, 
-                        kind='cubic', fill_value=(hoten_spc.values[0], hoten_spc.values[-1]))
-                    hoten_vect = f_hoten(ene_vect)
-                    # recompute in an appropriate range
-                    bf_series[spc] = np.trapz(ped_vect*hoten_vect, x=ene_vect)
+                # interpolate the hot BFs of all species at once:
+                # array[hoten, species]
+                hotbf_vals = hotbf_df[pressure][temp].loc[
+                    hoten, allspecies].values
+                f_hoten = interp1d(
+                    hoten, hotbf_vals, axis=0, bounds_error=False,
+                    kind='cubic', fill_value=(hotbf_vals[0], hotbf_vals[-1]))
+                hoten_vect = f_hoten(ene_vect)
+                # recompute in an appropriate range
+                bf_series = pd.Series(
+                    np.trapz(ped_vect[:, np.newaxis]*hoten_vect,
+                             x=ene_vect, axis=0),
+                    index=allspecies)
                 # renormalize for all species and put in dataframe
                 bf_tp_df[pressure][temp] = bf_series/np.sum(bf_series.values)
 
@@ -280,6 +255,46 @@ def merge_bf_rates(bf_tp_dct, ktp_dct):
 ################# useful functions  ###########################################
 
 
+def weighted_ped_sum(peds, weightfactors, ene_vect):
+    """ Sum of energy distributions, each multiplied by its weight factor,
+        interpolated on a new energy vector.
+        All distributions are interpolated linearly on ene_vect and reduced
+        with a single product with the weight factors. If they all share
+        the same energy grid, the weighted sum is instead interpolated with
+        one cubic spline, which is linear in the data.
+        Distributions with 3 points or less are excluded
+
+        :param peds: energy distributions [en: prob(en)]
+        :type peds: list(series(float))
+        :param weightfactors: weight factor of each distribution
+        :type weightfactors: array
+        :param ene_vect: energies of the new distribution
+        :type ene_vect: array
+        :return prob_vect: weighted sum of the distributions on ene_vect
+        :rtype: array
+    """
+    valid = [idx for idx, ped in enumerate(peds) if len(ped) > 3]
+    if not valid:
+        return np.zeros(ene_vect.shape)
+    peds = [peds[idx].sort_index() for idx in valid]
+    weightfactors = np.asarray(weightfactors)[valid]
+
+    hoten = peds[0].index.values
+    if all(np.array_equal(ped.index.values, hoten) for ped in peds[1:]):
+        pedhot = weightfactors @ np.array([ped.values for ped in peds])
+        f_ped_fromhot = interp1d(
+            hoten, pedhot, bounds_error=False,
+            kind='cubic', fill_value=(0., 0.))
+        return f_ped_fromhot(ene_vect)
+
+    # array[starting energy, ene_vect]
+    ped_arr = np.array([
+        np.interp(ene_vect, ped.index.values, ped.values, left=0., right=0.)
+        for ped in peds])
+
+    return weightfactors @ ped_arr
+
+
 def checks_temp_pressure_and_extend(ped_df, hotbf_df):
     """ compare T,P """
     temp_ped, pressure_ped = [ped_df.index, ped_df.columns]
@@ -3,12 +3,11 @@
 """
 
 import copy
-import itertools
 import numpy
 from phydat import phycon
 from chemkin_io.writer import _util as writer_util
 import ratefit
-from automol.inchi import without_stereo
+from mechanalyzer.parser import ich_cache
 
 RC_CAL = phycon.RC_CAL  # universal gas constant in cal/mol-K
 
@@ -257,36 +256,8 @@ def get_rename_instr(mech_spc_dct1, mech_spc_dct2, strip_ste=False):
         :rtype: dct {spc_to_be_renamed1: new_spc_name1, spc_to_be_renamed2: ...}
     """
 
-    rename_instr = {}
-    rename_str = '-zz'
-
-    # Loop through each species in mech1
-    for spc_name1, spc_vals1 in mech_spc_dct1.items():
-        ich1 = spc_vals1['inchi']
-        mlt1 = spc_vals1['mult']
-        chg1 = spc_vals1['charge']
-        # Look for some stereo things
-        if strip_ste:  # strip stereo layer(s) if indicated
-            ich1 = without_stereo(ich1)
-
-        for spc_name2, spc_vals2 in mech_spc_dct2.items():
-            ich2 = spc_vals2['inchi']
-            mlt2 = spc_vals2['mult']
-            chg2 = spc_vals2['charge']
-
-            if strip_ste:  # strip stereo layer(s) if indicated
-                ich2 = without_stereo(ich2)
-
-            # If species are identical
-            if ich1 == ich2 and mlt1 == mlt2 and chg1 == chg2:
-                if spc_name1 != spc_name2:  # if spc names different, add to rename instructions
-                    rename_instr[spc_name2] = spc_name1
-
-            # If species are different but have same name
-            elif spc_name1 == spc_name2:
-                rename_instr[spc_name2] = spc_name2 + rename_str
-
-    return rename_instr
+    return _rename_instr(mech_spc_dct1, mech_spc_dct2, strip_ste=strip_ste,
+                         exc=False, fml=False)
 
 
 def get_rename_instr_v2(mech_spc_dct1, mech_spc_dct2, strip_ste=False):
@@ -300,36 +271,91 @@ def get_rename_instr_v2(mech_spc_dct1, mech_spc_dct2, strip_ste=False):
         :rtype: dct {spc_to_be_renamed1: new_spc_name1, spc_to_be_renamed2: ...}
     """
 
-    rename_instr = {}
+    return _rename_instr(mech_spc_dct1, mech_spc_dct2, strip_ste=strip_ste,
+                         exc=True, fml=True)
+
+
+def _rename_instr(mech_spc_dct1, mech_spc_dct2, strip_ste=False, exc=False, fml=False):
+    """ Gets rename instructions with lookups in a species-identity index of mech_spc_dct1.
+
+        Gives the same result as comparing each species in mech1 with each species in mech2:
+        a species in mech2 that is identical to one in mech1 is renamed to the mech1 name, and
+        a species in mech2 that has the name of a different species in mech1 gets the suffix
+        '-zz'. If several of these apply, the one from the latest species in mech1 wins.
+    """
+
     rename_str = '-zz'
+    spc_idx_dct1 = spc_ident_index(mech_spc_dct1, strip_ste=strip_ste, exc=exc, fml=fml)
+    pos_dct1 = {spc1: pos1 for pos1, spc1 in enumerate(mech_spc_dct1)}
 
-    # Loop through each species in mech1
-    for spc1, spc_dct1 in mech_spc_dct1.items():
-        ich1 = spc_dct1['inchi']
-        mlt1 = spc_dct1['mult']
-        chg1 = spc_dct1['charge']
-        exc1 = spc_dct1['exc_flag']
-        fml1 = spc_dct1['fml']
-
-        # Strip stereo layer(s) if indicated
-        if strip_ste:
-            ich1 = without_stereo(ich1)
-
-        for spc2, spc_dct2 in mech_spc_dct2.items():
-            # If species are identical
-            spc_same = are_spc_same(ich1, mlt1, chg1, exc1, fml1, spc_dct2, 
-                                    strip_ste=strip_ste)
-            if spc_same:
-                if spc1 != spc2:  # if spc names different, add to rename_instr
-                    rename_instr[spc2] = spc1
-
-            # If species are different but have same name
-            elif spc1 == spc2:
-                rename_instr[spc2] = spc2 + rename_str
+    instrs = []  # [(pos of first instr, pos2, spc2, new name)]
+    for pos2, (spc2, spc_dct2) in enumerate(mech_spc_dct2.items()):
+        ident2 = spc_ident_key(spc_dct2, strip_ste=strip_ste, exc=exc, fml=fml)
+        twins1 = spc_idx_dct1.get(ident2, ())
+
+        # Instructions from species that are identical but named differently
+        spc_instrs = [(pos1, spc1) for pos1, spc1 in twins1 if spc1 != spc2]
+        # Instruction from a species that is different but has the same name
+        if spc2 in pos_dct1 and spc2 not in [spc1 for _, spc1 in twins1]:
+            spc_instrs.append((pos_dct1[spc2], spc2 + rename_str))
+
+        if spc_instrs:
+            spc_instrs.sort()
+            instrs.append((spc_instrs[0][0], pos2, spc2, spc_instrs[-1][1]))
+
+    rename_instr = {}
+    for _, _, spc2, new_spc in sorted(instrs):
+        rename_instr[spc2] = new_spc
 
     return rename_instr
 
 
+def spc_ident_key(spc_dct, strip_ste=False, exc=True, fml=True):
+    """ Gets a hashable key describing the chemical identity of a species: the InChI (optionally
+        without stereo), multiplicity, charge, and optionally the exc_flag and formula
+
+        :param spc_dct: identifying information for a single species
+        :type spc_dct: dct
+        :param strip_ste: whether or not to remove the stereo layer(s) from the InChI
+        :type strip_ste: Bool
+        :param exc: whether or not to include the exc_flag
+        :type exc: Bool
+        :param fml: whether or not to include the formula
+        :type fml: Bool
+        :return ident_key: the identity key
+        :rtype: tuple
+    """
+
+    ich = spc_dct['inchi']
+    if strip_ste:
+        ich = ich_cache.without_stereo(ich)
+    ident_key = (ich, spc_dct['mult'], spc_dct['charge'])
+    if exc:
+        ident_key += (spc_dct['exc_flag'],)
+    if fml:
+        ident_key += (tuple(sorted(
+            (elem, count) for elem, count in spc_dct['fml'].items() if count)),)
+
+    return ident_key
+
+
+def spc_ident_index(mech_spc_dct, strip_ste=False, exc=True, fml=True):
+    """ Indexes the species in a mech_spc_dct by their identity keys (see spc_ident_key)
+
+        :param mech_spc_dct: identifying information on species in a mech
+        :type mech_spc_dct: dct {spc1: spc_dct1, spc2: ...}
+        :return spc_idx_dct: the positions and names of species with each identity
+        :rtype: dct {ident_key: [(pos1, spc1), (pos2, spc2), ...]}
+    """
+
+    spc_idx_dct = {}
+    for pos, (spc, spc_dct) in enumerate(mech_spc_dct.items()):
+        ident_key = spc_ident_key(spc_dct, strip_ste=strip_ste, exc=exc, fml=fml)
+        spc_idx_dct.setdefault(ident_key, []).append((pos, spc))
+
+    return spc_idx_dct
+
+
 def are_spc_same(ich1, mlt1, chg1, exc1, fml1, spc_dct2, strip_ste=False):
     """ Compares two species to see if they are the same
 
@@ -366,7 +392,7 @@ def are_spc_same(ich1, mlt1, chg1, exc1, fml1, spc_dct2, strip_ste=False):
 
     # Finally, (maybe) remove the stereo part of the inchi and compare inchis
     if strip_ste:
-        ich2 = without_stereo(ich2)  # this is expensive, so saving for last
+        ich2 = ich_cache.without_stereo(ich2)  # this is expensive, so saving for last
     if ich1 != ich2:
         return False
     return True
@@ -385,22 +411,11 @@ def get_comb_mech_spc_dct(mech_spc_dct1, mech_spc_dct2):
 
     rename_instr = get_rename_instr(mech_spc_dct1, mech_spc_dct2)
     rename_str = '-zz'
+    spc_idx_dct1 = spc_ident_index(mech_spc_dct1, exc=False, fml=False)
     comb_mech_spc_dct = copy.deepcopy(mech_spc_dct1)  # deepcopy = no external changes
     for spc2, spc_dct2 in mech_spc_dct2.items():
-        unique = True
-        ich2 = spc_dct2['inchi']
-        mlt2 = spc_dct2['mult']
-        chg2 = spc_dct2['charge']
-
-        for spc_dct1 in mech_spc_dct1.values():
-            ich1 = spc_dct1['inchi']
-            mlt1 = spc_dct1['mult']
-            chg1 = spc_dct1['charge']
-
-            if ich1 == ich2 and mlt1 == mlt2 and chg1 == chg2:
-                if spc2 in rename_instr:
-                    unique = False
-                break
+        ident2 = spc_ident_key(spc_dct2, exc=False, fml=False)
+        unique = not (ident2 in spc_idx_dct1 and spc2 in rename_instr)
 
         if unique:
             if spc2 in rename_instr:
@@ -460,6 +475,7 @@ def rename_species(target_dct, rename_instr, target_type='rxn'):
         )
     renamed_dct = {}
     ste_dct = {}
+    renamed_rxn_idx = RxnIndex()
 
     # If a rxn_ktp_dct
     if target_type == 'rxn':
@@ -495,12 +511,13 @@ def rename_species(target_dct, rename_instr, target_type='rxn'):
             new_prds = tuple(new_prds)
             new_third_bods = tuple(new_third_bods)
             # See if new reaction is already in the renamed dct
-            match, _ = assess_rxn_match((new_rcts, new_prds, new_third_bods), renamed_dct)
+            match, _ = assess_rxn_match((new_rcts, new_prds, new_third_bods), renamed_rxn_idx)
             if match:
                 ste_dct[match].append((rcts, prds, third_bods))
             else:
                 renamed_dct[new_rcts, new_prds, new_third_bods] = target_dct[rcts, prds, third_bods]
                 ste_dct[new_rcts, new_prds, new_third_bods] = [(rcts, prds, third_bods),]
+                renamed_rxn_idx.add((new_rcts, new_prds, new_third_bods))
 
         # Remove any rxns in ste_dct that only have one item in the list;
         # these are reactions without any stereo reactions
@@ -577,8 +594,9 @@ def reverse_rxn_ktp_dct(rxn_ktp_dct1, rxn_ktp_dct2, spc_therm_dct1, temps, rev_r
         :type rev_rates: Bool
     """
     rev_rxn_ktp_dct2 = copy.deepcopy(rxn_ktp_dct2)  # deepcopy to prevent external changes
+    rxn_idx2 = RxnIndex(rxn_ktp_dct2)
     for rxn1 in rxn_ktp_dct1.keys():  # search through all rxns in rxn_ktp_dct1
-        rxn2, rev_rate = assess_rxn_match(rxn1, rxn_ktp_dct2)
+        rxn2, rev_rate = assess_rxn_match(rxn1, rxn_idx2)
         # Only do something if a match was found
         if rxn2 is not None:
             # If the user indicated to reverse rates, check if they need to be
@@ -648,72 +666,147 @@ def assess_rxn_match(rxn1, rxn_ktp_dct2):
         matching rxn name and whether the rxn should be flipped
 
         Note: it is possible that a poorly constructed mechanism will have more than one instance
-        of the same reaction. This function will only return the first instance of any matching
+        of the same reaction. This function will only return the last instance of any matching
         reaction. However, it will print out a warning if duplicate matching reactions are
         found.
 
+        When searching for many reactions, pass a RxnIndex of mech2 instead of the rxn_ktp_dct so
+        that each search is a dictionary lookup rather than a scan of all of mech2.
+
         :param rxn1: rxn key for which a match is being sought
         :type rxn1: tuple (rcts, prds, third_bods)
-        :param rxn_ktp_dct2: rxn_ktp_dct for mech2
-        :type rxn_ktp_dct2: dict {rxn1: ktp_dct1, rxn2: ...}
+        :param rxn_ktp_dct2: rxn_ktp_dct for mech2, or a RxnIndex built from it
+        :type rxn_ktp_dct2: dict {rxn1: ktp_dct1, rxn2: ...} or RxnIndex
         :return matching_rxn: rxn key of matching reaction; None if no match
         :rtype: tuple (rcts, prds, third_bods)
         :return rev_rate: whether or not the rate should be reversed
         :rtype: Bool
     """
 
-    def check_third_bod(third_bod1, third_bod2):
-        """ Checks if two third bodies are the same. Accounts for the case
-            where one is None and the other is '(+M)'
+    if isinstance(rxn_ktp_dct2, RxnIndex):
+        rxn_idx2 = rxn_ktp_dct2
+    else:
+        rxn_idx2 = RxnIndex(rxn_ktp_dct2)
+
+    return rxn_idx2.match(rxn1)
+
+
+class RxnIndex:
+    """ Index of the rxns in a mechanism, keyed on a canonical form of each rxn: the sorted
+        reactants, the sorted products, and the third body (where None and '(+M)' are treated
+        as the same). Forward and reverse matches of a rxn are found with dictionary lookups.
+
+        Rxns can be added and removed so that the index can follow a dct as it is changed.
+    """
+
+    def __init__(self, rxns=()):
+        """ :param rxns: rxn keys to index (e.g., a rxn_ktp_dct or rxn_param_dct)
+            :type rxns: iterable of tuples (rcts, prds, third_bods)
+        """
+        self.canon_dct = {}  # {canon_rxn: {rxn: position}}
+        self.position = 0  # insertion counter, used to mimic the order of a dct
+        for rxn in rxns:
+            self.add(rxn)
+
+    @staticmethod
+    def canonical(rxn, reverse=False):
+        """ Gets the canonical form of a rxn key
+
+            :param rxn: rxn key
+            :type rxn: tuple (rcts, prds, third_bods)
+            :param reverse: whether to get the canonical form of the reverse rxn
+            :type reverse: Bool
+            :return canon_rxn: canonical form of the rxn
+            :rtype: tuple (sorted rcts, sorted prds, third_bod)
         """
+        rcts, prds, third_bods = rxn
+        third_bod = third_bods[0]
+        if third_bod is None:
+            third_bod = '(+M)'
+        if reverse:
+            rcts, prds = prds, rcts
 
-        if third_bod1 == third_bod2:
-            are_same = True
-        elif third_bod1 is None and third_bod2 == '(+M)':
-            are_same = True
-        elif third_bod1 == '(+M)' and third_bod2 is None:
-            are_same = True
-        else:
-            are_same = False
-
-        return are_same
-
-    # Get all possible orderings of the reactants and products for mech1
-    [rcts1, prds1, third_bods1] = rxn1
-    third_bod1 = third_bods1[0]
-    rcts1_perm = list(itertools.permutations(rcts1, len(rcts1)))
-    prds1_perm = list(itertools.permutations(prds1, len(prds1)))
-
-    matching_rxn_name = None
-    rev_rate = None
-    already_found = False
-    for rxn2 in rxn_ktp_dct2.keys():
-        [rcts2, prds2, third_bods2] = rxn2
-        third_bod2 = third_bods2[0]
-        same_third_bod = check_third_bod(third_bod1, third_bod2)
-        if rcts2 in rcts1_perm and prds2 in prds1_perm and same_third_bod:
-            matching_rxn_name = rxn2
-            rev_rate = False
-            if already_found:
-                rxn_name1 = writer_util.format_rxn_name(rxn1)
-                rxn_name2 = writer_util.format_rxn_name(rxn2)
-                print(f'For the reaction {rxn_name1}, more than one match was found: {rxn_name2}')
-                print('This will cause errors!')
-            else:
-                already_found = True
+        return (tuple(sorted(rcts)), tuple(sorted(prds)), third_bod)
+
+    def add(self, rxn):
+        """ Adds a rxn to the index
+        """
+        canon_rxn = self.canonical(rxn)
+        self.canon_dct.setdefault(canon_rxn, {})[rxn] = self.position
+        self.position += 1
 
-        elif rcts2 in prds1_perm and prds2 in rcts1_perm and same_third_bod:
-            matching_rxn_name = rxn2
-            rev_rate = True
-            if already_found:
+    def remove(self, rxn):
+        """ Removes a rxn from the index
+        """
+        canon_rxn = self.canonical(rxn)
+        self.canon_dct[canon_rxn].pop(rxn)
+        if not self.canon_dct[canon_rxn]:
+            self.canon_dct.pop(canon_rxn)
+
+    def matches(self, rxn1):
+        """ Finds all rxns in the index that match a rxn, either as written or reversed
+
+            :param rxn1: rxn key for which matches are being sought
+            :type rxn1: tuple (rcts, prds, third_bods)
+            :return matches: matching rxns and whether each is reversed, in insertion order
+            :rtype: list [(rxn2, rev_rate), ...]
+        """
+        canon_rxn = self.canonical(rxn1)
+        rev_canon_rxn = self.canonical(rxn1, reverse=True)
+        matches = {}
+        if rev_canon_rxn != canon_rxn:
+            for rxn2, position in self.canon_dct.get(rev_canon_rxn, {}).items():
+                matches[rxn2] = (position, True)
+        for rxn2, position in self.canon_dct.get(canon_rxn, {}).items():
+            matches[rxn2] = (position, False)
+
+        return [(rxn2, rev_rate) for rxn2, (_, rev_rate)
+                in sorted(matches.items(), key=lambda item: item[1][0])]
+
+    def match(self, rxn1):
+        """ Finds the rxn in the index that matches a rxn, either as written or reversed.
+            Prints a warning if more than one match is found; the last match is returned.
+
+            :param rxn1: rxn key for which a match is being sought
+            :type rxn1: tuple (rcts, prds, third_bods)
+            :return matching_rxn: rxn key of matching reaction; None if no match
+            :rtype: tuple (rcts, prds, third_bods)
+            :return rev_rate: whether or not the rate should be reversed
+            :rtype: Bool
+        """
+        matches = self.matches(rxn1)
+        if matches:
+            matching_rxn, rev_rate = matches[-1]
+            for rxn2, _ in matches[1:]:
                 rxn_name1 = writer_util.format_rxn_name(rxn1)
                 rxn_name2 = writer_util.format_rxn_name(rxn2)
                 print(f'For the reaction {rxn_name1}, more than one match was found: {rxn_name2}')
                 print('This will cause errors!')
-            else:
-                already_found = True
+        else:
+            matching_rxn, rev_rate = None, None
 
-    return matching_rxn_name, rev_rate
+        return matching_rxn, rev_rate
+
+    def duplicates(self):
+        """ Finds all sets of rxns in the index that match each other
+
+            :return dup_rxns: sets of matching rxns
+            :rtype: list [[rxn1, rxn2, ...], ...]
+        """
+        dup_rxns = []
+        checked = set()
+        for canon_rxn, rxn_dct in self.canon_dct.items():
+            if canon_rxn in checked:
+                continue
+            rev_canon_rxn = (canon_rxn[1], canon_rxn[0], canon_rxn[2])
+            checked.update((canon_rxn, rev_canon_rxn))
+            rxns = list(rxn_dct)
+            if rev_canon_rxn != canon_rxn:
+                rxns += list(self.canon_dct.get(rev_canon_rxn, {}))
+            if len(rxns) > 1:
+                dup_rxns.append(rxns)
+
+        return dup_rxns
 
 
 def _calculate_equilibrium_constant(spc_therm_dct, rcts, prds, temps):
@@ -4,8 +4,8 @@ Calculate rates with various fitting functions
 
 import copy
 import numpy
+from numpy.polynomial.chebyshev import chebvander
 from phydat import phycon
-from scipy.special import eval_chebyt
 
 RC = phycon.RC_CAL  # gas constant in cal/(mol.K)
 RC2 = phycon.RC_ATM  # gas constant in cm^3.atm/(mol.K)
@@ -26,14 +26,380 @@ def eval_rxn_param_dct(rxn_param_dct, temps_lst, pressures, tref=1.0):
     """
 
     temps_lst = check_p_t(temps_lst, pressures)  # enforce formatting rules
+
+    # If all pressures share one temp array, evaluate the whole mech at once
+    temps = temps_lst[0]
+    if all(numpy.array_equal(_temps, temps) for _temps in temps_lst):
+        rxns, ktp_arr, defined = _eval_rxn_param_arr(
+            rxn_param_dct, temps, pressures, tref=tref)
+        rxn_ktp_dct = ktp_arr_to_rxn_ktp_dct(
+            rxns, ktp_arr, temps, pressures, defined=defined)
+    else:
+        rxn_ktp_dct = {}
+        for rxn, params in rxn_param_dct.items():
+            ktp_dct = eval_params(params, temps_lst, pressures, tref=tref)
+            rxn_ktp_dct[rxn] = ktp_dct
+
+    return rxn_ktp_dct
+
+
+def eval_rxn_param_arr(rxn_param_dct, temps, pressures, tref=1.0):
+    """ Evaluates k(T,P) for all rxns in a rxn_param_dct at once. Rxns are
+        grouped by functional form and the parameters of each group are
+        packed into arrays, so that each form is evaluated over the entire
+        T,P grid in a single pass.
+
+        Entries of the returned array follow the same conventions as the
+        ktp_dcts from eval_params: Arrhenius rates are only given at 'high'
+        (or at the last pressure if 'high' is absent), PLOG and Chebyshev
+        rates are not given at 'high', and any entry not defined by the fits
+        of a rxn is NaN.
+
+        :param rxn_param_dct: rate parameters for all rxns in a mech
+        :type rxn_param_dct: dict {rxn: params}
+        :param temps: temperature array used to get k(T,P)s (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures used to get k(T,P)s (atm)
+        :type pressures: list
+        :param tref: reference temperature used for modified Arrhenius (K)
+        :type tref: float
+        :return rxns: rxn keys, in the order of the first axis of ktp_arr
+        :rtype: tuple
+        :return ktp_arr: k(T,P)s for all rxns, pressures, and temps
+        :rtype: numpy.ndarray of shape (nrxn, npressure, ntemp)
+    """
+
+    rxns, ktp_arr, _ = _eval_rxn_param_arr(
+        rxn_param_dct, temps, pressures, tref=tref)
+
+    return rxns, ktp_arr
+
+
+def ktp_arr_to_rxn_ktp_dct(rxns, ktp_arr, temps, pressures, defined=None):
+    """ Converts the output of eval_rxn_param_arr into a rxn_ktp_dct
+
+        :param rxns: rxn keys, in the order of the first axis of ktp_arr
+        :type rxns: tuple
+        :param ktp_arr: k(T,P)s for all rxns, pressures, and temps
+        :type ktp_arr: numpy.ndarray of shape (nrxn, npressure, ntemp)
+        :param temps: temperature array used to get k(T,P)s (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures used to get k(T,P)s (atm)
+        :type pressures: list
+        :param defined: which (rxn, pressure) entries to keep; if not given,
+            entries that are NaN at all temps are dropped
+        :type defined: numpy.ndarray of shape (nrxn, npressure)
+        :return rxn_ktp_dct: k(T,Ps) at all temps and pressures for each rxn
+        :rtype: dict {rxn: ktp_dct}
+    """
+
+    if defined is None:
+        defined = ~numpy.all(numpy.isnan(ktp_arr), axis=2)
+
     rxn_ktp_dct = {}
-    for rxn, params in rxn_param_dct.items():
-        ktp_dct = eval_params(params, temps_lst, pressures, tref=tref)
+    for ridx, rxn in enumerate(rxns):
+        ktp_dct = {}
+        for pidx, pressure in enumerate(pressures):
+            if defined[ridx, pidx]:
+                ktp_dct[pressure] = (temps, ktp_arr[ridx, pidx])
         rxn_ktp_dct[rxn] = ktp_dct
 
     return rxn_ktp_dct
 
 
+def _eval_rxn_param_arr(rxn_param_dct, temps, pressures, tref=1.0):
+    """ Does the work for eval_rxn_param_arr; additionally returns a Boolean
+        array of shape (nrxn, npressure) that flags the defined entries
+    """
+
+    rxns = tuple(rxn_param_dct.keys())
+    form_dct = _group_by_form(rxn_param_dct)
+    temps = numpy.asarray(temps, dtype=float)
+
+    # Get the pressure indices used by each of the functional forms
+    pidxs = numpy.arange(len(pressures))
+    if 'high' in pressures:
+        high_idx = pressures.index('high')
+        arr_pidxs = numpy.array([high_idx])
+    else:
+        high_idx = None
+        arr_pidxs = numpy.array([len(pressures) - 1])
+    low_pidxs = pidxs[pidxs != high_idx]
+    low_pressures = numpy.array(
+        [pressures[pidx] for pidx in low_pidxs], dtype=float)
+
+    ksums = numpy.zeros((len(rxns), len(pressures), len(temps)))
+    defined = numpy.zeros((len(rxns), len(pressures)), dtype=bool)
+
+    def _add(ridxs, form_pidxs, kts):
+        """ Adds kts of shape (ncontrib, nform_pressure, ntemp) to the sums
+        """
+        if len(ridxs) > 0 and len(form_pidxs) > 0:
+            ridxs = numpy.array(ridxs)
+            numpy.add.at(ksums, (ridxs[:, None], form_pidxs[None, :]), kts)
+            defined[ridxs[:, None], form_pidxs[None, :]] = True
+
+    if form_dct['arr']:
+        ridxs, arr_tuples_lst = zip(*form_dct['arr'])
+        kts = arr_arr(arr_tuples_lst, temps, tref)
+        _add(ridxs, arr_pidxs, kts[:, None, :])
+
+    if form_dct['plog']:
+        ridxs, plog_dcts = zip(*form_dct['plog'])
+        kts = plog_arr(plog_dcts, temps, low_pressures, tref=tref)
+        _add(ridxs, low_pidxs, kts)
+
+    if form_dct['cheb']:
+        ridxs, cheb_dcts = zip(*form_dct['cheb'])
+        kts = cheb_arr(cheb_dcts, temps, low_pressures)
+        _add(ridxs, low_pidxs, kts)
+
+    for form in ('troe', 'lind'):
+        if form_dct[form]:
+            ridxs, fall_dcts = zip(*form_dct[form])
+            highp_kts = arr_arr(
+                [dct['highp_arr'] for dct in fall_dcts], temps, tref)
+            lowp_kts = arr_arr(
+                [dct['lowp_arr'] for dct in fall_dcts], temps, tref)
+            troe_params_lst = (
+                [dct['troe_params'] for dct in fall_dcts]
+                if form == 'troe' else None)
+            kts = falloff_arr(highp_kts, lowp_kts, temps, low_pressures,
+                              troe_params_lst=troe_params_lst)
+            _add(ridxs, low_pidxs, kts)
+            if high_idx is not None:
+                _add(ridxs, numpy.array([high_idx]), highp_kts[:, None, :])
+
+    ktp_arr = numpy.where(defined[:, :, None], ksums, numpy.nan)
+
+    return rxns, ktp_arr, defined
+
+
+def _group_by_form(rxn_param_dct):
+    """ Sorts the fits of all rxns by functional form, including any
+        duplicates of a single form (see handle_duplicates)
+
+        :return form_dct: (rxn index, fit) pairs for each functional form
+        :rtype: dict {form: [(ridx, fit), ...]}
+    """
+
+    form_dct = {'arr': [], 'plog': [], 'cheb': [], 'troe': [], 'lind': []}
+    for ridx, params in enumerate(rxn_param_dct.values()):
+        forms = params.get_existing_forms()
+        assert forms != (), 'The params object is empty'
+        for form in forms:
+            form_dct[form].append((ridx, getattr(params, form)))
+        # Arrhenius is absent since its dups are stored in params.arr
+        _, dup_counts = params.check_for_dups()
+        for form, dup_count in dup_counts.items():
+            if form in ('plog', 'cheb', 'troe', 'lind'):
+                dup_fits = getattr(params, f'{form}_dups')
+                for dup_idx in range(dup_count):
+                    form_dct[form].append((ridx, dup_fits[dup_idx]))
+
+    return form_dct
+
+
+def arr_arr(arr_tuples_lst, temps, tref, rval=RC):
+    """ Calculates k(T)s for many sets of Arrhenius parameters at once. All
+        Arrhenius tuples are packed into a single (ntuple, 3) table, and the
+        k(T)s of tuples belonging to the same set are summed.
+
+        :param arr_tuples_lst: Arrhenius fit parameters for each set
+        :type arr_tuples_lst: list [((A1, n1, Ea1), (A2, n2, Ea2), ...), ...]
+        :param temps: temperature array used to get k(T)s (K)
+        :type temps: numpy.ndarray
+        :param tref: reference temperature used for modified Arrhenius (K)
+        :type tref: float
+        :return kts: k(T)s for each set of parameters
+        :rtype: numpy.ndarray of shape (nset, ntemp)
+    """
+
+    temps = numpy.asarray(temps, dtype=float)
+    owners = []
+    for set_idx, arr_tuples in enumerate(arr_tuples_lst):
+        for arr_tuple in arr_tuples:
+            assert len(arr_tuple) == 3, (
+                f'Length of Arrhenius tuple should be 3, not {len(arr_tuple)}')
+        owners.extend([set_idx] * len(arr_tuples))
+    arr_table = numpy.array(
+        [arr_tuple for arr_tuples in arr_tuples_lst for arr_tuple in arr_tuples],
+        dtype=float).reshape(-1, 3)
+
+    a_pars, n_pars, ea_pars = (arr_table[:, idx, None] for idx in range(3))
+    tuple_kts = (a_pars * (temps/tref)**n_pars *
+                 numpy.exp(-ea_pars/(rval*temps)))
+    kts = numpy.zeros((len(arr_tuples_lst), len(temps)))
+    numpy.add.at(kts, numpy.array(owners, dtype=int), tuple_kts)
+
+    return kts
+
+
+def plog_arr(plog_dcts, temps, pressures, tref=1.0):
+    """ Calculates k(T,P)s for many PLOG fits at once. The PLOG pressures of
+        all fits are packed into one grid (padded with NaN), and the
+        interpolation between bracketing pressures is done for all fits and
+        pressures together. As in plog, pressures outside the range of a fit
+        are set to the nearest PLOG pressure.
+
+        :param plog_dcts: Arrhenius fitting parameters at several pressures
+        :type plog_dcts: list [{pressure: arr_tuples}, ...]
+        :param temps: temperature array used to get k(T,P)s (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures used to get k(T,P)s (atm); no 'high'
+        :type pressures: numpy.ndarray
+        :param tref: reference temperature used for modified Arrhenius (K)
+        :type tref: float
+        :return kts: k(T,P)s for each fit
+        :rtype: numpy.ndarray of shape (nfit, npressure, ntemp)
+    """
+
+    nfit = len(plog_dcts)
+    npres = max(len(plog_dct) for plog_dct in plog_dcts)
+    pressures = numpy.asarray(pressures, dtype=float)
+
+    # Build the grid of PLOG pressures and the k(T)s at each one
+    plog_ps = numpy.full((nfit, npres), numpy.nan)
+    arr_tuples_lst = []
+    for fidx, plog_dct in enumerate(plog_dcts):
+        plog_pressures = sorted(plog_dct.keys())
+        plog_ps[fidx, :len(plog_pressures)] = plog_pressures
+        arr_tuples_lst.extend(
+            [plog_dct[pressure] for pressure in plog_pressures] +
+            [()] * (npres - len(plog_pressures)))
+    plog_kts = arr_arr(arr_tuples_lst, temps, tref).reshape(nfit, npres, -1)
+
+    # Put pressures into the range of each fit
+    pcs = numpy.clip(pressures[None, :],
+                     numpy.nanmin(plog_ps, axis=1)[:, None],
+                     numpy.nanmax(plog_ps, axis=1)[:, None])
+
+    # Use the PLOG params directly if the pressure is one of the PLOG pressures
+    close = numpy.isclose(pcs[:, :, None], plog_ps[:, None, :], rtol=1.0e-2)
+    is_close = numpy.any(close, axis=2)
+    close_idxs = npres - 1 - numpy.argmax(close[:, :, ::-1], axis=2)
+
+    # Otherwise, find the two PLOG pressures that bracket the pressure
+    with numpy.errstate(invalid='ignore'):
+        high_idxs = numpy.sum(plog_ps[:, None, :] < pcs[:, :, None], axis=2)
+    high_idxs = numpy.where(is_close, close_idxs, high_idxs)
+    low_idxs = numpy.where(is_close, close_idxs, high_idxs - 1)
+    low_ps = numpy.take_along_axis(plog_ps, low_idxs, axis=1)
+    high_ps = numpy.take_along_axis(plog_ps, high_idxs, axis=1)
+    low_kts = numpy.take_along_axis(plog_kts, low_idxs[:, :, None], axis=1)
+    high_kts = numpy.take_along_axis(plog_kts, high_idxs[:, :, None], axis=1)
+
+    # Interpolate log(k) linearly in log(P); log10 instead of ln; no difference
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        pres_terms = ((numpy.log10(pcs) - numpy.log10(low_ps)) /
+                      (numpy.log10(high_ps) - numpy.log10(low_ps)))
+        log_kts = (
+            numpy.log10(low_kts) +
+            ((numpy.log10(high_kts) - numpy.log10(low_kts)) *
+             pres_terms[:, :, None])
+        )
+        kts = numpy.where(is_close[:, :, None], low_kts, 10**log_kts)
+
+    return kts
+
+
+def cheb_arr(cheb_dcts, temps, pressures):
+    """ Calculates k(T,P)s for many Chebyshev fits at once. The alpha
+        matrices of all fits are stacked into one tensor (padded with zeros),
+        and log k(T,P) is obtained by contracting it with the Chebyshev basis
+        matrices of all fits (see cheb_log_kts) in a single pass.
+
+        :param cheb_dcts: Chebyshev fits, each with 'alpha', 'tlim', 'plim'
+        :type cheb_dcts: list [dict, ...]
+        :param temps: temperature array used to get k(T,P)s (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures used to get k(T,P)s (atm); no 'high'
+        :type pressures: numpy.ndarray
+        :return kts: k(T,P)s for each fit
+        :rtype: numpy.ndarray of shape (nfit, npressure, ntemp)
+    """
+
+    nfit = len(cheb_dcts)
+    temps = numpy.asarray(temps, dtype=float)
+    pressures = numpy.asarray(pressures, dtype=float)
+
+    # Stack the alpha matrices and get the limits of each fit
+    nrows = max(numpy.shape(dct['alpha'])[0] for dct in cheb_dcts)
+    ncols = max(numpy.shape(dct['alpha'])[1] for dct in cheb_dcts)
+    alphas = numpy.zeros((nfit, nrows, ncols))
+    tlims = numpy.zeros((nfit, 2))
+    plims = numpy.zeros((nfit, 2))
+    for fidx, cheb_dct in enumerate(cheb_dcts):
+        alpha = numpy.asarray(cheb_dct['alpha'], dtype=float)
+        alphas[fidx, :alpha.shape[0], :alpha.shape[1]] = alpha
+        tlims[fidx] = cheb_dct['tlim']
+        plims[fidx] = cheb_dct['plim']
+
+    # Contract the basis matrices of each fit with its alpha matrix
+    ctemps = _cheb_ctemps(temps[None, :], (tlims[:, 0, None], tlims[:, 1, None]))
+    cpresses = _cheb_cpresses(pressures[None, :],
+                              (plims[:, 0, None], plims[:, 1, None]))
+    log_kts = numpy.einsum('ftj,fjk,fpk->fpt',
+                           chebvander(ctemps, nrows - 1), alphas,
+                           chebvander(cpresses, ncols - 1))
+
+    return 10**log_kts
+
+
+def falloff_arr(highp_kts, lowp_kts, temps, pressures, troe_params_lst=None,
+                collid_factor=1.0):
+    """ Calculates k(T,P)s for many Lindemann or Troe fits at once
+
+        :param highp_kts: high-P limit k(T)s for each fit
+        :type highp_kts: numpy.ndarray of shape (nfit, ntemp)
+        :param lowp_kts: low-P limit k(T)s for each fit
+        :type lowp_kts: numpy.ndarray of shape (nfit, ntemp)
+        :param temps: temperature array used to get k(T,P)s (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures used to get k(T,P)s (atm); no 'high'
+        :type pressures: numpy.ndarray
+        :param troe_params_lst: 3 or 4 Troe coefficients for each fit; if
+            None, the Lindemann expression is used
+        :type troe_params_lst: list [list, ...]
+        :param collid_factor: collider efficiency factor
+        :type collid_factor: float
+        :return kts: k(T,P)s for each fit
+        :rtype: numpy.ndarray of shape (nfit, npressure, ntemp)
+    """
+
+    temps = numpy.asarray(temps, dtype=float)
+    pressures = numpy.asarray(pressures, dtype=float)
+    highp_kts = highp_kts[:, None, :]
+    pr_terms = _pr_term(highp_kts, lowp_kts[:, None, :], temps[None, None, :],
+                        pressures[None, :, None], collid_factor=collid_factor)
+    kts = highp_kts * (pr_terms / (1.0 + pr_terms))
+
+    if troe_params_lst is not None:
+        troe_table = numpy.full((len(troe_params_lst), 4), numpy.nan)
+        for fidx, troe_params in enumerate(troe_params_lst):
+            troe_table[fidx, :len(troe_params)] = [
+                numpy.nan if param is None else param for param in troe_params]
+        alpha, ts3, ts1, ts2 = (troe_table[:, idx, None] for idx in range(4))
+
+        # Calculate Fcent term; a missing T** (None or NaN) is skipped
+        f_cent = ((1.0 - alpha) * numpy.exp(-temps / ts3) +
+                  alpha * numpy.exp(-temps / ts1))
+        f_cent += numpy.where(
+            numpy.isnan(ts2), 0.0, numpy.exp(-numpy.nan_to_num(ts2) / temps))
+        log_f_cent = numpy.log10(f_cent)[:, None, :]
+
+        # Calculate the Log F term and the F broadening term
+        c_val = -0.4 - 0.67 * log_f_cent
+        n_val = 0.75 - 1.27 * log_f_cent
+        d_val = 0.14
+        val = ((numpy.log10(pr_terms) + c_val) /
+               (n_val - d_val * (numpy.log10(pr_terms) + c_val)))**2
+        logf = (1.0 + val)**(-1) * log_f_cent
+        kts = kts * 10**(logf)
+
+    return kts
+
+
 def eval_params(params, temps_lst, pressures, tref=1.0):
     """ Look through a params and evaluate k(T,P) based on the contents.
         Return a ktp_dct.
@@ -292,56 +658,53 @@ def cheb(alpha, tlim, plim, temps_lst, pressures):
         :rtype: dict {pressure: (temps, kts)}
     """
 
-    def cheb_one_p(alpha, tlim, plim, temps, pressure):
-        """ Calculates T,P-dependent rate constants [k(T,P)]s using
-            a Chebyshev functional expression, at a single pressure,
-            across several temperatures.
-
-            :param temps: temperature array used to get k(T)s (K)
-            :type temps: numpy.ndarray
-            :return kts: k(T)s at the given pressure
-            :rtype: numpy.ndarray
-            (other inputs unchanged from parent function)
-        """
-
-        tmin, tmax = tlim
-        pmin, pmax = plim
-        logp = numpy.log10(pressure)
-        logpmin = numpy.log10(pmin)
-        logpmax = numpy.log10(pmax)
-        alpha_nrows, alpha_ncols = alpha.shape
-
-        kts = numpy.zeros(len(temps))
-        for i, temp in enumerate(temps):
-            ctemp = (
-                (2.0 * temp**(-1) - tmin**(-1) - tmax**(-1)) /
-                (tmax**(-1) - tmin**(-1)))
-            cpress = (
-                (2.0 * logp - logpmin - logpmax) /
-                (logpmax - logpmin))
-
-            log_kt = 0.0
-            for j in range(alpha_nrows):
-                for k in range(alpha_ncols):
-                    log_kt += (alpha[j][k] * eval_chebyt(j, ctemp) *
-                               eval_chebyt(k, cpress))
-
-            kts[i] = 10**(log_kt)
-
-        return kts
-
     # Remove 'high' from pressures and the corresponding temperature array
     temps_lst, pressures = remove_high(temps_lst, pressures)
 
     ktp_dct = {}
-    for pidx, pressure in enumerate(pressures):
-        temps = temps_lst[pidx]
-        kts = cheb_one_p(alpha, tlim, plim, temps, pressure)
-        ktp_dct[pressure] = (temps, kts)
+    if pressures and all(numpy.array_equal(temps, temps_lst[0])
+                         for temps in temps_lst):
+        # Get all temps and pressures with one product of the basis matrices
+        log_kts = cheb_log_kts(alpha, tlim, plim, temps_lst[0], pressures)
+        for pidx, pressure in enumerate(pressures):
+            ktp_dct[pressure] = (temps_lst[pidx], 10**log_kts[:, pidx])
+    else:
+        for pidx, pressure in enumerate(pressures):
+            temps = temps_lst[pidx]
+            log_kts = cheb_log_kts(alpha, tlim, plim, temps, [pressure])
+            ktp_dct[pressure] = (temps, 10**log_kts[:, 0])
 
     return ktp_dct
 
 
+def cheb_log_kts(alpha, tlim, plim, temps, pressures):
+    """ Calculates log10 k(T,P)s from a Chebyshev functional expression.
+        The Chebyshev basis matrices are built once for the reduced
+        temperatures and pressures, so that log10 k(T,P) at every temperature
+        and pressure is given by the product T_basis @ alpha @ P_basis.T.
+
+        :param alpha: Chebyshev coefficient matrix
+        :type alpha: numpy.ndarray
+        :param tlim: minimum and maximum temperatures of the Chebyshev model
+        :type tlim: list [tmin, tmax]
+        :param plim: minimum and maximum pressures of the Chebyshev model
+        :type plim: list [pmin, pmax]
+        :param temps: temperature array used to get k(T,P)s (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures used to get k(T,P)s (atm); no 'high'
+        :type pressures: list
+        :return log_kts: log10 k(T,P)s
+        :rtype: numpy.ndarray of shape (ntemp, npressure)
+    """
+
+    alpha = numpy.asarray(alpha, dtype=float)
+    alpha_nrows, alpha_ncols = alpha.shape
+    t_basis = chebvander(_cheb_ctemps(temps, tlim), alpha_nrows - 1)
+    p_basis = chebvander(_cheb_cpresses(pressures, plim), alpha_ncols - 1)
+
+    return t_basis @ alpha @ p_basis.T
+
+
 def troe(highp_arr, lowp_arr, troe_params, temps_lst, pressures,
          collid_factor=1.0, tref=1.0):
     """ Calculates T,P-dependent rate constants [k(T,P)]s using
@@ -664,6 +1027,22 @@ def _pr_term(highp_kts, lowp_kts, temps, pressure, collid_factor=1.0, rval=RC2):
     return pr_term
 
 
+def _cheb_ctemps(temps, tlim):
+    """ Maps temperatures onto the [-1, 1] domain of a Chebyshev fit
+    """
+    tmin, tmax = tlim
+    return ((2.0 / numpy.asarray(temps, dtype=float) - 1.0 / tmin - 1.0 / tmax) /
+            (1.0 / tmax - 1.0 / tmin))
+
+
+def _cheb_cpresses(pressures, plim):
+    """ Maps pressures onto the [-1, 1] domain of a Chebyshev fit
+    """
+    logpmin, logpmax = numpy.log10(plim[0]), numpy.log10(plim[1])
+    logps = numpy.log10(numpy.asarray(pressures, dtype=float))
+    return (2.0 * logps - logpmin - logpmax) / (logpmax - logpmin)
+
+
 def read_rxn_ktp_dct(rxn_ktp_dct, rxn, pressure, val):
     """ Reads the entries of a rxn_ktp_dct for a single rxn and single pressure
 
@@ -54,6 +54,8 @@ class PEDModels:
         self.ene1_vect = None
         self.rho_rovib_prod1 = None
         self.rho_non1 = None
+        self.dos_den = None
+        self.dos_cache = {}
         self.ene_dos0 = None
         self.f_rho_rovib_prod1 = None
         self.f_rho_rovib_prod2 = None
@@ -183,68 +185,57 @@ class PEDModels:
 
         def init_dos(pressure, temp):
             """ initialize variables for DOS calculation
+                the convolutions only depend on the energy grid, and the
+                translational dos only scales with T/P: they are computed
+                once per grid and cached
             """
-            rho_rovib_prod1 = self.f_rho_rovib_prod1(self.ene1_vect)
-            ene1_vect_w0 = np.concatenate((np.array([0]), self.ene1_vect))
-            rho_rovib_prod2 = self.f_rho_rovib_prod2(ene1_vect_w0)
-            rho_trasl = dos_trasl(
-                self.mw_dct[self.prod1],
-                ene1_vect_w0,
-                pressure*101325,
-                temp, mass2=self.mw_dct[self.prod2])
-
-            # calculate rho_non1(ene1_vect)
-            rho_non1 = []
-            for idx in self.ene1_vect:
-                # first iter should be 0
-                # the sum of the energies in rhovib_prod2 and
-                # rho_trasl is always ene1
-                idx_ene_int = np.arange(0, idx+1, dtype=int)
-                idx_ene_minus_ene_int = idx_ene_int[::-1]
-                rho_non1_integrand = (
-                    rho_rovib_prod2[idx_ene_int] *
-                    rho_trasl[idx_ene_minus_ene_int]
-                )
-                rho_non1.append(np.trapz(rho_non1_integrand,
-                                         x=self.ene1_vect[idx_ene_int]))
-
-            rho_non1 = np.array(rho_non1)
-
-            return rho_rovib_prod1, rho_non1
+            grid_key = np.asarray(self.ene1_vect).tobytes()
+            if grid_key not in self.dos_cache:
+                rho_rovib_prod1 = self.f_rho_rovib_prod1(self.ene1_vect)
+                ene1_vect_w0 = np.concatenate((np.array([0]), self.ene1_vect))
+                rho_rovib_prod2 = self.f_rho_rovib_prod2(ene1_vect_w0)
+                # trasl dos at T = 1 K, P = 1 Pa
+                rho_trasl = dos_trasl(
+                    self.mw_dct[self.prod1],
+                    ene1_vect_w0,
+                    1., 1., mass2=self.mw_dct[self.prod2])
+                ene_step = ((self.ene1_vect[-1]-self.ene1_vect[0]) /
+                            (len(self.ene1_vect)-1))
+
+                # calculate rho_non1(ene1_vect): the sum of the energies in
+                # rhovib_prod2 and rho_trasl is always ene1
+                # the energy values are used as upper indexes of the integral
+                idx_ene_int = np.ceil(self.ene1_vect+1).astype(int) - 1
+                rho_non1 = conv_trapz(
+                    rho_rovib_prod2, rho_trasl, ene_step)[idx_ene_int]
+
+                # denominators of dos(ene1; ene): integral of
+                # rho1(ene1)*rhonon1(ene-ene1) over ene1<ene (fixed ene)
+                dos_den = conv_trapz(rho_rovib_prod1, rho_non1, ene_step)
+                dos_den = np.concatenate(([0.], dos_den[:-1]))
+
+                self.dos_cache[grid_key] = (rho_rovib_prod1, rho_non1, dos_den)
+
+            rho_rovib_prod1, rho_non1, dos_den = self.dos_cache[grid_key]
+            trasl_factor = temp/(pressure*101325)
+
+            return rho_rovib_prod1, rho_non1*trasl_factor, dos_den*trasl_factor
 
         def dos(idx_ene1, idx_ene_new):
             """ Calculate density of states """
 
-            prob_ene1ene = []
-            # loops over total energy:
-            # loop over the idxs where you find enetot in ene1vect
-            for idx_ene in idx_ene_new:
+            # for each total energy ene in idx_ene_new:
+            # rho1(ene1)*rhonon1(ene-ene1)/int(rho1*rhonon1, ene1<ene)
+            # 0 if ene1 = ene or if the denominator is 0
+            prob_ene1ene = np.zeros(len(idx_ene_new))
+            idx_ene_minus_ene1 = idx_ene_new - 1 - idx_ene1
+            den = self.dos_den[idx_ene_new]
+            nonzero = (idx_ene_minus_ene1 >= 0) & (den != 0)
+            prob_ene1ene[nonzero] = (
+                self.rho_rovib_prod1[idx_ene1] *
+                self.rho_non1[idx_ene_minus_ene1[nonzero]] /
+                den[nonzero])
 
-                if idx_ene1 == idx_ene:
-                    # rho1(ene1)*rhonon1(ene-ene1) = 0
-                    prob_ene1ene.append(0)
-                    continue
-                # index of ene1<ene (fixed ene)
-                idx_ene1_array = np.arange(0, idx_ene)
-                # index of ene-ene1 (fixed ene)
-                idx_ene_minus_ene1_array = idx_ene1_array[::-1]
-                rho1_ene1 = self.rho_rovib_prod1[idx_ene1]
-                rho_non1 = self.rho_non1[idx_ene_minus_ene1_array[idx_ene1]]
-                # rho1(ene1) with ene1<ene (fixed ene)
-                rho1_ene1_array = self.rho_rovib_prod1[idx_ene1_array]
-                # rhonon1(ene-ene1) with ene1<ene (fixed ene)
-                rho_non1_array = self.rho_non1[idx_ene_minus_ene1_array]
-                num = rho1_ene1 * rho_non1
-                den = np.trapz(rho1_ene1_array*rho_non1_array,
-                               x=self.ene1_vect[idx_ene1_array])
-                # if for some reason you get den=0: append 0 as value
-                if den == 0:
-                    prob_ene1ene.append(0)
-                else:
-                    prob_ene1ene.append(num/den)
-
-            prob_ene1ene = np.array(prob_ene1ene)
-            # print(prob_ene1ene)
             return prob_ene1ene
 
         def dostherm_rhovibtrasl(idx_ene_vect, temp):
@@ -318,8 +309,8 @@ class PEDModels:
                         ped_series = ped_series.iloc[:-1]
 
                     if distr_type == 'dos':
-                        self.rho_rovib_prod1, self.rho_non1 = init_dos(
-                            pressure, temp)
+                        (self.rho_rovib_prod1, self.rho_non1,
+                         self.dos_den) = init_dos(pressure, temp)
 
                     prob_ene1_vect = []
 
@@ -618,6 +609,27 @@ def max_en_auto(n_atoms, ene_bw, ref_ene=0, T=2500):
     return max_ene
 
 
+def conv_trapz(rho1, rho2, ene_step):
+    """ Discrete convolution of two dos on the same uniform energy grid
+        starting from 0, integrated with the trapezoidal rule:
+        conv[n] = int_0^ene_n rho1(ene)*rho2(ene_n-ene) dene
+        :param rho1, rho2: dos on the energy grid
+        :type rho1, rho2: array
+        :param ene_step: step of the energy grid
+        :type ene_step: float
+        :return conv: convolution at the first min(len(rho1), len(rho2))
+            energies of the grid
+        :rtype: array
+    """
+    nene = min(len(rho1), len(rho2))
+    rho1, rho2 = rho1[:nene], rho2[:nene]
+    conv = np.convolve(rho1, rho2)[:nene]
+    # trapezoidal rule: remove half of the first and last terms
+    conv -= 0.5*(rho1[0]*rho2 + rho1*rho2[0])
+
+    return conv*ene_step
+
+
 def dos_trasl(mass1, ene_grid, pressure, temp, mass2=0):
     """ Compute the translational density of states per unit volume
         mass1, mass2: MW in kg/mol
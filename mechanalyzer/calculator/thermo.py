@@ -22,31 +22,96 @@ def create_spc_therm_dct(spc_nasa7_dct, temps, rval=RC):
         :rtype: dct {spc1: therm_array1, spc2: ...}
     """
 
+    spcs, cfts_arr, temp_lims = pack_nasa7_arr(spc_nasa7_dct)
+    temps = numpy.array(temps, dtype=float)
+    h_arr, cp_arr, s_arr, g_arr = eval_nasa7_arr(
+        cfts_arr, temp_lims, temps, rval=rval)
+
+    # Report all species with thermo outside of their valid range at once
+    bad_spcs = [spc for sidx, spc in enumerate(spcs)
+                if numpy.any(numpy.isnan(h_arr[sidx]))]
+    if bad_spcs:
+        print(f'Failed to calculate thermo at some temps for {len(bad_spcs)} '
+              f'species due to invalid temps: {", ".join(bad_spcs)}')
+
     spc_therm_dct = {}
-    for spc, nasa7_params in spc_nasa7_dct.items():
-        h_t, cp_t, s_t, g_t, = [], [], [], []
-        for temp in temps:
-            h_t.append(enthalpy(nasa7_params, temp, rval=rval))
-            cp_t.append(heat_capacity(nasa7_params, temp, rval=rval))
-            s_t.append(entropy(nasa7_params, temp, rval=rval))
-            g_t.append(gibbs(nasa7_params, temp, rval=rval))
-
-            if not all((h_t[-1], cp_t[-1], s_t[-1], g_t[-1])):
-                print(f'Failed to calculate thermo at {temp} K for {spc} due '
-                      'to an invalid temp.')
-
-        # Convert to numpy arrays
-        temps = numpy.array(temps, dtype=float)
-        h_t = numpy.array(h_t, dtype=float)
-        cp_t = numpy.array(cp_t, dtype=float)
-        s_t = numpy.array(s_t, dtype=float)
-        g_t = numpy.array(g_t, dtype=float)
-
-        spc_therm_dct[spc] = (temps, h_t, cp_t, s_t, g_t)
+    for sidx, spc in enumerate(spcs):
+        spc_therm_dct[spc] = (temps, h_arr[sidx], cp_arr[sidx],
+                              s_arr[sidx], g_arr[sidx])
 
     return spc_therm_dct
 
 
+def pack_nasa7_arr(spc_nasa7_dct):
+    """ Packs the NASA-7 polynomials of all species into arrays
+
+        :param spc_nasa7_dct: NASA-7 polynomial information for each species
+        :type spc_nasa7_dct: dct {spc1: nasa7_dct1, spc2: ...}
+        :return spcs: species names, in the order of the first axis of arrays
+        :rtype: tuple
+        :return cfts_arr: low-T (index 0) and high-T (index 1) coefficients
+        :rtype: numpy.ndarray of shape (nspc, 2, 7)
+        :return temp_lims: low, high, and mid temperatures of each polynomial
+        :rtype: numpy.ndarray of shape (nspc, 3)
+    """
+
+    spcs = tuple(spc_nasa7_dct.keys())
+    cfts_arr = numpy.zeros((len(spcs), 2, 7))
+    temp_lims = numpy.zeros((len(spcs), 3))
+    for sidx, nasa7_params in enumerate(spc_nasa7_dct.values()):
+        temp_lims[sidx] = nasa7_params[3]  # order is odd but correct
+        cfts_arr[sidx, 0] = nasa7_params[4][1]
+        cfts_arr[sidx, 1] = nasa7_params[4][0]
+
+    return spcs, cfts_arr, temp_lims
+
+
+def eval_nasa7_arr(cfts_arr, temp_lims, temps, rval=RC):
+    """ Calculates the enthalpy, heat capacity, entropy, and Gibbs free energy
+        of many species at many temperatures at once. The low-T or high-T
+        coefficients are picked for each species and temperature with a mask,
+        and values at temperatures outside of the valid range are NaN.
+
+        :param cfts_arr: low-T and high-T coefficients (see pack_nasa7_arr)
+        :type cfts_arr: numpy.ndarray of shape (nspc, 2, 7)
+        :param temp_lims: low, high, and mid temperatures of each polynomial
+        :type temp_lims: numpy.ndarray of shape (nspc, 3)
+        :param temps: temperatures at which to do calculations (K)
+        :type temps: numpy.ndarray
+        :param rval: universal gas constant (units decided by the user)
+        :type rval: float
+        :return: arrays of h, cp, s, and g (units same as rval)
+        :rtype: tuple of numpy.ndarrays of shape (nspc, ntemp)
+    """
+
+    temps = numpy.asarray(temps, dtype=float)
+    low_temps, high_temps, mid_temps = (temp_lims[:, idx, None]
+                                        for idx in range(3))
+
+    # Select the coefficients for each species and temperature
+    use_high = temps > mid_temps
+    cfts = numpy.where(use_high[:, :, None],
+                       cfts_arr[:, 1, None, :], cfts_arr[:, 0, None, :])
+    valid = (low_temps <= temps) & (temps <= high_temps)
+
+    # Evaluate the polynomials; tpows holds T^0 to T^4
+    tpows = temps[:, None] ** numpy.arange(5)
+    cp_t = numpy.sum(cfts[..., :5] * tpows, axis=-1)
+    h_t = (numpy.sum(cfts[..., :5] * tpows / numpy.arange(1, 6), axis=-1) +
+           cfts[..., 5] / temps)
+    s_t = (cfts[..., 0] * numpy.log(temps) +
+           numpy.sum(cfts[..., 1:5] * tpows[:, 1:] / numpy.arange(1, 5),
+                     axis=-1) +
+           cfts[..., 6])
+
+    h_t = numpy.where(valid, h_t * rval * temps, numpy.nan)
+    cp_t = numpy.where(valid, cp_t * rval, numpy.nan)
+    s_t = numpy.where(valid, s_t * rval, numpy.nan)
+    g_t = h_t - s_t * temps
+
+    return h_t, cp_t, s_t, g_t
+
+
 def enthalpy(nasa7_params, temp, rval=RC):
     """ Calculate the enthalpy of a species using the
         coefficients of its NASA-7 polynomial.
@@ -5,6 +5,8 @@ calculates derived quantities from the strings of the species
 from mechanalyzer.parser import pes
 from mechanalyzer.parser import spc
 from mechanalyzer.parser import mech
+from mechanalyzer.parser import cache
+from mechanalyzer.parser import ich_cache
 from mechanalyzer.parser._bld import build_input_file
 from mechanalyzer.parser.ckin_ import load_spc_therm_dct
 from mechanalyzer.parser.ckin_ import parse_pes_dct
@@ -14,6 +16,8 @@ __all__ = [
     'pes',
     'spc',
     'mech',
+    'cache',
+    'ich_cache',
     'build_input_file',
     'load_spc_therm_dct',
     'parse_pes_dct'
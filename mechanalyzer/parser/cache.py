@@ -0,0 +1,251 @@
+""" On-disk cache of the dictionaries parsed from mechanism files
+
+    Entries are keyed by a hash of the bytes of the parsed file together
+    with the name of the loader and its options, so an entry is never reused
+    once the file changes. Entries are stored as compressed pickles and the
+    least recently used ones are removed when the cache grows past its size
+    limit.
+"""
+
+import os
+import zlib
+import pickle
+import hashlib
+import tempfile
+
+CACHE_DIR = os.environ.get(
+    'MECHANALYZER_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'mechanalyzer'))
+MAX_CACHE_SIZE = 512 * 1024**2  # bytes
+CACHE_VERSION = 1  # increase whenever the layout of the parsed dcts changes
+SUFFIX = '.pkz'
+
+
+def cached_load(loader, filename, path, cache_dir=None,
+                max_size=MAX_CACHE_SIZE, **options):
+    """ Calls loader(filename, path, **options), reusing the result of an
+        earlier call on the same file contents and options if one is cached
+
+        :param loader: function that reads and parses the file
+        :type loader: function
+        :param filename: name of the file to be read
+        :type filename: str
+        :param path: directory with file
+        :type path: str
+        :param cache_dir: cache directory; defaults to CACHE_DIR
+        :type cache_dir: str
+        :param max_size: size limit of the cache directory (bytes)
+        :type max_size: int
+        :param options: keyword arguments passed on to the loader
+        :return: the object returned by the loader
+    """
+
+    loader_name = f'{loader.__module__}.{loader.__name__}'
+    key = cache_key(file_hash(filename, path), loader_name, **options)
+    obj = load(key, cache_dir=cache_dir)
+    if obj is None:
+        obj = loader(filename, path, **options)
+        store(key, obj, cache_dir=cache_dir, max_size=max_size)
+    else:
+        print(f'Loaded {filename} from the cache')
+
+    return obj
+
+
+def file_hash(filename, path):
+    """ Hash of the bytes of a file
+
+        :param filename: name of the file
+        :type filename: str
+        :param path: directory with file
+        :type path: str
+        :return: hex digest of the SHA-256 hash
+        :rtype: str
+    """
+
+    sha = hashlib.sha256()
+    with open(os.path.join(path, filename), 'rb') as fobj:
+        for block in iter(lambda: fobj.read(1024**2), b''):
+            sha.update(block)
+
+    return sha.hexdigest()
+
+
+def cache_key(fhash, loader_name, **options):
+    """ Key of a cache entry
+
+        :param fhash: hash of the contents of the parsed file
+        :type fhash: str
+        :param loader_name: name of the function parsing the file
+        :type loader_name: str
+        :param options: options given to the loader
+        :return: hex digest identifying the entry
+        :rtype: str
+    """
+
+    opt_str = repr(sorted(options.items()))
+    key_str = '\n'.join((str(CACHE_VERSION), fhash, loader_name, opt_str))
+
+    return hashlib.sha256(key_str.encode()).hexdigest()
+
+
+def load(key, cache_dir=None):
+    """ Reads an entry from the cache and marks it as recently used
+
+        :param key: key of the entry
+        :type key: str
+        :param cache_dir: cache directory; defaults to CACHE_DIR
+        :type cache_dir: str
+        :return: the cached object; None if absent or unreadable
+    """
+
+    entry_path = _entry_path(key, cache_dir)
+    obj = read_file(entry_path)
+    if obj is not None:
+        os.utime(entry_path)
+    elif os.path.exists(entry_path):
+        print(f'Removing unreadable cache entry {entry_path}')
+        _remove(entry_path)
+
+    return obj
+
+
+def store(key, obj, cache_dir=None, max_size=MAX_CACHE_SIZE):
+    """ Writes an entry to the cache, then evicts the least recently used
+        entries if the cache is larger than max_size
+
+        :param key: key of the entry
+        :type key: str
+        :param obj: object to be cached; must be picklable
+        :param cache_dir: cache directory; defaults to CACHE_DIR
+        :type cache_dir: str
+        :param max_size: size limit of the cache directory (bytes)
+        :type max_size: int
+    """
+
+    cache_dir = cache_dir or CACHE_DIR
+    if write_file(_entry_path(key, cache_dir), obj):
+        evict(cache_dir=cache_dir, max_size=max_size)
+
+
+def evict(cache_dir=None, max_size=MAX_CACHE_SIZE):
+    """ Removes the least recently used entries until the total size of
+        the cache is at most max_size
+
+        :param cache_dir: cache directory; defaults to CACHE_DIR
+        :type cache_dir: str
+        :param max_size: size limit of the cache directory (bytes)
+        :type max_size: int
+        :return: number of entries removed
+        :rtype: int
+    """
+
+    entries = _entries(cache_dir)
+    total_size = sum(size for _, _, size in entries)
+    nremoved = 0
+    for entry_path, _, size in sorted(entries, key=lambda entry: entry[1]):
+        if total_size <= max_size:
+            break
+        _remove(entry_path)
+        total_size -= size
+        nremoved += 1
+
+    return nremoved
+
+
+def clear(cache_dir=None):
+    """ Removes all entries from the cache
+
+        :param cache_dir: cache directory; defaults to CACHE_DIR
+        :type cache_dir: str
+    """
+
+    for entry_path, _, _ in _entries(cache_dir):
+        _remove(entry_path)
+
+
+def read_file(file_path):
+    """ Reads an object from a file written by write_file
+
+        :param file_path: path of the file
+        :type file_path: str
+        :return: the stored object; None if the file is absent or unreadable
+    """
+
+    obj = None
+    if os.path.exists(file_path):
+        try:
+            with open(file_path, 'rb') as fobj:
+                obj = pickle.loads(zlib.decompress(fobj.read()))
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError,
+                AttributeError, ImportError, IndexError, TypeError,
+                ValueError):
+            obj = None
+
+    return obj
+
+
+def write_file(file_path, obj):
+    """ Writes an object to a file as a compressed pickle. The file is
+        replaced atomically, so readers never see a partially written file.
+        Failures to write are reported but not raised, since the stored
+        files are only an optimization.
+
+        :param file_path: path of the file
+        :type file_path: str
+        :param obj: object to be stored; must be picklable
+        :return: whether the file was written
+        :rtype: bool
+    """
+
+    file_dir = os.path.dirname(os.path.abspath(file_path))
+    tmp_path = None
+    try:
+        os.makedirs(file_dir, exist_ok=True)
+        data = zlib.compress(
+            pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        fdesc, tmp_path = tempfile.mkstemp(dir=file_dir, suffix='.tmp')
+        with os.fdopen(fdesc, 'wb') as fobj:
+            fobj.write(data)
+        os.replace(tmp_path, file_path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as err:
+        print(f'Unable to write {file_path}: {err}')
+        if tmp_path is not None and os.path.exists(tmp_path):
+            _remove(tmp_path)
+        return False
+
+    return True
+
+
+def _entry_path(key, cache_dir):
+    """ Path of the file holding a cache entry
+    """
+    return os.path.join(cache_dir or CACHE_DIR, key + SUFFIX)
+
+
+def _entries(cache_dir):
+    """ (path, last use time, size) of every entry in the cache
+    """
+
+    cache_dir = cache_dir or CACHE_DIR
+    entries = []
+    if os.path.isdir(cache_dir):
+        for name in os.listdir(cache_dir):
+            if name.endswith(SUFFIX):
+                entry_path = os.path.join(cache_dir, name)
+                try:
+                    stat = os.stat(entry_path)
+                except OSError:  # removed by another process
+                    continue
+                entries.append((entry_path, stat.st_mtime, stat.st_size))
+
+    return entries
+
+
+def _remove(entry_path):
+    """ Removes a file, ignoring it if it is already gone
+    """
+    try:
+        os.remove(entry_path)
+    except OSError:
+        pass
@@ -7,9 +7,11 @@ from chemkin_io.parser import thermo as parser_thermo
 from chemkin_io.parser import species as parser_spc
 from mechanalyzer.calculator import rates as calc_rates
 from mechanalyzer.calculator import thermo as calc_thermo
+from mechanalyzer.parser import cache
 
 
-def load_rxn_ktp_dcts(mech_filenames, path, temps_lst, pressures):
+def load_rxn_ktp_dcts(mech_filenames, path, temps_lst, pressures,
+                      use_cache=False):
     """ Read Chemkin mechanism files and calculate rates at the indicated
         pressures and temperatures. Return a list of rxn_ktp_dcts.
 
@@ -21,6 +23,9 @@ def load_rxn_ktp_dcts(mech_filenames, path, temps_lst, pressures):
         :type temps_lst: list [numpy.ndarray1, numpy.ndarray2, ...]
         :param pressures: pressures at which to do calculations (atm)
         :type pressures: list [float]
+        :param use_cache: whether to reuse the parse of an unchanged file
+            from the on-disk cache
+        :type use_cache: Bool
         :return rxn_ktp_dcts: list of rxn_ktp_dcts
         :rtype: list of dcts [rxn_ktp_dct1, rxn_ktp_dct2, ...]
     """
@@ -28,13 +33,14 @@ def load_rxn_ktp_dcts(mech_filenames, path, temps_lst, pressures):
     rxn_ktp_dcts = []
     for mech_filename in mech_filenames:
         print(f'Loading rxn_ktp_dct for the file {mech_filename}...')
-        rxn_ktp_dct = load_rxn_ktp_dct(mech_filename, path, temps_lst, pressures)
+        rxn_ktp_dct = load_rxn_ktp_dct(mech_filename, path, temps_lst,
+                                       pressures, use_cache=use_cache)
         rxn_ktp_dcts.append(rxn_ktp_dct)
 
     return rxn_ktp_dcts
 
 
-def load_rxn_param_dcts(mech_filenames, path):
+def load_rxn_param_dcts(mech_filenames, path, use_cache=False):
     """ Read Chemkin-formatted mechanism files and return a list of
         rxn_param_dcts.
 
@@ -42,6 +48,9 @@ def load_rxn_param_dcts(mech_filenames, path):
         :type mech_filenames: list [filename1, filename2, ...]
         :param path: directory with file
         :type path: str
+        :param use_cache: whether to reuse the parse of an unchanged file
+            from the on-disk cache
+        :type use_cache: Bool
         :return rxn_param_dcts: list of rxn_param_dcts
         :rtype: list of dcts [rxn_param_dct1, rxn_param_dct2, ...]
     """
@@ -49,13 +58,14 @@ def load_rxn_param_dcts(mech_filenames, path):
     rxn_param_dcts = []
     for mech_filename in mech_filenames:
         print(f'Loading rxn_param_dct for the file {mech_filename}...')
-        rxn_param_dct = load_rxn_param_dct(mech_filename, path)
+        rxn_param_dct = load_rxn_param_dct(mech_filename, path,
+                                           use_cache=use_cache)
         rxn_param_dcts.append(rxn_param_dct)
 
     return rxn_param_dcts
 
 
-def load_spc_therm_dcts(thermo_filenames, path, temps):
+def load_spc_therm_dcts(thermo_filenames, path, temps, use_cache=False):
     """ Reads Chemkin thermo files and calculates thermo at the indicated
         temperatures. Outputs a list of spc_therm_dcts.
 
@@ -65,6 +75,9 @@ def load_spc_therm_dcts(thermo_filenames, path, temps):
         :type path: str
         :param temps: temperatures at which to do calculations (K)
         :type temps: numpy.ndarray
+        :param use_cache: whether to reuse the parse of an unchanged file
+            from the on-disk cache
+        :type use_cache: Bool
         :return spc_therm_dcts: list of spc_therm_dcts
         :rtype: list of dcts [spc_therm_dct1, spc_therm_dct2, ...]
     """
@@ -72,13 +85,14 @@ def load_spc_therm_dcts(thermo_filenames, path, temps):
     spc_therm_dcts = []
     for thermo_filename in thermo_filenames:
         print(f'Loading spc_therm_dct for the file {thermo_filename}...')
-        spc_therm_dct = load_spc_therm_dct(thermo_filename, path, temps)
+        spc_therm_dct = load_spc_therm_dct(thermo_filename, path, temps,
+                                           use_cache=use_cache)
         spc_therm_dcts.append(spc_therm_dct)
 
     return spc_therm_dcts
 
 
-def load_spc_nasa7_dcts(thermo_filenames, path):
+def load_spc_nasa7_dcts(thermo_filenames, path, use_cache=False):
     """ Reads Chemkin thermo files and extracts the NASA-7 polynomial
         information. Outputs a list of spc_nasa7_dcts.
 
@@ -86,6 +100,9 @@ def load_spc_nasa7_dcts(thermo_filenames, path):
         :type thermo_filenames: list [filename1, filename2, ...]
         :param path: directory with file(s) (all must be in same directory)
         :type path: str
+        :param use_cache: whether to reuse the parse of an unchanged file
+            from the on-disk cache
+        :type use_cache: Bool
         :return spc_nasa7_dcts: list of spc_nasa7_dcts
         :rtype: list of dcts [spc_nasa7_dct1, spc_nasa7_dct2, ...]
     """
@@ -93,13 +110,15 @@ def load_spc_nasa7_dcts(thermo_filenames, path):
     spc_nasa7_dcts = []
     for thermo_filename in thermo_filenames:
         print(f'Loading spc_nasa7_dct for the file {thermo_filename}...')
-        spc_nasa7_dct = load_spc_nasa7_dct(thermo_filename, path)
+        spc_nasa7_dct = load_spc_nasa7_dct(thermo_filename, path,
+                                           use_cache=use_cache)
         spc_nasa7_dcts.append(spc_nasa7_dct)
 
     return spc_nasa7_dcts
 
 
-def load_rxn_ktp_dct(mech_filename, path, temps_lst, pressures):
+def load_rxn_ktp_dct(mech_filename, path, temps_lst, pressures,
+                     use_cache=False):
     """ Read a Chemkin-formatted mechanism file and
         calculate rates at the indicated pressures and temperatures.
         Return a rxn_ktp_dct.
@@ -112,35 +131,45 @@ def load_rxn_ktp_dct(mech_filename, path, temps_lst, pressures):
         :type temps_lst: list [numpy.ndarray1, numpy.ndarray2, ...]
         :param pressures: pressures at which to do calculations (atm)
         :type pressures: list [float]
+        :param use_cache: whether to reuse the parse of an unchanged file
+            from the on-disk cache
+        :type use_cache: Bool
         :return rxn_ktp_dct: rxn_ktp_dct object
         :rtype: dct {rxn1: ktp_dct1, rxn2: ...}
     """
 
-    rxn_param_dct = load_rxn_param_dct(mech_filename, path)
+    rxn_param_dct = load_rxn_param_dct(mech_filename, path,
+                                       use_cache=use_cache)
     rxn_ktp_dct = calc_rates.eval_rxn_param_dct(rxn_param_dct, temps_lst,
                                                 pressures)
 
     return rxn_ktp_dct
 
 
-def load_rxn_param_dct(mech_filename, path):
+def load_rxn_param_dct(mech_filename, path, use_cache=False):
     """ Read a Chemkin-formatted mechanism file and return a rxn_param_dct.
 
         :param mech_filename: Chemkin mechanism filename
         :type mech_filename: str
         :param path: directory with file
         :type path: str
+        :param use_cache: whether to reuse the parse of an unchanged file
+            from the on-disk cache
+        :type use_cache: Bool
         :return rxn_param_dct: rxn_param_dct object
         :rtype: dct {rxn1: param_tuple1, rxn2: ...}
     """
 
+    if use_cache:
+        return cache.cached_load(load_rxn_param_dct, mech_filename, path)
+
     mech_str = parser.read_file(path, mech_filename, print_debug=True)
     rxn_param_dct = parse_rxn_param_dct(mech_str)
 
     return rxn_param_dct
 
 
-def load_spc_therm_dct(thermo_filename, path, temps):
+def load_spc_therm_dct(thermo_filename, path, temps, use_cache=False):
     """ Reads a Chemkin thermo file and calculates thermo at the indicated
         temperatures. Outputs a spc_therm_dct.
 
@@ -150,17 +179,25 @@ def load_spc_therm_dct(thermo_filename, path, temps):
         :type path: str
         :param temps: temperatures at which to do calculations (K)
         :type temps: numpy.ndarray
+        :param use_cache: whether to reuse the parse of an unchanged file
+            from the on-disk cache
+        :type use_cache: Bool
         :return spc_therm_dct: spc_therm_dct object
         :rtype: dct {spc1: therm_array1, spc2: ...}
     """
 
-    mech_str = parser.read_file(path, thermo_filename, print_debug=True)
-    spc_therm_dct = parse_spc_therm_dct(mech_str, temps)
+    if use_cache:
+        spc_nasa7_dct = load_spc_nasa7_dct(thermo_filename, path,
+                                           use_cache=True)
+        spc_therm_dct = calc_thermo.create_spc_therm_dct(spc_nasa7_dct, temps)
+    else:
+        mech_str = parser.read_file(path, thermo_filename, print_debug=True)
+        spc_therm_dct = parse_spc_therm_dct(mech_str, temps)
 
     return spc_therm_dct
 
 
-def load_spc_nasa7_dct(thermo_filename, path):
+def load_spc_nasa7_dct(thermo_filename, path, use_cache=False):
     """ Reads a Chemkin thermo file and extracts the NASA-7 polynomial
         information. Outputs a spc_nasa7_dct.
 
@@ -168,10 +205,16 @@ def load_spc_nasa7_dct(thermo_filename, path):
         :type thermo_filename: str
         :param path: directory with file
         :type path: str
+        :param use_cache: whether to reuse the parse of an unchanged file
+            from the on-disk cache
+        :type use_cache: Bool
         :return spc_nasa7_dct: spc_nasa7_dct object
         :rtype: dct {spc1: nasa7_dct1, spc2: ...}
     """
 
+    if use_cache:
+        return cache.cached_load(load_spc_nasa7_dct, thermo_filename, path)
+
     mech_str = parser.read_file(path, thermo_filename, print_debug=True)
     spc_nasa7_dct = parse_spc_nasa7_dct(mech_str)
 
@@ -0,0 +1,227 @@
+""" Process-wide memo of the properties derived from InChI and SMILES strings
+
+    Conversions like InChI -> formula or SMILES -> InChI go through RDKit and
+    automol and are repeated for the same strings by the species parsers,
+    the submechanism tools and the renaming functions. Each property is
+    computed once per process and stored under (property name, string).
+    The memo can be written to a file next to a species file so that
+    later runs on the same species start from the stored values.
+"""
+
+import os
+import threading
+import rdkit.Chem as _rd_chem
+import automol.inchi
+import automol.smiles
+from mechanalyzer.parser import cache
+
+CACHE_VERSION = 1  # increase whenever a stored property changes
+SUFFIX = '.ichprops'
+
+_MEMO = {}
+_LOCK = threading.Lock()
+_STATE = {'new': False}  # whether the memo has entries not yet saved
+
+
+# Properties of InChI strings
+def formula(ich):
+    """ Formula dictionary of an InChI (a copy that can be modified)
+
+        :param ich: InChI string
+        :type ich: str
+        :rtype: dict[str: int]
+    """
+    return dict(_memo('formula', ich, automol.inchi.formula))
+
+
+def formula_string(ich):
+    """ Formula string of an InChI
+
+        :param ich: InChI string
+        :type ich: str
+        :rtype: str
+    """
+    return _memo('formula_string', ich, automol.inchi.formula_string)
+
+
+def without_stereo(ich):
+    """ InChI with the stereo layers removed
+
+        :param ich: InChI string
+        :type ich: str
+        :rtype: str
+    """
+    return _memo('without_stereo', ich, automol.inchi.without_stereo)
+
+
+def add_stereo(ich):
+    """ InChI with a stereo assignment added, if it has none
+
+        :param ich: InChI string
+        :type ich: str
+        :rtype: str
+    """
+    return _memo('add_stereo', ich, automol.inchi.add_stereo)
+
+
+def smiles(ich):
+    """ SMILES string of an InChI
+
+        :param ich: InChI string
+        :type ich: str
+        :rtype: str
+    """
+    return _memo('smiles', ich, automol.inchi.smiles)
+
+
+def low_spin_multiplicity(ich):
+    """ Lowest spin multiplicity of an InChI
+
+        :param ich: InChI string
+        :type ich: str
+        :rtype: int
+    """
+    return _memo('low_spin_multiplicity', ich,
+                 automol.inchi.low_spin_multiplicity)
+
+
+def is_complete(ich):
+    """ Whether the stereochemistry of an InChI is complete
+
+        :param ich: InChI string
+        :type ich: str
+    """
+    return _memo('is_complete', ich, automol.inchi.is_complete)
+
+
+def is_valid(ich):
+    """ Whether RDKit can build a molecule from an InChI
+
+        :param ich: InChI string
+        :type ich: str
+        :rtype: bool
+    """
+    return _memo('is_valid', ich,
+                 lambda ich: _rd_chem.MolFromInchi(ich) is not None)
+
+
+# Properties of SMILES strings
+def inchi_from_smiles(smi):
+    """ InChI of a SMILES string
+
+        :param smi: SMILES string
+        :type smi: str
+        :rtype: str
+    """
+    return _memo('inchi_from_smiles', smi, automol.smiles.inchi)
+
+
+def smiles_is_valid(smi):
+    """ Whether RDKit can build a molecule from a SMILES string
+
+        :param smi: SMILES string
+        :type smi: str
+        :rtype: bool
+    """
+    return _memo('smiles_is_valid', smi,
+                 lambda smi: _rd_chem.MolFromSmiles(smi) is not None)
+
+
+# Storage
+def props_filename(filename):
+    """ Name of the file holding the memo for a species file
+
+        :param filename: name of the species file, e.g., species.csv
+        :type filename: str
+        :rtype: str
+    """
+    return filename + SUFFIX
+
+
+def load(filename, path):
+    """ Adds the properties stored in a file to the memo; values already in
+        the memo are kept. A missing, unreadable or outdated file is ignored.
+
+        :param filename: name of the file with the stored properties
+        :type filename: str
+        :param path: directory with file
+        :type path: str
+        :return: number of properties read
+        :rtype: int
+    """
+
+    stored = _read(os.path.join(path, filename))
+    with _LOCK:
+        for key, val in stored.items():
+            _MEMO.setdefault(key, val)
+
+    return len(stored)
+
+
+def save(filename, path):
+    """ Writes the memo to a file, merged with the properties already stored
+        there by other processes. Nothing is written if the memo has no new
+        entries since the last load or save.
+
+        The merge reads the file and then replaces it without a lock, so when
+        several processes save to the same file at once, the entries added
+        by all but the last one may be lost; they are recomputed when needed.
+
+        :param filename: name of the file with the stored properties
+        :type filename: str
+        :param path: directory with file
+        :type path: str
+    """
+
+    if not _STATE['new']:
+        return
+
+    file_path = os.path.join(path, filename)
+    stored = _read(file_path)
+    with _LOCK:
+        stored.update(_MEMO)
+        _STATE['new'] = False
+    cache.write_file(file_path, (CACHE_VERSION, stored))
+
+
+def clear():
+    """ Removes all properties from the memo
+    """
+    with _LOCK:
+        _MEMO.clear()
+        _STATE['new'] = False
+
+
+def _memo(prop, string, fxn):
+    """ Value of fxn(string), computed on the first call only
+    """
+
+    key = (prop, string)
+    if key in _MEMO:
+        return _MEMO[key]
+
+    # Computed outside of the lock; if two threads compute the same value,
+    # the first one stored is kept
+    val = fxn(string)
+    with _LOCK:
+        if key not in _MEMO:
+            _MEMO[key] = val
+            _STATE['new'] = True
+        val = _MEMO[key]
+
+    return val
+
+
+def _read(file_path):
+    """ Properties stored in a file; empty if absent, unreadable or outdated
+    """
+
+    stored = cache.read_file(file_path)
+    if (not isinstance(stored, tuple) or len(stored) != 2
+            or stored[0] != CACHE_VERSION):
+        if os.path.exists(file_path):
+            print(f'Ignoring unreadable or outdated InChI properties file '
+                  f'{file_path}')
+        return {}
+
+    return stored[1]
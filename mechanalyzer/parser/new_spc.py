@@ -5,14 +5,16 @@ Parses a spc.csv file containing species information to obtain a mech_spc_dct
 import csv
 import copy
 from ioformat import pathtools
-from automol.smiles import inchi as smi_to_ich
-from automol.inchi import smiles as ich_to_smi
-from automol.inchi import formula as ich_to_fml
-from automol.inchi import low_spin_multiplicity as _low_spin_mult
-from automol.inchi import is_complete
-from automol.inchi import add_stereo
 from automol.formula import from_string as str_to_fml
-import rdkit.Chem as _rd_chem
+from mechanalyzer.parser import cache
+from mechanalyzer.parser import ich_cache
+from mechanalyzer.parser.ich_cache import inchi_from_smiles as smi_to_ich
+from mechanalyzer.parser.ich_cache import smiles as ich_to_smi
+from mechanalyzer.parser.ich_cache import formula as ich_to_fml
+from mechanalyzer.parser.ich_cache import (
+    low_spin_multiplicity as _low_spin_mult)
+from mechanalyzer.parser.ich_cache import is_complete
+from mechanalyzer.parser.ich_cache import add_stereo
 
 ALLOWED_COLUMN_NAMES = (
     'name',
@@ -39,7 +41,8 @@ TRIP_DCT = {
 
 
 def load_mech_spc_dcts(filenames, path, quotechar="'",
-                       chk_ste=False, chk_match=False):
+                       chk_ste=False, chk_match=False, use_cache=False,
+                       use_ich_cache=False):
     """ Obtains multiple mech_spc_dcts given a list of spc.csv filenames
 
         :param filenames: filenames of the spc.csv file to be read
@@ -50,6 +53,12 @@ def load_mech_spc_dcts(filenames, path, quotechar="'",
         :type chk_ste: Bool
         :param chk_match: whether or not to check that inchis and smiles match
         :type chk_match: Bool
+        :param use_cache: whether to reuse the parse of an unchanged file
+            from the on-disk cache
+        :type use_cache: Bool
+        :param use_ich_cache: whether to read and write the InChI properties
+            stored next to each file
+        :type use_ich_cache: Bool
         :return mech_spc_dcts: list of mech_spc_dcts
         :rtype: list
     """
@@ -60,14 +69,17 @@ def load_mech_spc_dcts(filenames, path, quotechar="'",
         mech_spc_dct = load_mech_spc_dct(filename, path,
                                          quotechar=quotechar,
                                          chk_ste=chk_ste,
-                                         chk_match=chk_match)
+                                         chk_match=chk_match,
+                                         use_cache=use_cache,
+                                         use_ich_cache=use_ich_cache)
         mech_spc_dcts.append(mech_spc_dct)
 
     return mech_spc_dcts
 
 
 def load_mech_spc_dct(filename, path, quotechar="'",
-                      chk_ste=False, chk_match=False):
+                      chk_ste=False, chk_match=False, use_cache=False,
+                      use_ich_cache=False):
     """ Obtains a single mech_spc_dct given a spc.csv filename
 
         :param filename: filename of the spc.csv file to be read
@@ -78,13 +90,32 @@ def load_mech_spc_dct(filename, path, quotechar="'",
         :type chk_ste: Bool
         :param chk_match: whether or not to check that inchis and smiles match
         :type chk_match: Bool
+        :param use_cache: whether to reuse the parse of an unchanged file
+            from the on-disk cache
+        :type use_cache: Bool
+        :param use_ich_cache: whether to read and write the InChI properties
+            stored next to the file (see mechanalyzer.parser.ich_cache)
+        :type use_ich_cache: Bool
         :return mech_spc_dct: identifying information on species in a mech
         :rtype: dct {spc1: spc_dct1, spc2: ...}
     """
 
-    file_str = pathtools.read_file(path, filename, remove_comments='!')
-    mech_spc_dct = parse_mech_spc_dct(file_str, quotechar=quotechar,
-                                      chk_ste=chk_ste, chk_match=chk_match)
+    if use_ich_cache:
+        props_filename = ich_cache.props_filename(filename)
+        ich_cache.load(props_filename, path)
+
+    if use_cache:
+        mech_spc_dct = cache.cached_load(
+            load_mech_spc_dct, filename, path,
+            quotechar=quotechar, chk_ste=chk_ste, chk_match=chk_match)
+    else:
+        file_str = pathtools.read_file(path, filename, remove_comments='!')
+        mech_spc_dct = parse_mech_spc_dct(
+            file_str, quotechar=quotechar,
+            chk_ste=chk_ste, chk_match=chk_match)
+
+    if use_ich_cache:
+        ich_cache.save(props_filename, path)
 
     return mech_spc_dct
 
@@ -349,8 +380,7 @@ def check_ich(ich, spc, chk_ste=True):
 
     error = False
     if 'AMChI' not in ich:
-        mol = _rd_chem.MolFromInchi(ich)
-        if mol is None:
+        if not ich_cache.is_valid(ich):
             print(f"The spc '{spc}' has an invalid InChI, '{ich}'")
             error = True
     else:
@@ -378,8 +408,7 @@ def check_smi(smi, spc):
     """
 
     error = False
-    mol = _rd_chem.MolFromSmiles(smi)
-    if mol is None:
+    if not ich_cache.smiles_is_valid(smi):
         print(f"The spc '{spc}' has an invalid SMILES string, '{smi}'")
         error = True
 
@@ -426,30 +455,17 @@ def check_for_dups(mech_spc_dct, printwarnings=True):
     """ Checks a mech_spc_dct for species that are identical except in name
     """
 
-    def are_spcs_same(spc_dct1, spc_dct2):
-        """ Checks if two species are chemically identical
-        """
-
-        ich1 = spc_dct1['inchi']
-        mlt1 = spc_dct1['mult']
-        chg1 = spc_dct1['charge']
-        exc1 = spc_dct1['exc_flag']
-
-        ich2 = spc_dct2['inchi']
-        mlt2 = spc_dct2['mult']
-        chg2 = spc_dct2['charge']
-        exc2 = spc_dct2['exc_flag']
-
-        same = all([ich1 == ich2, mlt1 == mlt2, chg1 == chg2, exc1 == exc2])
-
-        return same
-
-    spcs = tuple(mech_spc_dct.keys())  # convert to tuple for indexing
-    spc_dcts = tuple(mech_spc_dct.values())
-    for outer_idx, outer_spc in enumerate(spcs):
-        outer_dct = spc_dcts[outer_idx]
-        for inner_idx in range(outer_idx + 1, len(spcs)):
-            inner_spc = spcs[inner_idx]
-            inner_dct = spc_dcts[inner_idx]
-            if are_spcs_same(outer_dct, inner_dct) and printwarnings:
-                print(f'{outer_spc} and {inner_spc} are chemical twins!')
+    # Group the species by chemical identity in a single pass
+    twin_dct = {}
+    for spc, spc_dct in mech_spc_dct.items():
+        ident = (spc_dct['inchi'], spc_dct['mult'], spc_dct['charge'],
+                 spc_dct['exc_flag'])
+        twin_dct.setdefault(ident, []).append(spc)
+
+    if printwarnings:
+        for spc, spc_dct in mech_spc_dct.items():
+            ident = (spc_dct['inchi'], spc_dct['mult'], spc_dct['charge'],
+                     spc_dct['exc_flag'])
+            twins = twin_dct[ident]
+            for twin in twins[twins.index(spc) + 1:]:
+                print(f'{spc} and {twin} are chemical twins!')
@@ -2,8 +2,6 @@
 Extract PES and SUBPESs from a given mechanism
 """
 
-import pandas as pd
-import numpy
 from mechanalyzer.parser._util import order_rct_bystoich
 import automol.inchi
 import automol.formula
@@ -105,73 +103,77 @@ def connected_channels_dct(pes_dct):
 def find_conn_chnls(pes_rct_lst, pes_prd_lst, pes_rxn_name_lst):
     """ Determine all of the connected reaction channels on a PES.
         Information compiled in SUB-PES dictionaries:
-        conndct = {0: [['S1','S2'],['S3','S4'],[S5']], ..}
         connchnls = {0: [0,1,2] , 1:[3,4,5]}...
+
+        Channels are visited by increasing number of species. A channel is
+        connected to a SUB-PES if one of its unimolecular species is a well
+        of the SUB-PES or, for bimol-bimol channels, if both its reactant
+        and product pairs are already in the SUB-PES. SUB-PESs connected by
+        a channel are merged into the oldest one with a union-find.
     """
 
+    def _find(idx):
+        """ root SUB-PES of idx, compressing the path to it
+        """
+        root = idx
+        while parent[root] != root:
+            root = parent[root]
+        while parent[idx] != root:
+            parent[idx], idx = root, parent[idx]
+        return root
+
     # preprocessing:
     # order (bimol) reactants and products in the same fashion
     # example if you have A+B and B+A they will be ordered in the same way
-    pes_rct_lst = order_rct_bystoich(pes_rct_lst)
-    pes_prd_lst = order_rct_bystoich(pes_prd_lst)
-
-    # put everything in a dataframe. indices are the numbers given by enumerate
-    len_rct_prd = numpy.array(list(map(len, pes_rct_lst))) + \
-        numpy.array(list(map(len, pes_prd_lst)))
-    pes_df = pd.DataFrame(
-        numpy.array([pes_rct_lst, pes_prd_lst, len_rct_prd], dtype=object).T,
-        index=numpy.arange(0, len(pes_rxn_name_lst)),
-        columns=['rcts', 'prds', 'N_rcts_prds'])
+    pes_rct_lst = list(map(tuple, order_rct_bystoich(pes_rct_lst)))
+    pes_prd_lst = list(map(tuple, order_rct_bystoich(pes_prd_lst)))
+
     # order by total number of species (N of reactants + N of products)
-    pes_df = pes_df.sort_values(by=['N_rcts_prds', 'rcts', 'prds'])
+    chnl_idxs = sorted(
+        range(len(pes_rxn_name_lst)),
+        key=lambda idx: (len(pes_rct_lst[idx]) + len(pes_prd_lst[idx]),
+                         pes_rct_lst[idx], pes_prd_lst[idx]))
+
     # Split up channels into a connected sub-pes within a formula
-    subpes_idx = 0
-    conndct = {}
+    parent = []  # union-find parent of each SUB-PES ever created
     connchnls = {}
-
-    for chnl_idx in pes_df.index:
-        connected_to = []
-        chnl_species = [list(pes_df['rcts'][chnl_idx]),
-                        list(pes_df['prds'][chnl_idx])]
-
-        for conn_chnls_idx, spc_lst in conndct.items():
-            for spc_pair in chnl_species:
-                if len(spc_pair) == 1 and spc_pair in spc_lst:
-                    # This works for unimol species
-                    # Need also to verify bimol wellskipping channels
-                    if conn_chnls_idx not in connected_to:
-                        connected_to.append(conn_chnls_idx)
-                elif (len(spc_pair) == 1 and
-                      spc_pair[::-1] in spc_lst):
-                    if conn_chnls_idx not in connected_to:
-                        connected_to.append(conn_chnls_idx)
-
-            if len(chnl_species[0]) == 2 and len(chnl_species[1]) == 2:
-                # bimol bimol reactions
-                if ((chnl_species[0] in spc_lst) and
-                        (chnl_species[1] in spc_lst) and
-                        (conn_chnls_idx not in connected_to)):
-                    connected_to.append(conn_chnls_idx)
+    well_subpes = {}  # {(well,): SUB-PES idx}
+    pair_subpes = {}  # {(spc1, spc2): set of SUB-PES idxs}
+
+    for chnl_idx in chnl_idxs:
+        chnl_species = (pes_rct_lst[chnl_idx], pes_prd_lst[chnl_idx])
+
+        connected_to = set()
+        for spc_pair in chnl_species:
+            if len(spc_pair) == 1 and spc_pair in well_subpes:
+                # This works for unimol species
+                connected_to.add(_find(well_subpes[spc_pair]))
+        if len(chnl_species[0]) == 2 and len(chnl_species[1]) == 2:
+            # bimol bimol reactions
+            rct_roots = {_find(idx)
+                         for idx in pair_subpes.get(chnl_species[0], ())}
+            prd_roots = {_find(idx)
+                         for idx in pair_subpes.get(chnl_species[1], ())}
+            connected_to |= rct_roots & prd_roots
 
         if not connected_to:
-            conndct[subpes_idx] = chnl_species
+            subpes_idx = len(parent)
+            parent.append(subpes_idx)
             connchnls[subpes_idx] = [chnl_idx]
-            subpes_idx += 1
         else:
-            conndct[connected_to[0]].extend(chnl_species)
-            connchnls[connected_to[0]].append(chnl_idx)
-            if len(connected_to) > 1:
-                for cidx, cval in enumerate(connected_to):
-                    if cidx > 0:
-                        conn_specs = conndct.pop(cval, None)
-                        conn_chnls = connchnls.pop(cval, None)
-                        conndct[connected_to[0]].extend(conn_specs)
-                        connchnls[connected_to[0]].extend(conn_chnls)
-            for cidx, spc_lst in conndct.items():
-                lst = sorted(spc_lst)
-                lst = [lst[i] for i in range(len(lst))
-                       if i == 0 or lst[i] != lst[i-1]]
-                conndct[cidx] = lst
+            connected_to = sorted(connected_to)
+            subpes_idx = connected_to[0]
+            connchnls[subpes_idx].append(chnl_idx)
+            for cval in connected_to[1:]:
+                parent[cval] = subpes_idx
+                connchnls[subpes_idx].extend(connchnls.pop(cval))
+
+        # Register the wells and bimol pairs of the channel
+        for spc_pair in chnl_species:
+            if len(spc_pair) == 1:
+                well_subpes.setdefault(spc_pair, subpes_idx)
+            elif len(spc_pair) == 2:
+                pair_subpes.setdefault(spc_pair, set()).add(subpes_idx)
 
     return connchnls
 
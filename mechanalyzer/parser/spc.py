@@ -16,6 +16,7 @@ from autorun import timeout, execute_function_in_parallel
 import ioformat.pathtools as text_parser
 import thermfit
 from mechanalyzer.parser.csv_ import csv_dct
+from mechanalyzer.parser import ich_cache
 
 
 # LIST SETTING THE STANDARD ORDER OF HEADERS
@@ -131,12 +132,12 @@ def spc_dct_from_smiles(smiles_lst, stereo=False):
     spc_dct = {}
     for smi in smiles_lst:
         # Generate InChI string and formula
-        ich = automol.smiles.inchi(smi)
+        ich = ich_cache.inchi_from_smiles(smi)
         if stereo:
-            ich = automol.inchi.add_stereo(ich)
+            ich = ich_cache.add_stereo(ich)
 
         # Generate Name
-        fml = automol.inchi.formula_string(ich)
+        fml = ich_cache.formula_string(ich)
         name, fml_count_dct = assign_unique_name(
             fml, fml_count_dct, spc_dct)
 
@@ -155,7 +156,7 @@ def reorder_by_atomcount(spc_dct):
     natom_df = pd.Series(index=list(spc_dct.keys()))
     for key in spc_dct.keys():
         ich = spc_dct[key]['inchi']
-        fml_dct = automol.inchi.formula(ich)
+        fml_dct = ich_cache.formula(ich)
         natoms = automol.formula.atom_count(fml_dct)
         natom_df[key] = natoms
     natom_df = natom_df.sort_values(ascending=True)
@@ -2,23 +2,154 @@
 """
 
 import os
+import shutil
+import tempfile
+import matplotlib.pyplot as plt
 import matplotlib.backends.backend_pdf as plt_pdf
+import PyPDF2
+from autorun import execute_function_in_parallel
 
 
 def build_pdf(figs, filename='output.pdf', path=None):
     """ Produce a PDF with one reaction per page
 
-        :param figs: list of MatPlotLib figure objects
-        :type figs: list [fig1, fig2, ...]
+        The figures are written as they are produced and closed right after,
+        so passing a generator keeps only one figure in memory at a time.
+
+        :param figs: MatPlotLib figure objects; may be a generator
+        :type figs: iterable [fig1, fig2, ...]
         :param filename: filename for the output pdf
         :type filename: str
         :param path: path for the output pdf; default is the current directory
         :type path: str
+        :return npages: number of pages written
+        :rtype: int
     """
     print('Producing PDF...')
     if path is not None:
         filename = os.path.join(path, filename)
-    pdf = plt_pdf.PdfPages(filename)
-    for fig in figs:
-        pdf.savefig(fig)
-    pdf.close()
+    npages = 0
+    with plt_pdf.PdfPages(filename) as pdf:
+        for fig in figs:
+            pdf.savefig(fig)
+            plt.close(fig)
+            npages += 1
+
+    return npages
+
+
+def build_pdf_in_shards(plot_fct, args, items, filename='output.pdf',
+                        path=None, nprocs='auto'):
+    """ Produce a PDF by rendering contiguous chunks of the pages in separate
+        processes, each writing its own PDF shard; the shards are then
+        concatenated in order
+
+        :param plot_fct: generator function called as plot_fct(*args, chunk)
+            that yields one figure per item of the chunk; must be picklable
+        :type plot_fct: function
+        :param args: leading arguments to plot_fct
+        :type args: tuple
+        :param items: items to be plotted, one per page
+        :type items: list
+        :param filename: filename for the output pdf
+        :type filename: str
+        :param path: path for the output pdf; default is the current directory
+        :type path: str
+        :param nprocs: number of processes; 'auto' uses all available
+        :type nprocs: int or str
+        :return npages: number of pages written
+        :rtype: int
+    """
+
+    if nprocs == 'auto':
+        nprocs = os.cpu_count()
+    nshards = max(min(nprocs, len(items)), 1)
+    if nshards == 1:
+        return build_pdf(plot_fct(*args, items), filename=filename, path=path)
+
+    print(f'Producing PDF in {nshards} shards...')
+    if path is not None:
+        filename = os.path.join(path, filename)
+    shard_dir = tempfile.mkdtemp(
+        dir=os.path.dirname(os.path.abspath(filename)))
+    try:
+        # Split the items into contiguous chunks so the shards can simply be
+        # concatenated in order
+        chunk_size = -(-len(items) // nshards)
+        starts = range(0, len(items), chunk_size)
+        shards = [(idx, items[start:start + chunk_size])
+                  for idx, start in enumerate(starts)]
+        shard_files = map_in_agg_processes(
+            _build_pdf_shard, (plot_fct, args, shard_dir), shards,
+            nprocs=nshards)
+        npages = _merge_pdfs(shard_files, filename)
+    finally:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+
+    return npages
+
+
+def map_in_agg_processes(fct, args, items, nprocs):
+    """ Calls fct(*args, item) for each item, splitting the items over
+        several processes that plot with the non-interactive Agg backend
+
+        :param fct: function to be called; must be picklable
+        :type fct: function
+        :param args: leading arguments to fct
+        :type args: tuple
+        :param items: items passed to fct one at a time
+        :type items: list
+        :param nprocs: number of processes
+        :type nprocs: int
+        :return: results of fct, in the order of items
+        :rtype: list
+    """
+
+    idx_results = execute_function_in_parallel(
+        _agg_worker, list(enumerate(items)), (fct, args), nprocs=nprocs)
+
+    return [result for _, result in sorted(idx_results,
+                                           key=lambda pair: pair[0])]
+
+
+def _agg_worker(fct, args, idx_items, output_queue):
+    """ Calls fct(*args, item) for each (index, item) in idx_items and puts
+        the (index, result) pairs on the output queue
+    """
+
+    # Workers never display anything, so use the non-interactive backend
+    plt.switch_backend('agg')
+    output_queue.put(tuple(
+        (idx, fct(*args, item)) for idx, item in idx_items))
+
+
+def _build_pdf_shard(plot_fct, args, shard_dir, shard):
+    """ Write the chunk of an (index, chunk) shard to its own PDF in
+        shard_dir
+    """
+
+    shard_idx, chunk = shard
+    shard_file = os.path.join(shard_dir, f'shard_{shard_idx:05d}.pdf')
+    with plt_pdf.PdfPages(shard_file) as pdf:
+        for fig in plot_fct(*args, chunk):
+            pdf.savefig(fig)
+            plt.close(fig)
+
+    return shard_file
+
+
+def _merge_pdfs(pdf_files, filename):
+    """ Concatenate PDF files into one
+    """
+
+    # PdfFileMerger was renamed PdfMerger in PyPDF2 2.0
+    merger_cls = getattr(PyPDF2, 'PdfMerger', None) or PyPDF2.PdfFileMerger
+    merger = merger_cls()
+    for pdf_file in pdf_files:
+        merger.append(pdf_file)
+    npages = len(merger.pages)
+    with open(filename, 'wb') as fobj:
+        merger.write(fobj)
+    merger.close()
+
+    return npages
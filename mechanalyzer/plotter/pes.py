@@ -2,6 +2,7 @@
 Calls MatPlotLib functionality to create the plot
 """
 
+import os
 import numpy
 import matplotlib
 from matplotlib import pyplot as plt
@@ -9,6 +10,7 @@ import igraph
 import networkx as nx
 # from pyvis.network import Network
 import automol.util
+from mechanalyzer.plotter._util import map_in_agg_processes
 
 
 # Set plotting options
@@ -52,13 +54,17 @@ PLOT_DPI = 1000
 
 
 # MAKE THE PLOT
-def build(ene_dct, conn_lst):
+def build(ene_dct, conn_lst, name=PLOT_NAME, ext=PLOT_EXT):
     """ Make a plot of the PES
 
         :m ene_dct: relative energies for each species
         :type ene_dct: dict[name: energy]
         :m conn_lst: list of all the connections of the PES
         :type conn_lst: lst(str)
+        :m name: base name of the output file image
+        :type name: str
+        :m ext: file extension of the output file image
+        :type ext: str
     """
 
     # Generate the coordinates
@@ -77,7 +83,71 @@ def build(ene_dct, conn_lst):
     _plt_connecting_lines(axes, spc_coord_dct, conn_lst)
 
     # Create the image
-    _create_img(fig)
+    _create_img(fig, name=name, ext=ext)
+
+
+def build_batch(pes_lst, path=None, ext=PLOT_EXT, graph=False, resort=False,
+                nprocs='auto'):
+    """ Make the plots of many PESs, each written to its own file, by
+        splitting the PESs over several processes that draw with the
+        non-interactive Agg backend. Each figure is closed once written.
+
+        :m pes_lst: output name (without extension), relative energies,
+            connections and, optionally, a relabeling of the species of
+            each PES
+        :type pes_lst: list[(str, dict[name: energy], lst, dict)]
+        :m path: directory of the output files; default is the current one
+        :type path: str
+        :m ext: file extension of the output file images
+        :type ext: str
+        :m graph: draw each PES as a graph (see pes_graph) rather than as an
+            energy diagram (see build)
+        :type graph: bool
+        :m resort: reorder the species of the energy diagrams with
+            resort_names first
+        :type resort: bool
+        :m nprocs: number of processes; 'auto' uses all available
+        :type nprocs: int or str
+        :return: names of the output files, in the order of pes_lst
+        :rtype: list(str)
+    """
+
+    jobs = []
+    for name, ene_dct, conn_lst, *label_dct in pes_lst:
+        if path is not None:
+            name = os.path.join(path, name)
+        label_dct = label_dct[0] if label_dct else None
+        jobs.append((name, ene_dct, conn_lst, label_dct))
+
+    if nprocs == 'auto':
+        nprocs = os.cpu_count()
+    nprocs = max(min(nprocs, len(jobs)), 1)
+    if nprocs == 1:
+        file_names = [_build_job(ext, graph, resort, job) for job in jobs]
+    else:
+        file_names = map_in_agg_processes(
+            _build_job, (ext, graph, resort), jobs, nprocs=nprocs)
+
+    return file_names
+
+
+def _build_job(ext, graph, resort, job):
+    """ Plot a single PES of build_batch
+    """
+
+    name, ene_dct, conn_lst, label_dct = job
+    file_name = _create_file_name(name, ext)
+    if graph:
+        pes_graph(conn_lst, ene_dct=ene_dct, label_dct=label_dct,
+                  file_name=file_name)
+    else:
+        if label_dct is not None:
+            ene_dct, conn_lst, _ = _format(ene_dct, conn_lst, label_dct)
+        if resort:
+            ene_dct = resort_names(ene_dct, conn_lst)
+        build(ene_dct, conn_lst, name=name, ext=ext)
+
+    return file_name
 
 
 # FORMAT THE DATA TO PLACE OBJECTS ONTO THE PLOT #
@@ -148,7 +218,6 @@ def _build_axes(axes_obj, y_axis_tlim, y_axis_blim, tick_intvl=5.0):
 
     y_ticks_range = numpy.arange(
         y_axis_blim, y_axis_tlim+tick_intvl, tick_intvl)
-    print('tick range', y_ticks_range)
     axes_obj.set_ylim(bottom=y_axis_blim, top=y_axis_tlim)
     axes_obj.set_yticks(y_ticks_range)
     # axes_obj.yaxis.set_major_formatter(
@@ -231,13 +300,19 @@ def _create_img(fig,
         :type dpi: float
     """
 
-    fig_name = f'{name}.{ext}'.format(name, ext)
+    fig_name = _create_file_name(name, ext)
     fig.set_size_inches(width, height)
     fig.savefig(fig_name, dpi=dpi)
     plt.close(fig)
 
 
 # HELPER FUNCTIONS
+def _create_file_name(name, ext):
+    """ Name of an output file image
+    """
+    return f'{name}.{ext}'
+
+
 def _calc_vshifts(max_ene, min_ene,
                   name_vshift_scalef=NAME_VSHIFT_SCALEF):
     """ Using input from user, determine meters for plot formatting.
@@ -296,21 +371,20 @@ def resort_names(ene_dct, conn_lst):
         so that the plotter can make a plot that is readable
     """
 
-    def _connected_partners(spc, conn_lst):
+    # Partners of each PES part, in the order of conn_lst
+    partner_dct = _partner_dct(conn_lst)
+    # Names already placed in the plot list
+    listed = set()
+
+    def _connected_partners(spc):
         """ Get names of all PES parts that spc is connected to. """
-        conns = []
-        for conn in conn_lst:
-            if spc in conn:
-                lconn, rconn = conn
-                partner = lconn if spc != lconn else rconn
-                conns.append(partner)
-        return conns
+        return partner_dct.get(spc, [])
 
-    def _remove_listed(name_lst, plot_lst):
-        """ Return name_lst entries not already accounted for in plot_lst """
-        return [name for name in name_lst if name not in plot_lst]
+    def _remove_listed(name_lst):
+        """ Return name_lst entries not already in the plot list """
+        return [name for name in name_lst if name not in listed]
 
-    def _unchecked_wells(plot_lst, conn_lst, min_well, side):
+    def _unchecked_wells(plot_lst, min_well, side):
         """ Find any leftward wells in plot list whose connections have not
             been checked.
         """
@@ -327,8 +401,8 @@ def resort_names(ene_dct, conn_lst):
 
         _unchked_wells = []
         for _well in _wells:
-            conn_spc = _connected_partners(_well, conn_lst)
-            conn_spc = _remove_listed(conn_spc, plot_lst)
+            conn_spc = _connected_partners(_well)
+            conn_spc = _remove_listed(conn_spc)
             if conn_spc:
                 _unchked_wells.append(_well)
 
@@ -337,9 +411,8 @@ def resort_names(ene_dct, conn_lst):
     def _add_spc(well, plot_lst, side):
         """ Add barriers and then products to side
         """
-        print(side)
-        conn_spc = _connected_partners(well, conn_lst)
-        conn_spc = _remove_listed(conn_spc, plot_lst)
+        conn_spc = _connected_partners(well)
+        conn_spc = _remove_listed(conn_spc)
         if conn_spc:
             for spc in conn_spc:
                 # Add barrier to list
@@ -347,14 +420,16 @@ def resort_names(ene_dct, conn_lst):
                     plot_lst.insert(0, spc)
                 else:
                     plot_lst.append(spc)
+                listed.add(spc)
                 # Add products (wells or products)
-                conn_spc2 = _connected_partners(spc, conn_lst)
-                conn_spc2 = _remove_listed(conn_spc2, plot_lst)
+                conn_spc2 = _connected_partners(spc)
+                conn_spc2 = _remove_listed(conn_spc2)
                 for spc2 in conn_spc2:
                     if side == 'left':
                         plot_lst.insert(0, spc2)
                     else:
                         plot_lst.append(spc2)
+                listed.update(conn_spc2)
 
         return plot_lst
 
@@ -368,9 +443,10 @@ def resort_names(ene_dct, conn_lst):
             min_ene = ene
             min_well = name
     plot_names.append(min_well)
+    listed.add(min_well)
 
     # Find the barriers the min-well is connected, add to list
-    # conn_spc = _connected_partners(min_well, conn_lst)
+    # conn_spc = _connected_partners(min_well)
     # for i, spc in enumerate(conn_spc):
     #     if (i+1) % 2 == 1:
     #         plot_names.insert(0, spc)
@@ -394,7 +470,7 @@ def resort_names(ene_dct, conn_lst):
     while not left_finished:
         plot_names = _add_spc(left_well, plot_names, 'left')
         unchecked_names = _unchecked_wells(
-            plot_names, conn_lst, min_well, 'left')
+            plot_names, min_well, 'left')
         if unchecked_names:
             left_well = unchecked_names[0]
         else:
@@ -406,7 +482,7 @@ def resort_names(ene_dct, conn_lst):
     while not right_finished:
         plot_names = _add_spc(right_well, plot_names, 'right')
         unchecked_names = _unchecked_wells(
-            plot_names, conn_lst, min_well, 'right')
+            plot_names, min_well, 'right')
         if unchecked_names:
             right_well = unchecked_names[0]
         else:
@@ -415,11 +491,20 @@ def resort_names(ene_dct, conn_lst):
     # Build a new ene_dct with the ordered plot names
     ord_ene_dct = {name: ene_dct[name] for name in plot_names}
 
-    print(plot_names)
-    print(ord_ene_dct)
     return ord_ene_dct
 
 
+def _partner_dct(conn_lst):
+    """ Names of the PES parts each PES part is connected to
+    """
+    partner_dct = {}
+    for lconn, rconn in conn_lst:
+        partner_dct.setdefault(lconn, []).append(rconn)
+        if rconn != lconn:
+            partner_dct.setdefault(rconn, []).append(lconn)
+    return partner_dct
+
+
 # Attempt 2 using graphs #
 # HAS PYLINT ISSUES WITH THE DRAW FUNCTION
 # class GraphArtist(Artist):
@@ -7,6 +7,7 @@ from matplotlib import cm
 from matplotlib.ticker import FormatStrFormatter
 import numpy
 from chemkin_io.writer import _util as writer
+from mechanalyzer.plotter import _util as util
 
 
 LINES = ['-', '--', '-.', ':']  # for plot formatting
@@ -20,6 +21,9 @@ def build_plots(algn_rxn_ktp_dct, mech_names=None, ratio_sort=False):
     """ Build plots of an algn_rxn_ktp_dct, with one reaction per page. Also calculate ratios
         relative to other mechs and plot the ratios. Output a PDF.
 
+        All figures are held in memory; for large mechanisms use gen_plots
+        or write_pdf instead.
+
         :param algn_rxn_ktp_dct: aligned dct containing rates for each mech
         :type algn_rxn_ktp_dct: dct {rxn1: [ktp_dct_mech1, ktp_dct_mech2, ...], rxn2: ...}
         :param mech_names: list of mech_names for plot labeling; default is 'mech1, mech2, ...'
@@ -29,6 +33,78 @@ def build_plots(algn_rxn_ktp_dct, mech_names=None, ratio_sort=False):
         :return figs: list of MatPlotLib figure objects
         :rtype: list [fig1, fig2, ...]
     """
+
+    return list(gen_plots(algn_rxn_ktp_dct, mech_names=mech_names,
+                          ratio_sort=ratio_sort))
+
+
+def gen_plots(algn_rxn_ktp_dct, mech_names=None, ratio_sort=False,
+              max_plots=None):
+    """ Generate the plots of an algn_rxn_ktp_dct one at a time, so that
+        they can be written and closed before the next one is drawn
+
+        :param algn_rxn_ktp_dct: aligned dct containing rates for each mech
+        :type algn_rxn_ktp_dct: dct {rxn1: [ktp_dct_mech1, ktp_dct_mech2, ...], rxn2: ...}
+        :param mech_names: list of mech_names for plot labeling; default is 'mech1, mech2, ...'
+        :type mech_names: list [mech_name1, mech_name2, ...]
+        :param ratio_sort: whether or not to sort plots by the max value of the ratio
+        :type ratio_sort: Bool
+        :param max_plots: maximum number of plots; with ratio_sort, these are
+            the reactions with the largest ratios
+        :type max_plots: int
+        :return: generator of MatPlotLib figure objects
+        :rtype: generator
+    """
+
+    mech_names, format_dct, rxn_items = _prepare_plots(
+        algn_rxn_ktp_dct, mech_names, ratio_sort, max_plots)
+
+    return _plot_rxns(mech_names, format_dct, rxn_items)
+
+
+def write_pdf(algn_rxn_ktp_dct, filename='rates.pdf', path=None,
+              mech_names=None, ratio_sort=False, max_plots=None, nprocs=1):
+    """ Plot an algn_rxn_ktp_dct to a PDF, one reaction per page. Each
+        figure is written and closed as soon as it is drawn, so memory use
+        does not grow with the number of reactions.
+
+        :param algn_rxn_ktp_dct: aligned dct containing rates for each mech
+        :type algn_rxn_ktp_dct: dct {rxn1: [ktp_dct_mech1, ktp_dct_mech2, ...], rxn2: ...}
+        :param filename: filename for the output pdf
+        :type filename: str
+        :param path: path for the output pdf; default is the current directory
+        :type path: str
+        :param mech_names: list of mech_names for plot labeling; default is 'mech1, mech2, ...'
+        :type mech_names: list [mech_name1, mech_name2, ...]
+        :param ratio_sort: whether or not to sort plots by the max value of the ratio
+        :type ratio_sort: Bool
+        :param max_plots: maximum number of plots; with ratio_sort, these are
+            the reactions with the largest ratios
+        :type max_plots: int
+        :param nprocs: number of processes rendering the pages; 'auto' uses
+            all available
+        :type nprocs: int or str
+        :return npages: number of pages written
+        :rtype: int
+    """
+
+    mech_names, format_dct, rxn_items = _prepare_plots(
+        algn_rxn_ktp_dct, mech_names, ratio_sort, max_plots)
+    if nprocs == 1:
+        npages = util.build_pdf(_plot_rxns(mech_names, format_dct, rxn_items),
+                                filename=filename, path=path)
+    else:
+        npages = util.build_pdf_in_shards(
+            _plot_rxns, (mech_names, format_dct), rxn_items,
+            filename=filename, path=path, nprocs=nprocs)
+
+    return npages
+
+
+def _prepare_plots(algn_rxn_ktp_dct, mech_names, ratio_sort, max_plots):
+    """ Get the mech_names, the format_dct and the list of
+        (rxn, ktp_dcts, ratio_dcts) to be plotted, in page order
+    """
     # Get the number of mechanisms
     vals = algn_rxn_ktp_dct.values()
     val_iter = iter(vals)
@@ -55,18 +131,24 @@ def build_plots(algn_rxn_ktp_dct, mech_names=None, ratio_sort=False):
             algn_rxn_ratio_dct, algn_rxn_ktp_dct
         )
 
-    # Loop over each rxn and plot
-    figs = []
     pressures = get_pressures(algn_rxn_ktp_dct)
     format_dct = get_format_dct(pressures)  # defines color and label for each pressure
-    for rxn, ktp_dcts in algn_rxn_ktp_dct.items():
-        ratio_dcts = algn_rxn_ratio_dct[rxn]
+    rxn_items = [(rxn, ktp_dcts, algn_rxn_ratio_dct[rxn])
+                 for rxn, ktp_dcts in algn_rxn_ktp_dct.items()]
+    if max_plots is not None:
+        rxn_items = rxn_items[:max_plots]
+
+    return mech_names, format_dct, rxn_items
+
+
+def _plot_rxns(mech_names, format_dct, rxn_items):
+    """ Yield the figure for each (rxn, ktp_dcts, ratio_dcts) in rxn_items
+    """
+    for rxn, ktp_dcts, ratio_dcts in rxn_items:
         molecularity = get_molecularity(rxn)
         fig, axs = build_fig_and_axs(molecularity, ratio_dcts, mech_names)
         fig = plot_single_rxn(rxn, ktp_dcts, ratio_dcts, fig, axs, mech_names, format_dct)
-        figs.append(fig)
-
-    return figs
+        yield fig
 
 
 def plot_single_rxn(rxn, ktp_dcts, ratio_dcts, fig, axs, mech_names, format_dct):
@@ -4,6 +4,7 @@
 import matplotlib.pyplot as plt
 from matplotlib import cm
 import numpy
+from mechanalyzer.plotter import _util as util
 
 
 LINES = ['-', '--', '-.', ':']  # for plot formatting
@@ -15,6 +16,9 @@ def build_plots(algn_spc_therm_dct, spc_dct=None, mech_names=None, sort=True,
     """ Builds plots of an algn_spc_therm_dct, with one species per page.
         Also plots differences relative to other mechs.
 
+        All figures are held in memory; for large mechanisms use gen_plots
+        or write_pdf instead.
+
         :param algn_spc_therm_dct: aligned dct with thermo for each mech
         :type algn_spc_therm_dct: dct {spc1: [diff_array_mech1,
             diff_array_mech2, ...], spc2: ...}
@@ -32,6 +36,99 @@ def build_plots(algn_spc_therm_dct, spc_dct=None, mech_names=None, sort=True,
         :return figs: list of MatPlotLib figure objects
         :rtype: list [fig1, fig2, ...]
     """
+
+    return list(gen_plots(algn_spc_therm_dct, spc_dct=spc_dct,
+                          mech_names=mech_names, sort=sort,
+                          sort_instr=sort_instr, sort_temp=sort_temp))
+
+
+def gen_plots(algn_spc_therm_dct, spc_dct=None, mech_names=None, sort=True,
+              sort_instr='h', sort_temp=None, max_plots=None):
+    """ Generates the plots of an algn_spc_therm_dct one at a time, so that
+        they can be written and closed before the next one is drawn
+
+        :param algn_spc_therm_dct: aligned dct with thermo for each mech
+        :type algn_spc_therm_dct: dct {spc1: [diff_array_mech1,
+            diff_array_mech2, ...], spc2: ...}
+        :param spc_dct: spc_dct describing all species in algn_spc_therm_dct
+        :type spc_dct: dct {spc1: {spc_info}, spc2: ...}
+        :param mech_names: list of mech_names for plot labeling; default is
+            'mech1, mech2, ...'
+        :type mech_names: list [mech_name1, mech_name2, ...]
+        :param sort: whether or not to sort the plots by difference
+        :type sort: Bool
+        :param sort_instr: instructions for sorting; 'h', 'cp', 's', or 'g'
+        :type sort_instr: None or str
+        :param sort_temp:
+        :type sort_temp:
+        :param max_plots: maximum number of plots; with sort, these are the
+            species with the largest differences
+        :type max_plots: int
+        :return: generator of MatPlotLib figure objects
+        :rtype: generator
+    """
+
+    mech_names, spc_items = _prepare_plots(
+        algn_spc_therm_dct, spc_dct, mech_names, sort, sort_instr, sort_temp,
+        max_plots)
+
+    return _plot_spcs(mech_names, spc_items)
+
+
+def write_pdf(algn_spc_therm_dct, filename='thermo.pdf', path=None,
+              spc_dct=None, mech_names=None, sort=True, sort_instr='h',
+              sort_temp=None, max_plots=None, nprocs=1):
+    """ Plots an algn_spc_therm_dct to a PDF, one species per page. Each
+        figure is written and closed as soon as it is drawn, so memory use
+        does not grow with the number of species.
+
+        :param algn_spc_therm_dct: aligned dct with thermo for each mech
+        :type algn_spc_therm_dct: dct {spc1: [diff_array_mech1,
+            diff_array_mech2, ...], spc2: ...}
+        :param filename: filename for the output pdf
+        :type filename: str
+        :param path: path for the output pdf; default is the current directory
+        :type path: str
+        :param spc_dct: spc_dct describing all species in algn_spc_therm_dct
+        :type spc_dct: dct {spc1: {spc_info}, spc2: ...}
+        :param mech_names: list of mech_names for plot labeling; default is
+            'mech1, mech2, ...'
+        :type mech_names: list [mech_name1, mech_name2, ...]
+        :param sort: whether or not to sort the plots by difference
+        :type sort: Bool
+        :param sort_instr: instructions for sorting; 'h', 'cp', 's', or 'g'
+        :type sort_instr: None or str
+        :param sort_temp:
+        :type sort_temp:
+        :param max_plots: maximum number of plots; with sort, these are the
+            species with the largest differences
+        :type max_plots: int
+        :param nprocs: number of processes rendering the pages; 'auto' uses
+            all available
+        :type nprocs: int or str
+        :return npages: number of pages written
+        :rtype: int
+    """
+
+    mech_names, spc_items = _prepare_plots(
+        algn_spc_therm_dct, spc_dct, mech_names, sort, sort_instr, sort_temp,
+        max_plots)
+    if nprocs == 1:
+        npages = util.build_pdf(_plot_spcs(mech_names, spc_items),
+                                filename=filename, path=path)
+    else:
+        npages = util.build_pdf_in_shards(
+            _plot_spcs, (mech_names,), spc_items, filename=filename,
+            path=path, nprocs=nprocs)
+
+    return npages
+
+
+def _prepare_plots(algn_spc_therm_dct, spc_dct, mech_names, sort, sort_instr,
+                   sort_temp, max_plots):
+    """ Gets the mech_names and the list of (spc, therm_arrays, diff_arrays,
+        smiles, inchi) to be plotted, in page order
+    """
     # Get the number of mechanisms
     vals = algn_spc_therm_dct.values()
     val_iter = iter(vals)
@@ -57,23 +154,29 @@ def build_plots(algn_spc_therm_dct, spc_dct=None, mech_names=None, sort=True,
             algn_spc_diff_dct, algn_spc_therm_dct, sort_instr=sort_instr,
             sort_temp=sort_temp)
 
-    # Loop over each spc and plot
-    figs = []
+    spc_items = []
     for spc, therm_arrays in algn_spc_therm_dct.items():
-        diff_arrays = algn_spc_diff_dct[spc]
-        if spc_dct is not None:
-            if spc_dct.get(spc) is not None:
-                smiles = spc_dct.get(spc).get('smiles')
-                inchi = spc_dct.get(spc).get('inchi')
-                fig, axs = initialize_fig_and_axes(spc, smiles, inchi)
-            else:
-                fig, axs = initialize_fig_and_axes(spc)
-        else:  # if no spc_dct provided, the smiles and inchis will be blank
-            fig, axs = initialize_fig_and_axes(spc)
+        if max_plots is not None and len(spc_items) == max_plots:
+            break
+        # If no spc_dct is provided, the smiles and inchis will be blank
+        smiles, inchi = None, None
+        if spc_dct is not None and spc_dct.get(spc) is not None:
+            smiles = spc_dct.get(spc).get('smiles')
+            inchi = spc_dct.get(spc).get('inchi')
+        spc_items.append(
+            (spc, therm_arrays, algn_spc_diff_dct[spc], smiles, inchi))
+
+    return mech_names, spc_items
+
+
+def _plot_spcs(mech_names, spc_items):
+    """ Yields the figure for each (spc, therm_arrays, diff_arrays, smiles,
+        inchi) in spc_items
+    """
+    for spc, therm_arrays, diff_arrays, smiles, inchi in spc_items:
+        fig, axs = initialize_fig_and_axes(spc, smiles, inchi)
         fig = plot_single_spc(therm_arrays, diff_arrays, fig, axs, mech_names)
-        figs.append(fig)
-
-    return figs
+        yield fig
 
 
 def plot_single_spc(therm_arrays, diff_arrays, fig, axs, mech_names):
@@ -110,6 +110,16 @@ def test_cheb():
     assert np.allclose(calc_rates, CHEB_100ATM_KTS, rtol=1e-3)
 
 
+def test_cheb_log_kts():
+    """ Test the Chebyshev basis-matrix evaluation at several pressures
+    """
+    log_kts = rates.cheb_log_kts(
+        CHEB_DCT['alpha'], CHEB_DCT['tlim'], CHEB_DCT['plim'],
+        TEMPS2[0], PRESSURES_NO_HIGH)
+    assert log_kts.shape == (len(TEMPS2[0]), len(PRESSURES_NO_HIGH))
+    assert np.allclose(10**log_kts[:, -1], CHEB_100ATM_KTS, rtol=1e-3)
+
+
 def test_troe():
     """ Test the Troe calculator
     """
@@ -146,6 +156,38 @@ def test_dup_plog():
     assert np.allclose(calc_rates, 2*PLOG_0_3ATM_KTS, rtol=1e-3)
 
 
+def test_eval_rxn_param_arr():
+    """ Test the batched evaluation of a whole rxn_param_dct
+    """
+    rxn_param_dct = {
+        (('A',), ('B',), (None,)): ARR_PARAMS,
+        (('C',), ('D',), (None,)): PLOG_PARAMS,
+        (('E',), ('F',), (None,)): CHEB_PARAMS,
+        (('G',), ('H',), ('(+M)',)): TROE_PARAMS,
+        (('I',), ('J',), ('(+M)',)): LIND_PARAMS,
+        (('K',), ('L',), (None,)): DUP_PLOG_PARAMS}
+    temps = TEMPS2[0]
+    rxns, ktp_arr = rates.eval_rxn_param_arr(rxn_param_dct, temps, PRESSURES)
+    assert rxns == tuple(rxn_param_dct.keys())
+    assert ktp_arr.shape == (6, len(PRESSURES), len(temps))
+
+    # Arrhenius only at 'high'; PLOG and Chebyshev everywhere but 'high'
+    assert np.all(np.isnan(ktp_arr[0, :-1])) and not np.any(np.isnan(ktp_arr[0, -1]))
+    assert np.all(np.isnan(ktp_arr[1:3, -1]))
+    assert not np.any(np.isnan(ktp_arr[1:, :-1]))
+    assert not np.any(np.isnan(ktp_arr[3:5, -1]))
+    assert np.allclose(ktp_arr[5], 2 * ktp_arr[1], equal_nan=True)
+
+    # Compare against the rxn-by-rxn evaluation
+    temps_lst = rates.check_p_t(TEMPS2, PRESSURES)
+    rxn_ktp_dct = rates.ktp_arr_to_rxn_ktp_dct(rxns, ktp_arr, temps, PRESSURES)
+    for rxn, params in rxn_param_dct.items():
+        ref_ktp_dct = rates.eval_params(params, temps_lst, PRESSURES)
+        assert set(rxn_ktp_dct[rxn].keys()) == set(ref_ktp_dct.keys())
+        for pressure, (_, ref_kts) in ref_ktp_dct.items():
+            assert np.allclose(rxn_ktp_dct[rxn][pressure][1], ref_kts)
+
+
 def test_check_p_t():
     """ Test the enforcement of the P and T array rules
     """
@@ -204,10 +246,12 @@ if __name__ == '__main__':
     test_arr()
     test_plog()
     test_cheb()
+    test_cheb_log_kts()
     test_troe()
     test_lind()
     test_dup_arrhenius()
     test_dup_plog()
+    test_eval_rxn_param_arr()
     test_check_p_t()
     test_read_rxn_ktp_dct()
     test_remove_high()
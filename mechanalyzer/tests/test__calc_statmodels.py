@@ -44,5 +44,42 @@ def test_get_dof_info():
                3., 3., 0.018], atol=1e-4))
 
 
+def test_conv_trapz():
+    """ test mechanalyzer.calculator.statmodels.conv_trapz
+    """
+
+    ene_step = 0.5
+    ene_grid = np.arange(0., 10.5, ene_step)
+    rho1 = np.power(ene_grid, 1.5) + 1.
+    rho2 = np.exp(-0.3*ene_grid)*ene_grid
+
+    conv = mechanalyzer.calculator.statmodels.conv_trapz(
+        rho1, rho2, ene_step)
+    ref_conv = [np.trapz(rho1[:idx+1]*rho2[idx::-1], x=ene_grid[:idx+1])
+                for idx in range(len(ene_grid))]
+    assert np.allclose(conv, ref_conv, rtol=1e-12, atol=0.)
+
+    # rho_non1 of the rovib dos: the translational dos at T = 1 K, P = 1 Pa
+    # scaled by T/P is the same as the one computed at T and P
+    mass1, mass2 = 0.029, 0.002
+    pressure, temp = 10., 1500.
+    rho_rovib = np.power(ene_grid, 2.)
+    rho_trasl = mechanalyzer.calculator.statmodels.dos_trasl(
+        mass1, ene_grid, pressure*101325, temp, mass2=mass2)
+    rho_trasl_unit = mechanalyzer.calculator.statmodels.dos_trasl(
+        mass1, ene_grid, 1., 1., mass2=mass2)
+    trasl_factor = temp/(pressure*101325)
+    assert np.allclose(rho_trasl_unit*trasl_factor, rho_trasl,
+                       rtol=1e-12, atol=0.)
+
+    rho_non1 = mechanalyzer.calculator.statmodels.conv_trapz(
+        rho_rovib, rho_trasl_unit, ene_step)*trasl_factor
+    ref_rho_non1 = [
+        np.trapz(rho_rovib[:idx+1]*rho_trasl[idx::-1], x=ene_grid[:idx+1])
+        for idx in range(len(ene_grid))]
+    assert np.allclose(rho_non1, ref_rho_non1, rtol=1e-12, atol=0.)
+
+
 if __name__ == '__main__':
     test_get_dof_info()
+    test_conv_trapz()
@@ -54,6 +54,26 @@ def test__invalid_temps():
     assert np.isnan(calc_g[2])
 
 
+def test__nasa7_arr():
+    """ Test the array-based thermo calculator for several species
+    """
+    spc_nasa7_dct = {'N2O': SPC_NASA7_DCT['N2O'],
+                     'N2O_copy': SPC_NASA7_DCT['N2O']}
+    spcs, cfts_arr, temp_lims = thermo.pack_nasa7_arr(spc_nasa7_dct)
+    assert spcs == ('N2O', 'N2O_copy')
+    assert cfts_arr.shape == (2, 2, 7)
+    h_arr, cp_arr, s_arr, g_arr = thermo.eval_nasa7_arr(
+        cfts_arr, temp_lims, BAD_TEMPS)
+    for sidx in range(2):
+        assert np.allclose(h_arr[sidx, :2], CORR_H[:2], rtol=1e-3)
+        assert np.allclose(cp_arr[sidx, :2], CORR_CP[:2], rtol=1e-3)
+        assert np.allclose(s_arr[sidx, :2], CORR_S[:2], rtol=1e-3)
+        assert np.allclose(g_arr[sidx, :2], CORR_G[:2], rtol=1e-3)
+    assert np.all(np.isnan(h_arr[:, 2]))
+    assert np.all(np.isnan(g_arr[:, 2]))
+
+
 if __name__ == '__main__':
     test__valid_temps()
     test__invalid_temps()
+    test__nasa7_arr()
@@ -161,6 +161,33 @@ def test__all_checks():
                                rxn_num_threshold)
 
 
+def test__spc_idx():
+    """ Test the build_spc_idx_dct, spc_idx_df, and get_all_checks functions
+    """
+    spc_idx_dct = checker.build_spc_idx_dct(RXN_PARAM_DCT1)
+    assert tuple(spc_idx_dct.keys()) == (
+        'H2', 'O', 'OH', 'H', 'O2', 'O(S)', 'HO2')
+    assert spc_idx_dct['OH']['prds'] == list(RXN_PARAM_DCT1.keys())[:7]
+    assert spc_idx_dct['OH']['rcts'] == []
+    assert spc_idx_dct['OH']['count'] == 8  # OH+OH counts twice
+    assert spc_idx_dct['O(S)']['rxns'] == [
+        (('H2', 'O(S)'), ('OH', 'O'), (None,))]
+    assert spc_idx_dct['O(S)']['thrd_bods'] == [
+        (('H', 'O'), ('OH',), ('+O(S)',))]
+
+    idx_df = checker.spc_idx_df(spc_idx_dct)
+    assert list(idx_df.loc['O2']) == [2, 0, 2, 0, 2]
+    assert list(idx_df.loc['O(S)']) == [1, 0, 1, 1, 1]
+
+    check_dct = checker.get_all_checks(
+        RXN_PARAM_DCT1, RXN_KTP_DCT1, [1e11, 1e15, 1e22], 2,
+        spc_idx_dct=spc_idx_dct)
+    assert check_dct['spc_idx_dct'] is spc_idx_dct
+    assert tuple(check_dct['lone_spcs'].keys()) == ('O2', 'O(S)', 'HO2')
+    assert tuple(check_dct['sources'].keys()) == ('H2', 'O(S)', 'O2')
+    assert tuple(check_dct['duplicates'].values()) == (3,)
+
+
 def test__sources_and_sinks():
     """ Test the get_sources_and_sinks and write_sources_and_sinks functions
     """
@@ -280,6 +307,7 @@ def test__missing_spcs():
 
 if __name__ == '__main__':
     test__all_checks()
+    test__spc_idx()
     test__sources_and_sinks()
     test__negative_rates()
     test__large_rates()
@@ -2,8 +2,11 @@
 """
 
 import os
+import shutil
+import tempfile
 import numpy
 from mechanalyzer.parser import ckin_ as ckin
+from mechanalyzer.parser import cache
 
 
 # Set paths
@@ -82,9 +85,61 @@ def test_parse_rxn_ktp_dct():
         assert numpy.allclose(ktp_dct[10][1], CORRECT_RATES, rtol=1e-2)
 
 
+def test_cached_load():
+    """ Tests loading a rxn_param_dct through the on-disk cache
+    """
+
+    tmp_path = tempfile.mkdtemp()
+    cache_dir = os.path.join(tmp_path, 'cache')
+    shutil.copy(os.path.join(DAT_PATH, MECH_FILENAMES[0]), tmp_path)
+    try:
+        # The first call parses the file and the second reads the cache
+        for _ in range(2):
+            rxn_param_dct = cache.cached_load(
+                ckin.load_rxn_param_dct, MECH_FILENAMES[0], tmp_path,
+                cache_dir=cache_dir)
+            assert tuple(rxn_param_dct.keys()) == CORRECT_RXN
+            assert len(os.listdir(cache_dir)) == 1
+
+        # Changing the file gives a new entry
+        with open(os.path.join(tmp_path, MECH_FILENAMES[0]), 'a',
+                  encoding='utf-8') as fobj:
+            fobj.write('\n')
+        rxn_param_dct = cache.cached_load(
+            ckin.load_rxn_param_dct, MECH_FILENAMES[0], tmp_path,
+            cache_dir=cache_dir)
+        assert tuple(rxn_param_dct.keys()) == CORRECT_RXN
+        assert len(os.listdir(cache_dir)) == 2
+
+        # Entries beyond the size limit are evicted
+        assert cache.evict(cache_dir=cache_dir, max_size=0) == 2
+        assert not os.listdir(cache_dir)
+    finally:
+        shutil.rmtree(tmp_path)
+
+
+def test_write_file():
+    """ Tests that a failed write leaves no temporary file behind
+    """
+
+    tmp_path = tempfile.mkdtemp()
+    try:
+        # Replacing a directory with a file fails
+        os.mkdir(os.path.join(tmp_path, 'entry'))
+        assert not cache.write_file(os.path.join(tmp_path, 'entry'), {})
+        assert os.listdir(tmp_path) == ['entry']
+
+        assert cache.write_file(os.path.join(tmp_path, 'entry2'), {'a': 1})
+        assert cache.read_file(os.path.join(tmp_path, 'entry2')) == {'a': 1}
+    finally:
+        shutil.rmtree(tmp_path)
+
+
 if __name__ == '__main__':
     test_load_rxn_ktp_dcts()
     test_load_rxn_param_dcts()
     test_load_spc_therm_dcts()
     test_load_spc_nasa7_dcts()
     test_parse_rxn_ktp_dct()
+    test_cached_load()
+    test_write_file()
@@ -287,7 +287,45 @@ def test_align_rxn_ktp_dcts():
         )
 
 
+def test_rxn_index():
+    """ Test the RxnIndex used for matching rxns
+    """
+    rxn_idx = compare.RxnIndex(RXN_KTP_DCT1)
+
+    # Forward match with the rcts/prds written in a different order
+    match, rev_rate = rxn_idx.match((('O', 'H2'), ('H', 'OH'), (None,)))
+    assert match == (('H2', 'O'), ('OH', 'H'), (None,)) and not rev_rate
+
+    # Reverse match; None and '(+M)' are treated as the same third body
+    match, rev_rate = rxn_idx.match((('OH', 'H'), ('O', 'H2'), ('(+M)',)))
+    assert match == (('H2', 'O'), ('OH', 'H'), (None,)) and rev_rate
+
+    # No match once the rxn has been removed
+    rxn_idx.remove((('H2', 'O'), ('OH', 'H'), (None,)))
+    assert rxn_idx.match((('O', 'H2'), ('H', 'OH'), (None,))) == (None, None)
+
+    # Duplicates are flagged
+    dup_idx = compare.RxnIndex([(('H', 'O2'), ('OH', 'O'), (None,)),
+                                (('O', 'OH'), ('O2', 'H'), ('(+M)',))])
+    assert len(dup_idx.duplicates()) == 1
+
+
+def test_spc_ident_index():
+    """ Test the species-identity index used for renaming
+    """
+    spc_idx_dct = compare.spc_ident_index(SPC_IDENT_DCT1, exc=False, fml=True)
+    ident = compare.spc_ident_key(SPC_IDENT_DCT2['OV'], exc=False, fml=True)
+    assert spc_idx_dct[ident] == [(2, 'O')]
+    ident = compare.spc_ident_key(SPC_IDENT_DCT2['HO2V'], exc=False, fml=True)
+    assert ident not in spc_idx_dct
+
+    rename_instr = compare.get_rename_instr(SPC_IDENT_DCT1, SPC_IDENT_DCT3)
+    assert rename_instr == {'O2X': 'O2', 'H2': 'H2-zz'}
+
+
 if __name__ == '__main__':
+    test_spc_ident_index()
+    test_rxn_index()
     test_rename_spc_dct()
     test_get_comb_spc_dct()
     test_rename_spc_therm_dct()
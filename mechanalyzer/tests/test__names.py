@@ -0,0 +1,81 @@
+""" test mechanalyzer.builder._names
+"""
+
+from mechanalyzer.builder import _names
+
+
+SPC_DCT = {
+    'NC3H7': {'inchi': 'InChI=1S/C3H7/c1-3-2/h1,3H2,2H3'},
+    'C3H8': {'inchi': 'InChI=1S/C3H8/c1-3-2/h3H2,1-2H3'},
+    'IC3H7': {'inchi': 'InChI=1S/C3H7/c1-3-2/h3H,1-2H3'},
+    'C3H7(2)': {'inchi': 'InChI=1S/C3H6/c1-3-2/h3H,1H2,2H3'},
+    'CC3H7': {'inchi': 'InChI=1S/C3H7/c1-3-2/h3H,1-2H3/i1+1'},
+}
+
+
+def test__formula_name_dct():
+    """ test mechanalyzer.builder._names.formula_name_dct
+    """
+
+    map_dct = _names.formula_name_dct(SPC_DCT)
+    assert map_dct == {
+        'NC3H7': 'C3H7',
+        'C3H8': 'C3H8',
+        'IC3H7': 'C3H7(2)',
+        'C3H7(2)': 'C3H6',
+        'CC3H7': 'C3H7(3)',
+    }
+
+    # Names of the species that are kept are not reused
+    map_dct = _names.formula_name_dct(
+        SPC_DCT, spc_names=('NC3H7', 'IC3H7', 'CC3H7'))
+    assert map_dct == {
+        'NC3H7': 'C3H7',
+        'IC3H7': 'C3H7(3)',
+        'CC3H7': 'C3H7(4)',
+    }
+
+
+def test__remap_mechanism_names():
+    """ test mechanalyzer.builder._names.remap_mechanism_names
+    """
+
+    rxn_param_dct = {
+        (('C3H8',), ('NC3H7', 'H'), (None,)): 'params1',
+        (('IC3H7',), ('C3H7(2)', 'H'), ('(+M)',)): 'params2',
+    }
+    rxn_ktp_dct = {
+        (('C3H8',), ('NC3H7', 'H'), (None,)): 'ktp1',
+    }
+    spc_therm_dct = {'NC3H7': 'therm1', 'H': 'therm2'}
+    map_dct = {'NC3H7': 'C3H7', 'IC3H7': 'C3H7(2)', 'C3H7(2)': 'C3H6'}
+
+    re_dcts = _names.remap_mechanism_names(SPC_DCT, rxn_param_dct, map_dct)
+    re_spc_dct, re_rxn_param_dct = re_dcts
+    assert list(re_spc_dct) == ['C3H7', 'C3H8', 'C3H7(2)', 'C3H6', 'CC3H7']
+    assert re_rxn_param_dct == {
+        (('C3H8',), ('C3H7', 'H'), (None,)): 'params1',
+        (('C3H7(2)',), ('C3H6', 'H'), ('(+M)',)): 'params2',
+    }
+    assert len(map_dct) == 3
+
+    # All dcts in one call and repeated renames with the same index
+    name_index = _names.NameIndex()
+    for _ in range(2):
+        re_dcts = _names.remap_mechanism_names(
+            SPC_DCT, rxn_param_dct, map_dct,
+            rxn_ktp_dct=rxn_ktp_dct, spc_therm_dct=spc_therm_dct,
+            name_index=name_index)
+        assert re_dcts[1] == re_rxn_param_dct
+        assert re_dcts[2] == {(('C3H8',), ('C3H7', 'H'), (None,)): 'ktp1'}
+        assert re_dcts[3] == {'C3H7': 'therm1', 'H': 'therm2'}
+    re_dcts = _names.remap_mechanism_names(
+        SPC_DCT, rxn_param_dct, {'H': 'H1'}, name_index=name_index)
+    assert list(re_dcts[1]) == [
+        (('C3H8',), ('NC3H7', 'H1'), (None,)),
+        (('IC3H7',), ('C3H7(2)', 'H1'), ('(+M)',))]
+
+
+if __name__ == '__main__':
+    test__formula_name_dct()
+    test__remap_mechanism_names()
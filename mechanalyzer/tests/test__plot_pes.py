@@ -0,0 +1,70 @@
+""" test mechanalyzer.plotter.pes
+"""
+
+import os
+import tempfile
+from mechanalyzer.plotter import pes
+
+TMP_DIR = tempfile.mkdtemp()
+print('Temp Run Dir:', TMP_DIR)
+
+ENE_DCT = {
+    'P1': -5.00,
+    'B1': 15.00,
+    'W1': -10.00,
+    'B2': 20.00,
+    'W2': -12.00,
+    'B3': 8.00,
+    'P2': -2.00,
+    'B4': 25.00,
+    'P3': 3.00
+}
+
+CONN_LST = (
+    ('W1', 'B1'),
+    ('B1', 'P1'),
+    ('W1', 'B2'),
+    ('B2', 'W2'),
+    ('W2', 'B3'),
+    ('B3', 'P2'),
+    ('W2', 'B4'),
+    ('B4', 'P3')
+)
+
+PES_LST = (
+    ('pes1', ENE_DCT, CONN_LST),
+    ('pes2', {'W1': 0.00, 'B1': 10.00, 'P1': -5.00},
+     (('W1', 'B1'), ('B1', 'P1'))),
+    ('pes3', {'W1': -3.00, 'B1': 12.00, 'W2': -1.00},
+     (('W1', 'B1'), ('B1', 'W2'))),
+)
+
+
+def test__resort_names():
+    """ test mechanalyzer.plotter.pes.resort_names
+    """
+
+    ord_ene_dct = pes.resort_names(ENE_DCT, CONN_LST)
+    assert tuple(ord_ene_dct) == (
+        'P1', 'B1', 'P3', 'B4', 'P2', 'B3', 'W1', 'B2', 'W2')
+    assert ord_ene_dct == ENE_DCT
+
+
+def test__build_batch():
+    """ test mechanalyzer.plotter.pes.build_batch
+    """
+
+    for nprocs in (1, 3):
+        path = os.path.join(TMP_DIR, f'nprocs{nprocs}')
+        os.mkdir(path)
+        file_names = pes.build_batch(
+            PES_LST, path=path, ext='pdf', resort=True, nprocs=nprocs)
+        assert file_names == [
+            os.path.join(path, f'{name}.pdf') for name, _, _ in PES_LST]
+        for file_name in file_names:
+            assert os.path.exists(file_name)
+
+
+if __name__ == '__main__':
+    test__resort_names()
+    test__build_batch()
@@ -41,6 +41,20 @@ def test_build_plots_ratio_sort():
     build_pdf(figs, FILENAME, TMP_DIR)
 
 
+def test_write_pdf():
+    """ Test the write_pdf function, serially and in parallel shards
+    """
+    npages = rates.write_pdf(ALGN_RXN_KTP_DCT, FILENAME, TMP_DIR,
+                             ratio_sort=True)
+    assert npages == 2
+    npages = rates.write_pdf(ALGN_RXN_KTP_DCT, FILENAME, TMP_DIR,
+                             ratio_sort=True, max_plots=1)
+    assert npages == 1
+    npages = rates.write_pdf(ALGN_RXN_KTP_DCT, FILENAME, TMP_DIR, nprocs=2)
+    assert npages == 2
+
+
 if __name__ == '__main__':
     test_build_plots()
     test_build_plots_ratio_sort()
+    test_write_pdf()
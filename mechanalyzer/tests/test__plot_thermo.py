@@ -31,5 +31,13 @@ def test_build_plots():
     build_pdf(figs, FILENAME, TMP_DIR)
 
 
+def test_write_pdf():
+    """ Test the write_pdf function
+    """
+    npages = thermo.write_pdf(ALGN_SPC_THERM_DCT, FILENAME, TMP_DIR)
+    assert npages == 1
+
+
 if __name__ == '__main__':
     test_build_plots()
+    test_write_pdf()
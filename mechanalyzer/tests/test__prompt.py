@@ -6,8 +6,11 @@
     similar structure to script in mechanalyzer_bin
 """
 
+# pylint: disable=protected-access
+
 import os
 import numpy as np
+import pandas as pd
 from ioformat import pathtools, remove_comment_lines
 import autoparse.pattern as app
 import mess_io
@@ -256,6 +259,65 @@ def test_bf_from_fne():
         np.array([1.42060802e-02, 5.47827434e-02]), atol=1e-3, rtol=1e-2)
 
 
+def test_ped_df_rescale():
+    """ test calculator.bf.ped_df_rescale
+    """
+
+    # same energy distribution from each starting energy, on different grids:
+    # the rescaled distribution must be the normalized distribution
+    temps, pressures = [600.0, 1200.0], [0.1, 1.0]
+    hotens = np.arange(10.0, 40.0, 0.5)
+    starthot_df = pd.DataFrame(index=temps, columns=pressures, dtype=object)
+    ped_df_fromhot = pd.DataFrame(
+        index=temps, columns=pressures, dtype=object)
+    for temp in temps:
+        for pressure in pressures:
+            starthot_df[pressure][temp] = pd.Series(
+                np.exp(-(hotens - temp/40)**2/20), index=hotens)
+            ped_dct = {}
+            for hoten in hotens:
+                ene = np.arange(0.0, 25.0 + hoten % 2, 0.5)
+                ped_dct[hoten] = pd.Series(ene*np.exp(-ene/3), index=ene)
+            ped_df_fromhot[pressure][temp] = pd.Series(ped_dct)
+
+    ped_df = mechanalyzer.calculator.bf.ped_df_rescale(
+        starthot_df, ped_df_fromhot)
+
+    ped = ped_df[1.0][1200.0]
+    ene = ped.index.values
+    ref_ped = ene*np.exp(-ene/3)
+    assert np.allclose(ped.values, ref_ped/np.trapz(ref_ped, x=ene))
+    assert np.isclose(np.trapz(ped.values, x=ene), 1)
+
+
+def test_weighted_ped_sum():
+    """ test calculator.bf.weighted_ped_sum
+    """
+
+    # linear distributions: both the cubic spline and the linear
+    # interpolation reproduce them between the grid points
+    weightfactors = np.array([0.2, 0.5, 0.3])
+    ene_vect = np.arange(0.25, 20.0, 0.5)
+    ref_prob = weightfactors.sum()*(2*ene_vect + 1)
+
+    # all distributions on one grid: merged and interpolated once
+    ene = np.arange(0.0, 30.0, 0.5)
+    peds = [pd.Series(2*ene + 1, index=ene) for _ in weightfactors]
+    prob_vect = mechanalyzer.calculator.bf.weighted_ped_sum(
+        peds, weightfactors, ene_vect)
+    assert np.allclose(prob_vect, ref_prob)
+
+    # distributions on different grids, one of them unsorted, and one too
+    # short to be used
+    enes = [np.arange(0.0, 30.0, 0.5), np.arange(0.0, 25.0, 0.25),
+            np.arange(30.0, -0.1, -1.0)]
+    peds = [pd.Series(2*ene + 1, index=ene) for ene in enes]
+    prob_vect = mechanalyzer.calculator.bf.weighted_ped_sum(
+        peds + [pd.Series([1.0, 1.0], index=[0.0, 1.0])],
+        np.append(weightfactors, 10.0), ene_vect)
+    assert np.allclose(prob_vect, ref_prob)
+
+
 def test_new_ktp_dct():
     """ test builder.bf.merge_bf_ktp
         calls calculator.bf.merge_bf_rates
@@ -293,6 +355,33 @@ def test_new_ktp_dct():
                   9.39747652e-14]))
 
 
+def test_cached_parse():
+    """ test calculator._prompt.cached_parse
+    """
+
+    nparse = []
+
+    def _parser(inp_str, out_str):
+        nparse.append(1)
+        return {'inp': inp_str.split(), 'out': out_str}
+
+    mess_cache = {}
+    parsed = mechanalyzer.calculator._prompt.cached_parse(
+        _parser, mess_cache, 'A B', 'out')
+    parsed['inp'].append('C')
+    parsed = mechanalyzer.calculator._prompt.cached_parse(
+        _parser, mess_cache, 'A B', 'out')
+    # parsed once, and the cached value is not modified by the caller
+    assert len(nparse) == 1
+    assert parsed == {'inp': ['A', 'B'], 'out': 'out'}
+    mechanalyzer.calculator._prompt.cached_parse(
+        _parser, mess_cache, 'A B', 'out2')
+    assert len(nparse) == 2
+    # without a cache, the files are always parsed
+    mechanalyzer.calculator._prompt.cached_parse(_parser, None, 'A B', 'out')
+    assert len(nparse) == 3
+
+
 def _read_data():
     """ Obtain all the data needed to perform prompt tests
     """
@@ -330,4 +419,7 @@ if __name__ == '__main__':
     test_bf_from_phi1a()
     test_bf_from_fne()
     test_rovib_dos()
+    test_ped_df_rescale()
+    test_weighted_ped_sum()
     test_new_ktp_dct()
+    test_cached_parse()
@@ -0,0 +1,71 @@
+""" test mechanalyzer.builder._sccs
+"""
+
+from mechanalyzer.builder import _sccs
+
+
+A_M0 = 'InChI=1S/C4H10O/c1-3-4(2)5/h4-5H,3H2,1-2H3/t4-/m0/s1'
+A_M1 = 'InChI=1S/C4H10O/c1-3-4(2)5/h4-5H,3H2,1-2H3/t4-/m1/s1'
+B_M0 = 'InChI=1S/C4H9O/c1-3-4(2)5/h4H,1,3H2,2H3/t4-/m0/s1'
+B_M1 = 'InChI=1S/C4H9O/c1-3-4(2)5/h4H,1,3H2,2H3/t4-/m1/s1'
+C = 'InChI=1S/H2O/h1H2'
+
+# Each S-CCS of CCSs 1 and 2 has its mirror image in the same CCS
+CCS_SCCS_SPC_DCT1 = {
+    0: {0: (C,)},
+    1: {0: (A_M0, C), 1: (A_M1, C)},
+    2: {0: (A_M1, B_M0), 1: (A_M0, B_M1)},
+}
+# Not closed under mirroring, several combinations give 3 species
+CCS_SCCS_SPC_DCT2 = {
+    0: {0: (C,)},
+    1: {0: (A_M0,), 1: (A_M1,)},
+    2: {0: (A_M1, B_M0), 1: (A_M0, B_M0), 2: (B_M1,)},
+    3: {0: (B_M0, C), 1: (A_M1, B_M1)},
+}
+
+
+def test__select_sccs_combo():
+    """ test mechanalyzer.builder._sccs.select_sccs_combo
+    """
+
+    best_combo, best_combo_ichs, nodes, stopped = _sccs.select_sccs_combo(
+        CCS_SCCS_SPC_DCT1)
+    assert best_combo == ((1, 1), (2, 0), (0, 0))
+    assert set(best_combo_ichs) == {A_M1, B_M0, C}
+    assert nodes > 0 and not stopped
+
+    best_combo, best_combo_ichs, _, stopped = _sccs.select_sccs_combo(
+        CCS_SCCS_SPC_DCT2)
+    assert best_combo == ((1, 1), (2, 0), (3, 0), (0, 0))
+    assert set(best_combo_ichs) == {A_M1, B_M0, C}
+    assert not stopped
+
+
+def test__select_sccs_combo_budget():
+    """ test that a stopped search still returns a full combination
+    """
+
+    best_combo, _, _, stopped = _sccs.select_sccs_combo(
+        CCS_SCCS_SPC_DCT2, max_nodes=1)
+    assert sorted(ccs for ccs, _ in best_combo) == [0, 1, 2, 3]
+    assert stopped
+
+    best_combo, _, _, _ = _sccs.select_sccs_combo(
+        CCS_SCCS_SPC_DCT2, max_time=0.)
+    assert sorted(ccs for ccs, _ in best_combo) == [0, 1, 2, 3]
+
+
+def test__mirror_inchi():
+    """ test mechanalyzer.builder._sccs.mirror_inchi
+    """
+
+    assert _sccs.mirror_inchi(A_M0) == A_M1
+    assert _sccs.mirror_inchi(A_M1) == A_M0
+    assert _sccs.mirror_inchi(C) == C
+
+
+if __name__ == '__main__':
+    test__select_sccs_combo()
+    test__select_sccs_combo_budget()
+    test__mirror_inchi()
@@ -11,6 +11,7 @@ from mechanalyzer.builder import sorter
 from mechanalyzer.parser import mech as mparser
 from mechanalyzer.parser import ckin_ as ckin_parser
 from mechanalyzer.parser import spc as sparser
+from mechanalyzer.parser import pes
 
 # Set Paths to test/data directory and output directory
 CWD = os.path.dirname(os.path.realpath(__file__))
@@ -743,6 +744,27 @@ def test__sort_ktp():
     assert newdct == results
     print('ok')
 
+
+def test__find_conn_chnls():
+    """ test mechanalyzer.parser.pes.find_conn_chnls
+
+        subpes grouping: wells connect channels, separate subpeses merge
+        into the oldest one, and bimol-bimol channels join a subpes only
+        if it already has both bimolecular pairs
+    """
+    rct_lst = [('R', 'O2'), ('RO2',), ('QOOH',), ('A',), ('OH', 'EPO'),
+               ('RO2',), ('B', 'C'), ('P1',), ('P3',), ('P4',)]
+    prd_lst = [('RO2',), ('QOOH',), ('OH', 'EPO'), ('B', 'C'),
+               ('HO2', 'ALK'), ('ALK', 'HO2'), ('D', 'E'), ('P2',),
+               ('P4',), ('P1',)]
+    connchnls = pes.find_conn_chnls(
+        rct_lst, prd_lst, list(range(len(rct_lst))))
+
+    assert connchnls == {
+        0: [7, 9, 8], 2: [1, 0, 2, 5, 4], 3: [3], 4: [6]}
+    assert list(connchnls.keys()) == [0, 2, 3, 4]
+
+
 # Helper function
 
 
@@ -779,3 +801,4 @@ if __name__ == '__main__':
     test__sortby_submech_ext()
     test__sortby_submech_class()
     test__sort_ktp()
+    test__find_conn_chnls()
@@ -2,8 +2,12 @@
 """
 
 import os
+import shutil
+import tempfile
 import ioformat
 import mechanalyzer
+from mechanalyzer.parser import new_spc
+from mechanalyzer.parser import ich_cache
 
 
 # Set paths
@@ -200,3 +204,31 @@ def test__mod_spc_dct_stereo():
         ref_spc_dct, all_stereo=False)
 
     assert ref_spc_dct == spc_dct
+
+
+def test__ich_cache():
+    """ test mechanalyzer.parser.ich_cache
+    """
+
+    tmp_path = tempfile.mkdtemp()
+    shutil.copy(os.path.join(DAT_PATH, 'spc3.csv'), tmp_path)
+    props_path = os.path.join(tmp_path, ich_cache.props_filename('spc3.csv'))
+    try:
+        # The first load computes the properties and writes them to a file,
+        # the second one starts from the file
+        ich_cache.clear()
+        spc_dct1 = new_spc.load_mech_spc_dct(
+            'spc3.csv', tmp_path, use_ich_cache=True)
+        assert os.path.exists(props_path)
+        ich_cache.clear()
+        assert ich_cache.load(ich_cache.props_filename('spc3.csv'), tmp_path)
+        spc_dct2 = new_spc.load_mech_spc_dct(
+            'spc3.csv', tmp_path, use_ich_cache=True)
+        assert spc_dct1 == spc_dct2
+
+        # Stored formulas are not changed through the returned copies
+        fml = ich_cache.formula(spc_dct1['CH4']['inchi'])
+        fml['C'] = 10
+        assert ich_cache.formula(spc_dct1['CH4']['inchi']) == {'C': 1, 'H': 4}
+    finally:
+        shutil.rmtree(tmp_path)
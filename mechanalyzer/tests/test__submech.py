@@ -0,0 +1,62 @@
+""" test mechanalyzer.builder.submech
+"""
+
+import numpy
+from mechanalyzer.builder import submech
+
+
+SPC_DCT = {
+    'H': {'inchi': 'InChI=1S/H', 'mult': 2},
+    'C3H8': {'inchi': 'InChI=1S/C3H8/c1-3-2/h3H2,1-2H3', 'mult': 1},
+    'NC3H7': {'inchi': 'InChI=1S/C3H7/c1-3-2/h1,3H2,2H3', 'mult': 2},
+    'IC3H7': {'inchi': 'InChI=1S/C3H7/c1-3-2/h3H,1-2H3', 'mult': 2},
+    'C3H7O2': {'inchi': 'InChI=1S/C3H7O2/c1-3(2)5-4/h3H,1-2H3', 'mult': 2},
+    'CH3': {'inchi': 'InChI=1S/CH3/h1H3', 'mult': 2},
+    'ts_1_1_0': {'inchi': 'InChI=1S/C3H9/c1-3-2/h3H2,1-2H3', 'mult': 2},
+}
+
+
+def test__fml_df():
+    """ test mechanalyzer.builder.submech.extract_fml_df
+    """
+
+    fml_df = submech.extract_fml_df(SPC_DCT)
+    assert 'ts_1_1_0' not in fml_df.index
+    assert fml_df['fml']['NC3H7'] == 'C3H7'
+    assert numpy.array_equal(
+        fml_df.loc['C3H7O2', ['nC', 'nH', 'nO', 'nN', 'nS', 'nCl']],
+        [3, 7, 2, 0, 0, 0])
+
+    # Exact and upper-bound stoichiometry queries
+    assert submech.extract_species([3, 7, 0, 0, 0, 0], fml_df) == [
+        'NC3H7', 'IC3H7']
+    assert submech.extract_species_sub([3, 7, 0, 0, 0, 0], fml_df) == [
+        'H', 'NC3H7', 'IC3H7', 'CH3']
+    fml_idx = submech.formula_index(fml_df)
+    assert fml_idx[(3, 7, 0, 0, 0, 0)] == ['NC3H7', 'IC3H7']
+
+    # Other element axes
+    fml_df = submech.extract_fml_df(SPC_DCT, elements=('C', 'O'))
+    assert submech.extract_species([3, 2], fml_df, elements=('C', 'O')) == [
+        'C3H7O2']
+
+
+def test__species_subset():
+    """ test mechanalyzer.builder.submech.species_subset
+    """
+
+    species_list, species_subset_df = submech.species_subset(
+        'C3H8', SPC_DCT)
+    assert species_list == ['C3H8', 'NC3H7', 'IC3H7', 'C3H7O2']
+    assert species_subset_df['IC3H7'] == 'FUEL_RAD'
+    assert species_subset_df['C3H7O2'] == 'R_O2'
+
+    species_list, species_subset_df = submech.species_subset_ext(
+        'C3H8', SPC_DCT)
+    assert species_list == ['C3H8', 'NC3H7', 'IC3H7', 'C3H7O2', 'H', 'CH3']
+    assert species_subset_df['CH3'] == 'SUBFUEL'
+
+
+if __name__ == '__main__':
+    test__fml_df()
+    test__species_subset()
@@ -11,12 +11,15 @@ PRESSURES = [1, 10, 100]
 K_THRESHOLDS = [1e11, 1e15, 1e22]
 RXN_NUM_THRESHOLD = 2
 OUT_FILENAME = 'mech_check.txt'
+USE_CACHE = True  # reuse the parsed mechanism from the cache if unchanged
 
 # Load dcts
 JOB_PATH = sys.argv[1]
-RXN_PARAM_DCT = ckin_parser.load_rxn_param_dct(MECH_FILENAME, JOB_PATH)
+RXN_PARAM_DCT = ckin_parser.load_rxn_param_dct(MECH_FILENAME, JOB_PATH,
+                                               use_cache=USE_CACHE)
 RXN_KTP_DCT = ckin_parser.load_rxn_ktp_dct(MECH_FILENAME, JOB_PATH,
-                                           TEMPS, PRESSURES)
+                                           TEMPS, PRESSURES,
+                                           use_cache=USE_CACHE)
 
 output_str = checker.run_all_checks(
     RXN_PARAM_DCT, RXN_KTP_DCT, K_THRESHOLDS, RXN_NUM_THRESHOLD)
@@ -36,16 +36,21 @@ STRIP_STE = False
 CHK_STE = False
 # 2.) Whether to check for matching smiles and inchis
 CHK_MATCH = False
+# 3.) Whether to reuse parsed files from the cache if they are unchanged
+USE_CACHE = True
 
 
 # DON'T CHANGE ANYTHING BELOW THIS LINE
 
 # Load objects
 JOB_PATH = sys.argv[1]
-RXN_PARAM_DCTS = parser.ckin_.load_rxn_param_dcts(MECH_FILES, JOB_PATH)
-SPC_NASA7_DCTS = parser.ckin_.load_spc_nasa7_dcts(THERM_FILES, JOB_PATH)
+RXN_PARAM_DCTS = parser.ckin_.load_rxn_param_dcts(
+    MECH_FILES, JOB_PATH, use_cache=USE_CACHE)
+SPC_NASA7_DCTS = parser.ckin_.load_spc_nasa7_dcts(
+    THERM_FILES, JOB_PATH, use_cache=USE_CACHE)
 MECH_SPC_DCTS = spc_parser.load_mech_spc_dcts(
-    SPC_FILES, JOB_PATH, chk_ste=CHK_STE, chk_match=CHK_MATCH)
+    SPC_FILES, JOB_PATH, chk_ste=CHK_STE, chk_match=CHK_MATCH,
+    use_cache=USE_CACHE)
 
 # Combine objects
 comb_rxn_param_dct, comb_spc_nasa7_dct, comb_mech_spc_dct = combine.comb_mechs(
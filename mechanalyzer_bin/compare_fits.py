@@ -6,7 +6,6 @@ import sys
 import numpy
 import mechanalyzer.calculator.compare as compare
 import mechanalyzer.plotter.rates as plot_rates
-import mechanalyzer.plotter._util as util
 import mechanalyzer.parser.spc as spc_parser
 import mechanalyzer.parser.ckin_ as ckin_parser
 import ratefit
@@ -75,8 +74,9 @@ print(algn_rxn_ktp_dct)
 print(len(algn_rxn_ktp_dct))
 
 # Run the plotter
-figs = plot_rates.build_plots(
+plot_rates.write_pdf(
     algn_rxn_ktp_dct,
+    filename=output_filename,
+    path=JOB_PATH,
     mech_names=mech_nicknames,
     ratio_sort=bool(sort_method == 'ratios'))
-util.build_pdf(figs, filename=output_filename, path=JOB_PATH)
@@ -6,7 +6,6 @@ import sys
 import numpy
 import mechanalyzer.calculator.compare as compare
 import mechanalyzer.plotter.rates as plot_rates
-import mechanalyzer.plotter._util as util
 import mechanalyzer.parser.new_spc as spc_parser
 import mechanalyzer.parser.ckin_ as ckin_parser
 
@@ -39,6 +38,9 @@ SORT_METHOD = 'ratios'  # either 'ratios' or None
 rev_rates = True
 remove_loners = True
 write_file = False
+USE_CACHE = True  # reuse parsed files from the cache if they are unchanged
+MAX_PLOTS = None  # None to plot all rxns or an int to plot the first (or top)
+NPROCS = 1  # number of processes drawing the plots; can be 'auto'
 
 
 # RUN FUNCTIONS; DON'T CHANGE THIS
@@ -51,10 +53,12 @@ elif len(sys.argv) == 1:
     JOB_PATH = os.getcwd()
     print(f'No job path input; using the current directory, {JOB_PATH}')
 rxn_ktp_dcts = ckin_parser.load_rxn_ktp_dcts(
-    MECH_FILES, JOB_PATH, TEMPS_LST, pressures)
+    MECH_FILES, JOB_PATH, TEMPS_LST, pressures, use_cache=USE_CACHE)
 spc_therm_dcts = ckin_parser.load_spc_therm_dcts(
-    THERM_FILES, JOB_PATH, TEMPS_LST[0])  # NOTE: taking first entry
-spc_dcts = spc_parser.load_mech_spc_dcts(CSV_FILES, JOB_PATH)
+    THERM_FILES, JOB_PATH, TEMPS_LST[0],  # NOTE: taking first entry
+    use_cache=USE_CACHE)
+spc_dcts = spc_parser.load_mech_spc_dcts(CSV_FILES, JOB_PATH,
+                                         use_cache=USE_CACHE)
 
 # Get the algn_rxn_ktp_dct
 TEMPS = TEMPS_LST[0]  # function receives a single Numpy array of temps
@@ -63,8 +67,11 @@ algn_rxn_ktp_dct = compare.get_algn_rxn_ktp_dct(
     remove_loners=remove_loners, write_file=write_file)
 
 # Run the plotter
-figs = plot_rates.build_plots(
+plot_rates.write_pdf(
     algn_rxn_ktp_dct,
+    filename=output_filename,
+    path=JOB_PATH,
     mech_names=mech_nicknames,
-    ratio_sort=bool(SORT_METHOD == 'ratios'))
-util.build_pdf(figs, filename=output_filename, path=JOB_PATH)
+    ratio_sort=bool(SORT_METHOD == 'ratios'),
+    max_plots=MAX_PLOTS,
+    nprocs=NPROCS)
@@ -6,7 +6,6 @@ import sys
 import numpy
 from mechanalyzer.calculator import compare
 import mechanalyzer.plotter.thermo as plot_thermo
-import mechanalyzer.plotter._util as util
 import mechanalyzer.parser.new_spc as spc_parser
 import mechanalyzer.parser.ckin_ as ckin_parser
 
@@ -58,6 +57,8 @@ SORT_INSTR = 'g'  # either 'h', 'cp', 's', 'g', or None
 SORT_TEMP = None  # can be (1) None to sort by max difference or (2) a number
 REMOVE_LONERS = True
 WRITE_FILE = False  # this currently does nothing
+MAX_PLOTS = None  # None to plot all spcs or an int to plot the first (or top)
+NPROCS = 1  # number of processes drawing the plots; can be 'auto'
 
 # RUN FUNCTIONS
 # Fix temps to include the sort_temps if it doesn't already
@@ -84,7 +85,8 @@ ALGN_SPC_THERM_DCT = compare.get_algn_spc_therm_dct(
 COMB_SPC_DCT = compare.get_mult_comb_mech_spc_dct(SPC_DCTS)
 
 # Run the plotter
-FIGS = plot_thermo.build_plots(
-    ALGN_SPC_THERM_DCT, spc_dct=COMB_SPC_DCT, mech_names=MECH_NAMES,
-    sort=SORT, sort_instr=SORT_INSTR, sort_temp=SORT_TEMP)
-util.build_pdf(FIGS, filename=OUTPUT_FILENAME, path=JOB_PATH)
+plot_thermo.write_pdf(
+    ALGN_SPC_THERM_DCT, filename=OUTPUT_FILENAME, path=JOB_PATH,
+    spc_dct=COMB_SPC_DCT, mech_names=MECH_NAMES, sort=SORT,
+    sort_instr=SORT_INSTR, sort_temp=SORT_TEMP, max_plots=MAX_PLOTS,
+    nprocs=NPROCS)
@@ -18,39 +18,57 @@ CWD = os.getcwd()
 # Parse the command line
 DSTR = 'Generates a graph plot of a PES from MESS input'
 PAR = argparse.ArgumentParser(description=DSTR)
-PAR.add_argument('-i', '--input', default='mess.inp',
-                 help='input file type (mess.inp')
+PAR.add_argument('-i', '--input', nargs='+', default=['mess.inp'],
+                 help='input file(s) type (mess.inp')
 PAR.add_argument('-o', '--output', default='surface.pdf',
                  help='name of output plot file (surface.pdf)')
+PAR.add_argument('-n', '--nprocs', default='auto',
+                 help='number of processes for several inputs (auto)')
 OPTS = vars(PAR.parse_args())
 
 # Parse the input based on the initial type
-INP_PES_STR = ioformat.pathtools.read_file(CWD, OPTS['input'])
-if INP_PES_STR is None:
-    print(f'ERROR: Input PES file {OPTS["input"]} not found')
-    sys.exit()
-
-ene_dct, _, conn_lst_dct, pes_lab_dct = mess_io.reader.pes(
-    INP_PES_STR, read_fake=False)
-ene_dct = {name: ene for name, ene in ene_dct.items()
-           if 'B' not in name}
-conn_lst = tuple(conn[1] for conn in conn_lst_dct.items())
-pes_lab_dct = automol.util.dict_.invert(pes_lab_dct)
-print(pes_lab_dct)
-
-# Call the plotter function
-print('Information parsed from MESS input file')
-print('Energies of species:')
-for name, ene in ene_dct.items():
-    print(f'{name}: {ene} kcal/mol')
-
-print('Connections:')
-for conn in conn_lst:
-    print(f'{conn}')
-
-# Produce the PES plot
-mechanalyzer.plotter.pes.pes_graph(
-    conn_lst, ene_dct=ene_dct, label_dct=pes_lab_dct)
+PES_LST = []
+for inp in OPTS['input']:
+    INP_PES_STR = ioformat.pathtools.read_file(CWD, inp)
+    if INP_PES_STR is None:
+        print(f'ERROR: Input PES file {inp} not found')
+        sys.exit()
+
+    ene_dct, _, conn_lst_dct, pes_lab_dct = mess_io.reader.pes(
+        INP_PES_STR, read_fake=False)
+    ene_dct = {name: ene for name, ene in ene_dct.items()
+               if 'B' not in name}
+    conn_lst = tuple(conn[1] for conn in conn_lst_dct.items())
+    pes_lab_dct = automol.util.dict_.invert(pes_lab_dct)
+    print(pes_lab_dct)
+
+    # Call the plotter function
+    print(f'Information parsed from MESS input file {inp}')
+    print('Energies of species:')
+    for name, ene in ene_dct.items():
+        print(f'{name}: {ene} kcal/mol')
+
+    print('Connections:')
+    for conn in conn_lst:
+        print(f'{conn}')
+
+    PES_LST.append((os.path.splitext(inp)[0].replace(os.sep, '_'),
+                    ene_dct, conn_lst, pes_lab_dct))
+
+# Produce the PES plot(s); several surfaces are plotted in parallel, each
+# to a file named after its input with the extension of the output
+if len(PES_LST) == 1:
+    _, ene_dct, conn_lst, pes_lab_dct = PES_LST[0]
+    mechanalyzer.plotter.pes.pes_graph(
+        conn_lst, ene_dct=ene_dct, label_dct=pes_lab_dct,
+        file_name=OPTS['output'])
+else:
+    NPROCS = OPTS['nprocs']
+    NPROCS = NPROCS if NPROCS == 'auto' else int(NPROCS)
+    EXT = os.path.splitext(OPTS['output'])[1].lstrip('.') or 'pdf'
+    print(f'Plotting {len(PES_LST)} PESs...')
+    mechanalyzer.plotter.pes.build_batch(
+        PES_LST, path=CWD, ext=EXT, graph=True, nprocs=NPROCS)
 
 # Exit
 print('\nPlot surface created. Script Execution complete.')
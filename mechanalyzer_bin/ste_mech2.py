@@ -19,7 +19,8 @@ def main(workdir,
          run_expansion=True,
          run_reduction='enant',
          check_mechanism=False,
-         nprocs='auto'):
+         nprocs='auto',
+         max_time=None):
     """ carry out all the mechanism things you wanna do
     """
 
@@ -76,7 +77,7 @@ def main(workdir,
 
         # Select the (CCS, S-CCS) surfaces for the reduced mechanism
         best_combo, best_combo_ichs = reduction_selection(
-            ccs_sccs_spc_dct, algorithm=run_reduction)
+            ccs_sccs_spc_dct, algorithm=run_reduction, max_time=max_time)
 
         # Add in any required diastereomer surfaces precluded by the reduction
         print('combo test 1', best_combo)
@@ -122,16 +123,15 @@ def expand_stereo(rxn_param_dct, mech_spc_dct,
 
 
 # REDUCTION ALGORITHMS #
-def reduction_selection(ccs_sccs_spc_dct, algorithm='enant'):
+def reduction_selection(ccs_sccs_spc_dct, algorithm='enant', max_time=None):
     """ Determine the (CCS, S-CCS) pairs that best represent a sufficient
         mechanism with all required stereoisomers and minimizes redundant
         enantiomers.
     """
 
     if algorithm == 'enant':
-        sccs_combo_lst = _all_sccs_combos(ccs_sccs_spc_dct)
         best_combo, best_combo_ichs = _reduce_via_enantiomers(
-            ccs_sccs_spc_dct, sccs_combo_lst)
+            ccs_sccs_spc_dct, max_time=max_time)
     elif algorithm == 'overlap':
         best_combo, best_combo_ichs = _reduce_via_max_overlap(
             ccs_sccs_spc_dct)
@@ -139,100 +139,33 @@ def reduction_selection(ccs_sccs_spc_dct, algorithm='enant'):
     return best_combo, best_combo_ichs
 
 
-def _reduce_via_enantiomers(ccs_sccs_spc_dct, combo_lst):
+def _reduce_via_enantiomers(ccs_sccs_spc_dct, max_time=None):
     """ find the sccs combo that has the shortest unique spc lst
         which means it has the least number of enantiomers
-        reduce by doing all possible combinations of sccss and figuring out
-        which combination results in the shortest unique species list
+        reduce with a branch-and-bound search over the sccs of each ccs,
+        stopped after max_time seconds
     """
-    uniq_spc_lst_lst = ()
-    num_uniq_spc_for_combo = ()
-    print('Checking {:g} combinations'.format(len(combo_lst)))
-    for combo in combo_lst:
-        spc_ich_lst = ()
-        for idxs in combo:
-            spc_ich_lst += ccs_sccs_spc_dct[idxs[0]][idxs[1]]
-        uniq_spc_lst = ()
-        for spc in spc_ich_lst:
-            if spc not in uniq_spc_lst:
-                uniq_spc_lst += (spc,)
-        uniq_spc_lst_lst += (uniq_spc_lst,)
-        num_uniq_spc_for_combo += (len(uniq_spc_lst),)
-        # enant_count = 0
-        # for spc_a, spc_b in it.combinations(spc_ich_lst, 2):
-        #     if automol.inchi.are_enantiomers(spc_a, spc_b):
-        #         enant_count += 1
-        # combo_ent_count += (enant_count,)
-        # print('found {:g} enantiomers for this combo'.format(enant_count))
-    # print(combo_ent_count)
-    # min_enants = min(combo_ent_count)
-    # print('minimum overlap', min_enants)
-    # best_combo_idx = combo_ent_count.index(min_enants)
-    # best_combo = combo_ent_count[best_combo_idx]
-    # print('best combo', best_combo)
-    shortest_spc_lst = min(num_uniq_spc_for_combo)
-    print('greatest overlap', shortest_spc_lst)
-    best_combo_idx = num_uniq_spc_for_combo.index(shortest_spc_lst)
-    best_combo = combo_lst[best_combo_idx]
+    best_combo, best_combo_ichs, nodes, stopped = (
+        mechanalyzer.builder.select_sccs_combo(
+            ccs_sccs_spc_dct, max_time=max_time))
+    if stopped:
+        print(f'S-CCS search stopped after {nodes} nodes; '
+              'using the best combination found')
+    else:
+        print(f'S-CCS search completed in {nodes} nodes')
+    uniq_spc_lst = tuple(dict.fromkeys(best_combo_ichs))
+    print('greatest overlap', len(uniq_spc_lst))
     print('best combo', best_combo)
     enant_count = 0
-    for spc_a, spc_b in it.combinations(uniq_spc_lst_lst[best_combo_idx], 2):
+    for spc_a, spc_b in it.combinations(uniq_spc_lst, 2):
         if automol.inchi.are_enantiomers(spc_a, spc_b):
             print('Enantiomer pair:', spc_a, spc_b)
             enant_count += 1
     print('found {:g} enantiomers for this combo'.format(enant_count))
 
-    best_combo_ichs = ()
-    for ccs, sccs in best_combo:
-        best_combo_ichs += ccs_sccs_spc_dct[ccs][sccs]
-
     return best_combo, best_combo_ichs
 
 
-def _group_sccs(ccs_sccs_spc_dct):
-    """ using the keys of the ccs_sccs_spc_dct group all
-        ccs combos into a tuple of ccs_sccs tuples
-    """
-    all_idxs = ()
-    ccs_lst = sorted(list(ccs_sccs_spc_dct.keys()))
-    for ccs in ccs_lst:
-        sccs_lst = sorted(list(ccs_sccs_spc_dct[ccs].keys()))
-        sccs_tup = tuple((ccs, sccs) for sccs in sccs_lst)
-        all_idxs += (sccs_tup,)
-    return all_idxs
-
-
-def _separate_single_ccs(all_idxs):
-    sccs_lsts = ()
-    ccs_lsts = ()
-    for idx_lst in all_idxs:
-        if len(idx_lst) == 1:
-            ccs_lsts += idx_lst
-        else:
-            sccs_lsts += (idx_lst,)
-    return sccs_lsts, ccs_lsts
-
-
-def _all_sccs_combos(ccs_sccs_spc_dct):
-    """ build all possible combinations of sccs
-    """
-    combo_lst = ((),)
-    all_idxs = _group_sccs(ccs_sccs_spc_dct)
-    sccs_lsts, ccs_lsts = _separate_single_ccs(all_idxs)
-    for ccs_tups in sccs_lsts:
-        new_combo_lst = ()
-        print('Building full combo list from', ccs_tups)
-        for idxs in ccs_tups:
-            for combo in combo_lst:
-                new_combo_lst += (combo + (idxs,),)
-        combo_lst = new_combo_lst
-
-    new_combo_lst = ()
-    for combo in combo_lst:
-        new_combo_lst += (combo + ccs_lsts,)
-    return new_combo_lst
-
-
 def _reduce_via_max_overlap(ccs_sccs_spc_dct):
     """ Find the best combination of CCS,S-CCS to make the reduced
         mechanism by choosing an S-CCS that overlaps best with the previosly
@@ -555,6 +488,9 @@ if __name__ == '__main__':
     PAR.add_argument(
         '-n', '--nprocs', default='auto', type=str,
         help='Number of processors to use [auto(def)]')
+    PAR.add_argument(
+        '-t', '--max-time', default=None, type=float,
+        help='Time limit of the enant reduction search, s [None(def)]')
     OPTS = vars(PAR.parse_args())
 
     # Convert number of processors to an int if an integer is given
@@ -576,7 +512,8 @@ if __name__ == '__main__':
          run_expansion=OPTS['expansion'],
          run_reduction=OPTS['reduction'],
          check_mechanism=False,
-         nprocs=OPTS['nprocs'])
+         nprocs=OPTS['nprocs'],
+         max_time=OPTS['max_time'])
 
     # Compute script run time and print to screen
     tf = time.time()
@@ -7,7 +7,9 @@ from ratefit.calc._rates import double_arrhenius
 from ratefit.calc._rates import arrhenius
 from ratefit.calc._rates import lowp_limit
 from ratefit.calc._rates import lindemann
+from ratefit.calc._rates import lindemann_one_pressure
 from ratefit.calc._rates import troe
+from ratefit.calc._rates import troe_one_pressure
 from ratefit.calc._rates import plog
 from ratefit.calc._rates import cheb
 from ratefit.calc._rates import p_to_m
@@ -19,7 +21,9 @@ __all__ = [
     'arrhenius',
     'lowp_limit',
     'lindemann',
+    'lindemann_one_pressure',
     'troe',
+    'troe_one_pressure',
     'plog',
     'cheb',
     'p_to_m',
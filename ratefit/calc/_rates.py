@@ -3,7 +3,7 @@ Calculate rates with various fitting functions
 """
 
 import numpy as np
-from scipy.special import eval_chebyt
+from numpy.polynomial.chebyshev import chebvander
 from phydat import phycon
 
 
@@ -382,39 +382,28 @@ def cheb(alpha, tlim, plim, temps, pressures):
         :rtype: dict[pressure: temps]
     """
 
-    def cheb_one_pressure(alpha, tlim, plim, temps, pressure):
-        """ Calculates T,P-dependent rate constants [k(T,P)]s using
-            a Chebyshev functional expression, at a given pressure,
-            across several temperatures.
-        """
-
-        tmin, tmax = tlim
-        pmin, pmax = plim
-        alpha_nrows, alpha_ncols = alpha.shape
-
-        ktps = np.zeros(len(temps))
-        for i, temp in enumerate(temps):
-            ctemp = (
-                (2.0 * temp**(-1) - tmin**(-1) - tmax**(-1)) /
-                (tmax**(-1) - tmin**(-1)))
-            cpress = (
-                (2.0 * np.log10(pressure) - np.log10(pmin) - np.log10(pmax)) /
-                (np.log10(pmax) - np.log10(pmin)))
-
-            logktp = 0.0
-            for j in range(alpha_nrows):
-                for k in range(alpha_ncols):
-                    logktp += (alpha[j][k] * eval_chebyt(j, ctemp) *
-                               eval_chebyt(k, cpress))
-
-            ktps[i] = 10**(logktp)
-
-        return ktps
+    tmin, tmax = tlim
+    pmin, pmax = plim
+    alpha = np.asarray(alpha, dtype=float)
+    alpha_nrows, alpha_ncols = alpha.shape
+
+    # Build the Chebyshev basis matrices at the reduced temps and pressures
+    ctemps = (
+        (2.0 * np.asarray(temps, dtype=float)**(-1) - tmin**(-1) - tmax**(-1)) /
+        (tmax**(-1) - tmin**(-1)))
+    cpresses = (
+        (2.0 * np.log10(np.asarray(pressures, dtype=float)) -
+         np.log10(pmin) - np.log10(pmax)) /
+        (np.log10(pmax) - np.log10(pmin)))
+    t_basis = chebvander(ctemps, alpha_nrows - 1)
+    p_basis = chebvander(cpresses, alpha_ncols - 1)
+
+    # Get log k(T,P) at all temps and pressures with one matrix product
+    logktps = t_basis @ alpha @ p_basis.T
 
     kp_dct = {}
-    for pressure in pressures:
-        kp_dct[pressure] = cheb_one_pressure(
-            alpha, tlim, plim, temps, pressure)
+    for pidx, pressure in enumerate(pressures):
+        kp_dct[pressure] = 10**(logktps[:, pidx])
 
     ktp_dct = _ktp_dct(kp_dct, temps)
 
@@ -6,6 +6,7 @@ from ratefit.fit import _fit
 from ratefit.fit import arr
 from ratefit.fit import plog
 from ratefit.fit import cheb
+from ratefit.fit import troe
 from ratefit.fit import err
 from ratefit.fit._fit import fit_rxn_ktp_dct
 
@@ -14,6 +15,7 @@ __all__ = [
     'arr',
     'plog',
     'cheb',
+    'troe',
     'err',
     'fit_rxn_ktp_dct',
 ]
@@ -1,11 +1,19 @@
 """ This is Clayton's new version
 """
 
+import os
+import io
 import copy
+import time
+import contextlib
+import multiprocessing
+import multiprocessing.connection
 import numpy
 from ratefit.fit import arr
 from ratefit.fit import plog
 from ratefit.fit import cheb
+from ratefit.fit import troe
+from ratefit.fit import err
 
 DEFAULT_PDEP = {
     'temps': (500.0, 1000, 2000.0),
@@ -16,7 +24,7 @@ DEFAULT_PDEP = {
 DEFAULT_ARR = {  # also used for PLOG fitting
     'dbltol': 50.0,
     'dbl_iter': 30}
-DEFAULT_TROE = {
+DEFAULT_TROE = {  # also used for Lindemann fitting
     'params': ('ts1', 'ts2', 'ts3', 'alpha'),
     'tol': 20.0}
 DEFAULT_CHEB = {
@@ -27,21 +35,25 @@ NICKNAMES = {  # used for printing messages
     'arr': 'Arrhenius',
     'plog': 'PLOG',
     'cheb': 'Chebyshev',
-    'troe': 'Troe'}
+    'troe': 'Troe',
+    'lind': 'Lindemann'}
 ALLOWED_FIT_METHODS = (
     'arr',
     'plog',
     'cheb',
-    'troe')
+    'troe',
+    'lind')
 
 
 def fit_rxn_ktp_dct(rxn_ktp_dct, fit_method, pdep_dct=None, arrfit_dct=None,
-                    chebfit_dct=None, troefit_dct=None):
+                    chebfit_dct=None, troefit_dct=None, nprocs=1,
+                    timeout=None):
     """ Fits all reactions in a rxn_ktp_dct to some desired form
 
         :param rxn_ktp_dct: rate constants to be fitted, for multiple reactions
         :type rxn_ktp_dct: dict {rxn: ktp_dct}
-        :param fit_method: desired fit form; 'arr', 'plog', 'cheb', or 'troe'
+        :param fit_method: desired fit form; 'arr', 'plog', 'cheb', 'troe',
+            or 'lind'
         :type fit_method: str
         :param pdep_dct: instructions for checking P dependence
         :type pdep_dct: dict
@@ -49,41 +61,296 @@ def fit_rxn_ktp_dct(rxn_ktp_dct, fit_method, pdep_dct=None, arrfit_dct=None,
         :type arrfit_dct: dict
         :param chebfit_dct: instructions for Chebyshev fitting
         :type chebfit_dct: dict
-        :param troefit_dct: instructions for Troe fitting
+        :param troefit_dct: instructions for Troe fitting (also Lindemann)
         :type troefit_dct: dict
+        :param nprocs: number of worker processes; 'auto' uses all CPUs
+        :type nprocs: int or str
+        :param timeout: wall-clock limit for fitting one reaction (s)
+        :type timeout: float
         :return rxn_param_dct: fitted parameters for each reaction
         :rtype: dict {rxn: params}
         :return rxn_err_dct: fitting errors for each reaction
         :rtype: dict {rxn: err_dct}
     """
-    def rxn_name_str(rxn, newline=False):
-        """ get a reaction name string
-        """
-        return ' = '.join((' + '.join(rxn[0]), ' + '.join(rxn[1])))
 
+    rxn_param_dct, rxn_err_dct, rxn_info_dct = fit_rxn_ktp_dct_batch(
+        rxn_ktp_dct, fit_method, pdep_dct=pdep_dct, arrfit_dct=arrfit_dct,
+        chebfit_dct=chebfit_dct, troefit_dct=troefit_dct, nprocs=nprocs,
+        timeout=timeout)
+    print(fit_report(rxn_info_dct))
+
+    return rxn_param_dct, rxn_err_dct
+
+
+def fit_rxn_ktp_dct_batch(rxn_ktp_dct, fit_method, pdep_dct=None,
+                          arrfit_dct=None, chebfit_dct=None, troefit_dct=None,
+                          nprocs=1, timeout=None):
+    """ Fits all reactions in a rxn_ktp_dct, optionally spreading them over
+        a pool of worker processes. Each reaction is fitted in isolation: an
+        exception or a timeout only drops that reaction from the results.
+
+        Reactions fitted to a Chebyshev form are all solved first in this
+        process, so that those on the same T, P grid share one least-squares
+        factorization (see ratefit.fit.cheb.get_params_batch).
+
+        With nprocs=1 and no timeout the reactions are fitted in this process.
+        Otherwise every reaction is fitted in its own child process, which is
+        killed if it exceeds the timeout. Results are returned in the order of
+        the input rxn_ktp_dct regardless of the order in which fits finish.
+
+        :param rxn_ktp_dct: rate constants to be fitted, for multiple reactions
+        :type rxn_ktp_dct: dict {rxn: ktp_dct}
+        :param fit_method: desired fit form; 'arr', 'plog', 'cheb', 'troe',
+            or 'lind'
+        :type fit_method: str
+        :param nprocs: number of worker processes; 'auto' uses all CPUs
+        :type nprocs: int or str
+        :param timeout: wall-clock limit for fitting one reaction (s)
+        :type timeout: float
+        :return rxn_param_dct: fitted parameters for each reaction
+        :rtype: dict {rxn: params}
+        :return rxn_err_dct: fitting errors for each reaction
+        :rtype: dict {rxn: err_dct}
+        :return rxn_info_dct: status, fit method, wall time (s), number of
+            least-squares iterations, and error message for each reaction
+        :rtype: dict {rxn: info_dct}
+        (all other inputs same as fit_rxn_ktp_dct)
+    """
+
+    assert fit_method in ALLOWED_FIT_METHODS, (
+        f"Fit method should be in {ALLOWED_FIT_METHODS}, not '{fit_method}'")
+    if nprocs == 'auto':
+        nprocs = os.cpu_count() or 1
+    fit_kwargs = {'pdep_dct': pdep_dct, 'arrfit_dct': arrfit_dct,
+                  'chebfit_dct': chebfit_dct, 'troefit_dct': troefit_dct}
+
+    rxns = list(rxn_ktp_dct.keys())
+    cheb_fit_dct = (_fit_cheb_batch(rxn_ktp_dct, fit_kwargs)
+                    if fit_method == 'cheb' else {})
+    if nprocs == 1 and timeout is None:
+        results = {}
+        for rxn in rxns:
+            print(f'\nFitting Reaction: {_rxn_name_str(rxn)}')
+            results[rxn] = _fit_one_rxn(rxn_ktp_dct[rxn], fit_method,
+                                        fit_kwargs,
+                                        cheb_fit=cheb_fit_dct.get(rxn))
+            print('--------------------------------\n')
+    else:
+        results = _fit_in_processes(rxn_ktp_dct, fit_method, fit_kwargs,
+                                    nprocs, timeout,
+                                    cheb_fit_dct=cheb_fit_dct)
+
+    # Collect everything in the input order
     rxn_param_dct = {}
     rxn_err_dct = {}
-    for rxn, ktp_dct in rxn_ktp_dct.items():
-        print(f'\nFitting Reaction: {rxn_name_str(rxn)}')
-        params, err_dct = fit_ktp_dct(ktp_dct, fit_method, pdep_dct=pdep_dct,
-                                      arrfit_dct=arrfit_dct,
-                                      chebfit_dct=chebfit_dct,
-                                      troefit_dct=troefit_dct)
+    rxn_info_dct = {}
+    for rxn in rxns:
+        params, err_dct, info_dct = results[rxn]
         if all(x is not None for x in (params, err_dct)):
             rxn_param_dct[rxn] = params
             rxn_err_dct[rxn] = err_dct
-        print('--------------------------------\n')
+        rxn_info_dct[rxn] = info_dct
 
-    return rxn_param_dct, rxn_err_dct
+    return rxn_param_dct, rxn_err_dct, rxn_info_dct
+
+
+def fit_report(rxn_info_dct):
+    """ Builds a table of per-reaction fitting statistics
+
+        :param rxn_info_dct: fitting info for each reaction
+        :type rxn_info_dct: dict {rxn: info_dct}
+        :return report: the formatted report
+        :rtype: str
+    """
+
+    lines = ['Fitting report',
+             f'{"status":<8} {"method":<6} {"time (s)":>9} {"iters":>5}  '
+             'reaction']
+    total_time = 0.0
+    for rxn, info_dct in rxn_info_dct.items():
+        total_time += info_dct['time']
+        line = (f'{info_dct["status"]:<8} {str(info_dct["method"]):<6} '
+                f'{info_dct["time"]:>9.2f} {info_dct["niter"]:>5d}  '
+                f'{_rxn_name_str(rxn)}')
+        if info_dct['message']:
+            line += f'  ({info_dct["message"]})'
+        lines.append(line)
+    nfail = sum(info_dct['status'] != 'ok'
+                for info_dct in rxn_info_dct.values())
+    lines.append(f'{len(rxn_info_dct)} reactions, {nfail} not fitted, '
+                 f'{total_time:.2f} s summed fitting time')
+
+    return '\n'.join(lines)
+
+
+def _fit_cheb_batch(rxn_ktp_dct, fit_kwargs):
+    """ Fits all reactions that will be fitted to a Chebyshev form with a
+        single call to cheb.get_params_batch, so that reactions on the same
+        T, P grid share one least-squares factorization. Reactions whose
+        preparation fails are left out and fitted on their own later.
+
+        :return cheb_fit_dct: fitted parameters and errors for each reaction
+        :rtype: dict {rxn: (params, err_dct)}
+    """
+
+    pdep_dct = fit_kwargs['pdep_dct'] or DEFAULT_PDEP
+    chebfit_dct = fit_kwargs['chebfit_dct'] or DEFAULT_CHEB
+
+    # The messages are printed again when each reaction is fitted
+    cheb_rxns, pdep_ktp_dcts = [], []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for rxn, ktp_dct in rxn_ktp_dct.items():
+            try:
+                pdep_ktp_dct = get_pdep_ktp_dct(
+                    ktp_dct, assess_temps=pdep_dct['temps'],
+                    tol=pdep_dct['tol'],
+                    plow=pdep_dct['plow'], phigh=pdep_dct['phigh'],
+                    pval=pdep_dct['pval'])
+                is_cheb = assess_fit_method(pdep_ktp_dct, 'cheb') == 'cheb'
+            except Exception:  # pylint: disable=broad-except
+                continue
+            if is_cheb:
+                cheb_rxns.append(rxn)
+                pdep_ktp_dcts.append(pdep_ktp_dct)
+        try:
+            params_lst, err_dcts = cheb.get_params_batch(
+                pdep_ktp_dcts,
+                tdeg=chebfit_dct['tdeg'], pdeg=chebfit_dct['pdeg'],
+                tol=chebfit_dct['tol'])
+        except Exception:  # pylint: disable=broad-except
+            params_lst, err_dcts = [], []
+
+    return dict(zip(cheb_rxns, zip(params_lst, err_dcts)))
+
+
+def _fit_one_rxn(ktp_dct, fit_method, fit_kwargs, cheb_fit=None):
+    """ Fits one reaction, trapping any exception so that it cannot abort a
+        batch of fits
+
+        :return params: fitted parameters, or None
+        :rtype: autoreact.RxnParams object
+        :return err_dct: fitting errors, or None
+        :rtype: dict {pressure: (temps, errs)}
+        :return info_dct: status, method, time, niter, and message
+        :rtype: dict
+    """
+
+    fit_info = {'niter': 0}
+    start = time.perf_counter()
+    try:
+        params, err_dct = fit_ktp_dct(ktp_dct, fit_method,
+                                      fit_info=fit_info, cheb_fit=cheb_fit,
+                                      **fit_kwargs)
+        status = 'ok' if params is not None else 'no fit'
+        message = ''
+    except Exception as exc:  # pylint: disable=broad-except
+        params, err_dct = None, None
+        status = 'error'
+        message = f'{type(exc).__name__}: {exc}'
+        print(f'Fit failed with {message}')
+    info_dct = {'status': status,
+                'method': fit_info.get('method'),
+                'time': time.perf_counter() - start,
+                'niter': fit_info['niter'],
+                'message': message}
+
+    return params, err_dct, info_dct
+
+
+def _fit_worker(ktp_dct, fit_method, fit_kwargs, cheb_fit, conn):
+    """ Runs _fit_one_rxn in a child process, capturing its printed output,
+        and sends (params, err_dct, info_dct, log) back through a pipe
+    """
+
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        params, err_dct, info_dct = _fit_one_rxn(ktp_dct, fit_method,
+                                                 fit_kwargs, cheb_fit=cheb_fit)
+    conn.send((params, err_dct, info_dct, log.getvalue()))
+    conn.close()
+
+
+def _fit_in_processes(rxn_ktp_dct, fit_method, fit_kwargs, nprocs, timeout,
+                      cheb_fit_dct=None):
+    """ Fits each reaction in its own child process, with at most nprocs
+        running at once. A child that exceeds the timeout is terminated.
+        The log of each fit is printed as a block once the fit finishes.
+        Chebyshev fits already in cheb_fit_dct are passed on to the children.
+
+        :return results: (params, err_dct, info_dct) for each reaction
+        :rtype: dict {rxn: tuple}
+    """
+
+    def _failed(status, method, elapsed, message):
+        return None, None, {'status': status, 'method': method,
+                            'time': elapsed, 'niter': 0, 'message': message}
+
+    cheb_fit_dct = cheb_fit_dct or {}
+    pending = list(rxn_ktp_dct.keys())[::-1]  # popped from the end
+    running = {}  # {rxn: (process, conn, start)}
+    results = {}
+    while pending or running:
+        # Start new fits while there are free workers
+        while pending and len(running) < max(nprocs, 1):
+            rxn = pending.pop()
+            recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+            proc = multiprocessing.Process(
+                target=_fit_worker,
+                args=(rxn_ktp_dct[rxn], fit_method, fit_kwargs,
+                      cheb_fit_dct.get(rxn), send_conn))
+            proc.start()
+            send_conn.close()
+            running[rxn] = (proc, recv_conn, time.perf_counter())
+
+        # Wait for a result or until the earliest deadline
+        wait_time = None
+        if timeout is not None:
+            now = time.perf_counter()
+            wait_time = max(min(start + timeout - now
+                                for _, _, start in running.values()), 0.0)
+        ready = multiprocessing.connection.wait(
+            [conn for _, conn, _ in running.values()], timeout=wait_time)
+
+        now = time.perf_counter()
+        for rxn, (proc, conn, start) in list(running.items()):
+            elapsed = now - start
+            if conn in ready:
+                try:
+                    params, err_dct, info_dct, log = conn.recv()
+                    print(f'\nFitting Reaction: {_rxn_name_str(rxn)}')
+                    print(log, end='')
+                    print('--------------------------------\n')
+                    results[rxn] = (params, err_dct, info_dct)
+                except EOFError:  # child died without sending anything
+                    print(f'\nFitting process for {_rxn_name_str(rxn)} '
+                          f'exited with code {proc.exitcode}')
+                    results[rxn] = _failed(
+                        'error', None, elapsed,
+                        f'process exited with code {proc.exitcode}')
+            elif timeout is not None and elapsed >= timeout:
+                proc.terminate()
+                print(f'\nFitting Reaction: {_rxn_name_str(rxn)} timed out '
+                      f'after {timeout} s; skipping')
+                results[rxn] = _failed('timeout', None, elapsed,
+                                       f'exceeded {timeout} s')
+            else:
+                continue
+            proc.join()
+            conn.close()
+            running.pop(rxn)
+
+    return results
 
 
 def fit_ktp_dct(ktp_dct, fit_method, pdep_dct=None, arrfit_dct=None,
-                chebfit_dct=None, troefit_dct=None):
+                chebfit_dct=None, troefit_dct=None, fit_info=None,
+                cheb_fit=None):
     """ Fits a single ktp_dct to some desired form
 
         :param ktp_dct: rate constants to be fitted
         :type ktp_dct: dict {pressure: (temps, kts)}
-        :param fit_method: desired fit form; 'arr', 'plog', 'cheb', or 'troe'
+        :param fit_method: desired fit form; 'arr', 'plog', 'cheb', 'troe',
+            or 'lind'
         :type fit_method: str
         :param pdep_dct: instructions for checking P dependence
         :type pdep_dct: dict
@@ -91,8 +358,15 @@ def fit_ktp_dct(ktp_dct, fit_method, pdep_dct=None, arrfit_dct=None,
         :type arrfit_dct: dict
         :param chebfit_dct: instructions for Chebyshev fitting
         :type chebfit_dct: dict
-        :param troefit_dct: instructions for Troe fitting
+        :param troefit_dct: instructions for Troe fitting (also Lindemann)
         :type troefit_dct: dict
+        :param fit_info: if given, filled with the fit method actually used
+            ('method') and the number of least-squares fits ('niter')
+        :type fit_info: dict
+        :param cheb_fit: Chebyshev parameters and errors already fitted to
+            the P-dependent rate constants, used if the Chebyshev form is
+            chosen
+        :type cheb_fit: (autoreact.RxnParams object, dict)
         :return params: fitted parameters
         :rtype: autoreact.RxnParams object
         :return err_dct: fitting errors
@@ -119,29 +393,57 @@ def fit_ktp_dct(ktp_dct, fit_method, pdep_dct=None, arrfit_dct=None,
 
         # Check the ktp_dct and the fit_method to see how to fit rates
         actual_fit_method = assess_fit_method(pdep_ktp_dct, fit_method)
+        if fit_info is not None:
+            fit_info['method'] = actual_fit_method
 
         # Get desired fit as instance of the RxnParams class, and the err_dct
-        if actual_fit_method == 'troe':
-            print('Troe not implemented. Not doing a fit')
+        if actual_fit_method in ('troe', 'lind'):
+            params, err_dct = troe.get_params(
+                pdep_ktp_dct, params=troefit_dct['params'],
+                tol=troefit_dct['tol'], lind=(actual_fit_method == 'lind'),
+                fit_info=fit_info)
+            # Use PLOG instead if the Troe or Lindemann form is inadequate
+            max_err = err.get_max_err(err_dct)
+            if max_err > troefit_dct['tol']:
+                print(f'{NICKNAMES[actual_fit_method]} fit error is '
+                      f'{max_err:.1f}%, which is more than the input limit of '
+                      f'{troefit_dct["tol"]}%. Fitting to PLOG form...')
+                params, err_dct = plog.get_params(
+                    pdep_ktp_dct, dbltol=arrfit_dct['dbltol'],
+                    fit_info=fit_info)
+                if fit_info is not None:
+                    fit_info['method'] = 'plog'
         elif actual_fit_method == 'arr':
             # dbl_iter = arrfit_dct.get('dbl_iter')  # unused for now
             params, err_dct = arr.get_params(
-                pdep_ktp_dct, dbltol=arrfit_dct['dbltol'])
+                pdep_ktp_dct, dbltol=arrfit_dct['dbltol'], fit_info=fit_info)
         elif actual_fit_method == 'plog':
             # dbl_iter = arrfit_dct.get('dbl_iter')  # unused for now
             params, err_dct = plog.get_params(
-                pdep_ktp_dct, dbltol=arrfit_dct['dbltol'])
+                pdep_ktp_dct, dbltol=arrfit_dct['dbltol'], fit_info=fit_info)
         elif actual_fit_method == 'cheb':
-            params, err_dct = cheb.get_params(
-                pdep_ktp_dct,
-                tdeg=chebfit_dct['tdeg'], pdeg=chebfit_dct['pdeg'],
-                tol=chebfit_dct['tol'])
+            if cheb_fit is not None:
+                params, err_dct = cheb_fit
+                cheb.check_max_err(err_dct, chebfit_dct['tol'])
+            else:
+                params, err_dct = cheb.get_params(
+                    pdep_ktp_dct,
+                    tdeg=chebfit_dct['tdeg'], pdeg=chebfit_dct['pdeg'],
+                    tol=chebfit_dct['tol'])
+            if fit_info is not None:
+                fit_info['niter'] = fit_info.get('niter', 0) + 1
     else:
         print('No rate constants to fit.')
 
     return params, err_dct
 
 
+def _rxn_name_str(rxn):
+    """ get a reaction name string
+    """
+    return ' = '.join((' + '.join(rxn[0]), ' + '.join(rxn[1])))
+
+
 def assess_fit_method(pdep_ktp_dct, fit_method):
     """ Checks a pdep_ktp_dct (i.e., already filtered for pressure dependence)
         to see if the selected fit method is acceptable. If something is amiss,
@@ -150,7 +452,8 @@ def assess_fit_method(pdep_ktp_dct, fit_method):
         :param pdep_ktp_dct: pressure-dependent rate constants; either 'high'
             only (if P-independent) or with all pressures (if P-dependent)
         :type pdep_ktp_dct: dict {pressure: (temps, kts)}
-        :param fit_method: desired fit form; 'arr', 'plog', 'cheb', or 'troe'
+        :param fit_method: desired fit form; 'arr', 'plog', 'cheb', 'troe',
+            or 'lind'
         :type fit_method: str
         :return actual_fit_method: fit method after checking P dependence; may
             be unchanged from original selection
@@ -11,7 +11,7 @@ RC = phycon.RC_CAL  # universal gas constant in cal/mol-K
 GUESS_BNDS = ((1, 1e4), (0.1, 20), (1, 100))  # guess bounds for double fitting
 
 
-def get_params(ktp_dct, dbltol=15, dbl_iter=1, tref=1.0):
+def get_params(ktp_dct, dbltol=15, dbl_iter=1, tref=1.0, fit_info=None):
     """ Gets the fitting parameters for an Arrhenius fit to rate constant data.
         Also gets the errors of that fit. Performs either a single or double
         Arrhenius fit.
@@ -24,6 +24,9 @@ def get_params(ktp_dct, dbltol=15, dbl_iter=1, tref=1.0):
         :type dbl_iter: int
         :param tref: reference temp for the modified Arrhenius form
         :type tref: float
+        :param fit_info: if given, 'niter' is incremented by the number of
+            least-squares fits performed
+        :type fit_info: dict
         :return params: fitted Arrhenius parameters
         :rtype: autoreact.RxnParams object
         :return err_dct: fitting errors
@@ -39,6 +42,7 @@ def get_params(ktp_dct, dbltol=15, dbl_iter=1, tref=1.0):
     sing_params = single_arr(temps, kts)
     sing_err_dct = err.get_err_dct(ktp_dct, sing_params)
     sing_max_err = err.get_max_err(sing_err_dct)
+    niter = 1
 
     # Put in checks to see if a single fit should be used
     # Sees if enough rate constants to do double fit, and error necessitates it
@@ -51,7 +55,7 @@ def get_params(ktp_dct, dbltol=15, dbl_iter=1, tref=1.0):
             print(f'Single fit error is {sing_max_err:.1f}%, which is less than'
                   f' the input limit of {dbltol}%. Using single fit.')
             use_single_fit = True
-            
+
     # Perform double fit if needed or just take single fit params
     if use_single_fit:
         params = sing_params
@@ -62,6 +66,7 @@ def get_params(ktp_dct, dbltol=15, dbl_iter=1, tref=1.0):
         # Perfom a double fit
         doub_params, guess_idx = double_arr(temps, kts, sing_params, tref=tref,
                                             dbltol=dbltol, dbl_iter=dbl_iter)
+        niter += guess_idx + 1
 
         # Assess errors
         doub_err_dct = err.get_err_dct(ktp_dct, doub_params)
@@ -84,6 +89,9 @@ def get_params(ktp_dct, dbltol=15, dbl_iter=1, tref=1.0):
             params = doub_params
             err_dct = doub_err_dct
 
+    if fit_info is not None:
+        fit_info['niter'] = fit_info.get('niter', 0) + niter
+
     return params, err_dct
 
 
@@ -148,6 +156,10 @@ def double_arr(temps, kts, sing_params, tref=1.0, dbltol=15, dbl_iter=1):
         do so by iterating across a range of guesses by modifying the provided
         single Arrhenius fitting parameters
 
+        The first guess is always SJK's; the remaining guesses are tried in
+        order of their initial residual, which is evaluated for all of them
+        at once. Fitting stops at the first guess that meets dbltol.
+
         :param temps: temperatures at which rate constants are defined (K)
         :type temps: numpy.ndarray of shape (num_temps,)
         :param kts: rate constants
@@ -166,95 +178,150 @@ def double_arr(temps, kts, sing_params, tref=1.0, dbltol=15, dbl_iter=1):
         :rtype: int
     """
 
-    def fit_doub_arr(temps, kts, sing_params, a_change, n_change, tref=1.0):
-        """ Performs one double Arrhenius fit by generating initial guesses
-            using changes to the single Arrhenius fit
-
-            :param a_change: amount by which to vary the A factor
-            :type a_change: float
-            :param n_change: amount by which to vary the temperature exponent
-            :type n_change: float
-            :return params: fitted double Arrhenius parameters
-            :rtype: autoreact.RxnParams object
-            (all other inputs same as parent function)
-        """
-
-        # Unpack the single Arrhenius params
-        # get first (& only) entry
-        sing_a, sing_n, sing_ea = sing_params.arr[0]
-
-        # Get a new tref for the double fit: the logarithmic midpoint temp
-        doub_tref = numpy.sqrt(max(temps) / min(temps)) * min(temps)
-
-        # Generate guesses by varying single parameters
-        sing_a = sing_a * (doub_tref / tref) ** sing_n  # convert to new basis
-        init_guess = [(sing_a * a_change), (sing_n + n_change), sing_ea,
-                      (sing_a * (1 - a_change)), (sing_n - n_change), sing_ea]
-
-        # Perform a least-squares fit
-        # print('init_guess test', init_guess)
-        # print('kts', kts)
-        # print('tref', doub_tref)
-        plsq = leastsq(_resid_func, init_guess,
-                       args=(temps, kts, doub_tref),
-                       ftol=1.0E-8, xtol=1.0E-8, maxfev=100000)
-
-        # Retrieve the fit params and convert A back to the input tref
-        raw_params = list(plsq[0])  # a list of length 6
-        raw_params[0] = raw_params[0] * (tref / doub_tref) ** raw_params[1]
-        raw_params[3] = raw_params[3] * (tref / doub_tref) ** raw_params[4]
-        # print('raw_params test', raw_params)
-
-        # Instantiate RxnParams
-        arr_dct = {'arr_tuples': [raw_params[:3], raw_params[3:]]}
-        params = RxnParams(arr_dct=arr_dct)
-
-        return params
-
-    # Create an array of predefined values to guess if the initial guess fails
-    a_changes = [0.1, 0.3, 0.5, 0.7, 0.9]
-    n_changes = [1.2, 1.5, 1.9, 2.5, 3]
-    predef_iter = len(a_changes) * len(n_changes) + 1  # +1 for the first guess
+    temps = numpy.asarray(temps, dtype=numpy.float64)
+    kts = numpy.asarray(kts, dtype=numpy.float64)
+
+    # Get a new tref for the double fit: the logarithmic midpoint temp
+    doub_tref = numpy.sqrt(max(temps) / min(temps)) * min(temps)
 
     # Make a maximum of dbl_iter attempts at a double fit
+    guesses = _double_guesses(temps, kts, sing_params, tref, doub_tref,
+                              dbl_iter)
     max_errs = []
-    prev_params = []
-    # Note: using 'high' here in place of the actual pressure; doesn't matter
-    # since this ref_ktp_dct never gets returned
-    ref_ktp_dct = {'high': (temps, kts)}  # used for err_dct later
-    for guess_idx in range(dbl_iter):
-        # Use SJK's guesses as first try
-        if guess_idx == 0:
-            a_change = 0.5
-            n_change = 2
-        # Otherwise, loop over the predefined A and n changes
-        else:
-            a_change = a_changes[(guess_idx - 1) % 5]
-            n_change = n_changes[int((guess_idx - 1) / 5)]
-
-        # Perform a double fit
-        params = fit_doub_arr(temps, kts, sing_params, a_change, n_change,
-                              tref=tref)
-
-        # Get an err_dct and the max error
-        err_dct = err.get_err_dct(ref_ktp_dct, params)
-        max_err = err.get_max_err(err_dct)
+    prev_fits = []
+    guess_idx = 0
+    for idx, init_guess in enumerate(guesses):
+        guess_idx = idx
+        fit = _fit_double(init_guess, temps, kts, doub_tref)
+        max_err = _double_max_err(fit, temps, kts, doub_tref)
         max_errs.append(max_err)
-        prev_params.append(params)
+        prev_fits.append(fit)
 
         # Exit the loop if tolerance is satisfied
         if max_err < dbltol:
             break
-        # If tolerance not satisfied and guesses have been exhausted, grab
-        # the result with the lowest error
-        if guess_idx in (dbl_iter - 1, predef_iter - 1):
-            min_idx = numpy.argmin(max_errs)
-            params = prev_params[min_idx]
-            break
+    # If tolerance not satisfied and guesses have been exhausted, grab
+    # the result with the lowest error
+    else:
+        fit = prev_fits[numpy.argmin(max_errs)]
+
+    # Convert A back to the input tref and instantiate RxnParams
+    raw_params = list(fit)  # a list of length 6
+    raw_params[0] = raw_params[0] * (tref / doub_tref) ** raw_params[1]
+    raw_params[3] = raw_params[3] * (tref / doub_tref) ** raw_params[4]
+    arr_dct = {'arr_tuples': [raw_params[:3], raw_params[3:]]}
+    params = RxnParams(arr_dct=arr_dct)
 
     return params, guess_idx
 
 
+def _fit_double(init_guess, temps, kts, tref):
+    """ Performs one double Arrhenius least-squares fit from an initial guess
+
+        The fit is done with ln(A) in place of A, which keeps the problem well
+        scaled. If that drives a term to an A that cannot be represented
+        (e.g., a negligible term drifting to huge A and Ea), the fit is redone
+        with A itself as the parameter.
+
+        :param init_guess: initial guess [A1, n1, Ea1, A2, n2, Ea2]
+        :type init_guess: numpy.ndarray of shape (6,)
+        :return fit: fitted params [A1, n1, Ea1, A2, n2, Ea2] relative to tref
+        :rtype: numpy.ndarray of shape (6,)
+    """
+
+    fit = numpy.full(6, numpy.nan)
+    with numpy.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        if init_guess[0] > 0 and init_guess[3] > 0:
+            log_guess = numpy.array(init_guess, dtype=numpy.float64)
+            log_guess[[0, 3]] = numpy.log(log_guess[[0, 3]])
+            log_fit = leastsq(_log_resid_func, log_guess,
+                              args=(temps, kts, tref), Dfun=_log_resid_jac,
+                              ftol=1.0E-8, xtol=1.0E-8, maxfev=100000)[0]
+            fit = log_fit.copy()
+            fit[[0, 3]] = numpy.exp(log_fit[[0, 3]])
+        if not numpy.all(numpy.isfinite(fit)):
+            fit = leastsq(_resid_func, init_guess,
+                          args=(temps, kts, tref), Dfun=_resid_jac,
+                          ftol=1.0E-8, xtol=1.0E-8, maxfev=100000)[0]
+
+    return fit
+
+
+def _double_guesses(temps, kts, sing_params, tref, doub_tref, dbl_iter):
+    """ Generates up to dbl_iter initial guesses for the double fit by
+        splitting the single Arrhenius A factor between two terms and
+        shifting their temperature exponents apart
+
+        :return guesses: guesses [A1, n1, Ea1, A2, n2, Ea2] relative to
+            doub_tref, in the order in which they should be tried
+        :rtype: numpy.ndarray of shape (num_guesses, 6)
+    """
+
+    # SJK's guess first, then the predefined changes in A and n
+    a_changes = [0.1, 0.3, 0.5, 0.7, 0.9]
+    n_changes = [1.2, 1.5, 1.9, 2.5, 3]
+    changes = [(0.5, 2)] + [(a_change, n_change) for n_change in n_changes
+                            for a_change in a_changes]
+    changes = numpy.array(changes[:max(dbl_iter, 1)])
+
+    # Generate guesses by varying single parameters
+    # get first (& only) entry
+    sing_a, sing_n, sing_ea = sing_params.arr[0]
+    sing_a = sing_a * (doub_tref / tref) ** sing_n  # convert to new basis
+    a_change, n_change = changes[:, 0], changes[:, 1]
+    sing_eas = numpy.full(len(changes), sing_ea)
+    guesses = numpy.column_stack((
+        sing_a * a_change, sing_n + n_change, sing_eas,
+        sing_a * (1 - a_change), sing_n - n_change, sing_eas))
+
+    # Try the rest in order of their initial residuals, all evaluated at once
+    with numpy.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        resids = numpy.log10(kts) - numpy.log10(
+            _double_kts(guesses[1:], temps, doub_tref))
+        costs = numpy.sum(resids**2, axis=1)
+    costs[~numpy.isfinite(costs)] = numpy.inf
+    order = numpy.argsort(costs, kind='stable')
+    guesses = numpy.vstack((guesses[:1], guesses[1:][order]))
+
+    return guesses
+
+
+def _double_kts(params, temps, tref):
+    """ Computes double Arrhenius rate constants for one or several sets of
+        parameters
+
+        :param params: double Arrhenius params [A1, n1, Ea1, A2, n2, Ea2]
+        :type params: numpy.ndarray of shape (6,) or (num_sets, 6)
+        :return kts: rate constants
+        :rtype: numpy.ndarray of shape (num_temps,) or (num_sets, num_temps)
+    """
+
+    params = numpy.asarray(params, dtype=numpy.float64)
+    log_temps = numpy.log(temps / tref)
+    inv_rts = 1.0 / (RC * temps)
+    k_fit1 = params[..., 0, None] * numpy.exp(
+        params[..., 1, None] * log_temps - params[..., 2, None] * inv_rts)
+    k_fit2 = params[..., 3, None] * numpy.exp(
+        params[..., 4, None] * log_temps - params[..., 5, None] * inv_rts)
+    kts = k_fit1 + k_fit2
+
+    return kts
+
+
+def _double_max_err(params, temps, kts, tref):
+    """ Gets the max absolute percent error of a double Arrhenius fit
+        directly from the arrays; non-finite errors count as infinite
+    """
+
+    with numpy.errstate(over='ignore', invalid='ignore'):
+        max_err = numpy.max(numpy.abs(
+            100 * (_double_kts(params, temps, tref) - kts) / kts))
+    if not numpy.isfinite(max_err):
+        max_err = numpy.inf
+
+    return max_err
+
+
 def _resid_func(curr_guess, temps, kts, tref):
     """ Computes the residual between fit and data for double fitter
 
@@ -281,6 +348,109 @@ def _resid_func(curr_guess, temps, kts, tref):
     return resid
 
 
+def _resid_jac(curr_guess, temps, _kts, tref):
+    """ Computes the analytic Jacobian of the double fitter residual,
+        d(resid)/d(params)
+
+        :param curr_guess: current guess for double Arrhenius params
+        :type curr_guess: list [A1, n1, Ea1, A2, n2, Ea2]
+        :param temps: temperatures at which rate constants are defined (K)
+        :type temps: numpy.ndarray of shape (num_temps,)
+        :param _kts: rate constants (unused; for the leastsq call signature)
+        :type _kts: Numpy.ndarray of shape (num_temps,)
+        :param tref: reference temp for the modified Arrhenius form
+        :type tref: float
+        :return jac: Jacobian of the residual
+        :rtype: Numpy.ndarray of shape (num_temps, 6)
+    """
+
+    log_temps = numpy.log(temps / tref)
+    inv_rts = 1.0 / (RC * temps)
+    exp1 = numpy.exp(curr_guess[1] * log_temps - curr_guess[2] * inv_rts)
+    exp2 = numpy.exp(curr_guess[4] * log_temps - curr_guess[5] * inv_rts)
+    k_fit1 = curr_guess[0] * exp1
+    k_fit2 = curr_guess[3] * exp2
+
+    # resid = log10(kts) - log10(k_fit1 + k_fit2)
+    scale = -1.0 / (numpy.log(10) * (k_fit1 + k_fit2))
+    jac = numpy.column_stack((
+        scale * exp1, scale * k_fit1 * log_temps, -scale * k_fit1 * inv_rts,
+        scale * exp2, scale * k_fit2 * log_temps, -scale * k_fit2 * inv_rts))
+
+    return jac
+
+
+def _log_resid_func(curr_guess, temps, kts, tref):
+    """ Computes the residual between fit and data for double fitter, with
+        the A factors given as ln(A)
+
+        :param curr_guess: current guess for double Arrhenius params
+        :type curr_guess: list [ln(A1), n1, Ea1, ln(A2), n2, Ea2]
+        :param temps: temperatures at which rate constants are defined (K)
+        :type temps: numpy.ndarray of shape (num_temps,)
+        :param kts: rate constants
+        :type kts: Numpy.ndarray of shape (num_temps,)
+        :param tref: reference temp for the modified Arrhenius form
+        :type tref: float
+        :return resid: residual between fit and data
+        :rtype: Numpy.ndarray of shape (num_temps,)
+    """
+
+    ln_k_fit1, ln_k_fit2 = _log_terms(curr_guess, temps, tref)
+    ln_k_fit = numpy.logaddexp(ln_k_fit1, ln_k_fit2)
+    resid = numpy.log10(kts) - ln_k_fit / numpy.log(10)
+
+    return resid
+
+
+def _log_resid_jac(curr_guess, temps, _kts, tref):
+    """ Computes the analytic Jacobian of the double fitter residual with
+        the A factors given as ln(A), d(resid)/d(params)
+
+        :param curr_guess: current guess for double Arrhenius params
+        :type curr_guess: list [ln(A1), n1, Ea1, ln(A2), n2, Ea2]
+        :param temps: temperatures at which rate constants are defined (K)
+        :type temps: numpy.ndarray of shape (num_temps,)
+        :param _kts: rate constants (unused; for the leastsq call signature)
+        :type _kts: Numpy.ndarray of shape (num_temps,)
+        :param tref: reference temp for the modified Arrhenius form
+        :type tref: float
+        :return jac: Jacobian of the residual
+        :rtype: Numpy.ndarray of shape (num_temps, 6)
+    """
+
+    log_temps = numpy.log(temps / tref)
+    inv_rts = 1.0 / (RC * temps)
+    ln_k_fit1, ln_k_fit2 = _log_terms(curr_guess, temps, tref)
+
+    # Fraction of the total rate constant coming from each term
+    ln_k_fit = numpy.logaddexp(ln_k_fit1, ln_k_fit2)
+    frac1 = numpy.exp(ln_k_fit1 - ln_k_fit)
+    frac2 = numpy.exp(ln_k_fit2 - ln_k_fit)
+
+    scale = -1.0 / numpy.log(10)
+    jac = scale * numpy.column_stack((
+        frac1, frac1 * log_temps, -frac1 * inv_rts,
+        frac2, frac2 * log_temps, -frac2 * inv_rts))
+
+    return jac
+
+
+def _log_terms(curr_guess, temps, tref):
+    """ Computes ln(k) of each of the two terms of a double Arrhenius form
+        with the A factors given as ln(A)
+    """
+
+    log_temps = numpy.log(temps / tref)
+    inv_rts = 1.0 / (RC * temps)
+    ln_k_fit1 = curr_guess[0] + curr_guess[1] * log_temps \
+        - curr_guess[2] * inv_rts
+    ln_k_fit2 = curr_guess[3] + curr_guess[4] * log_temps \
+        - curr_guess[5] * inv_rts
+
+    return ln_k_fit1, ln_k_fit2
+
+
 def check_for_inf(params):
     """ Checks for infinite values in fitted Arrhenius parameters
 
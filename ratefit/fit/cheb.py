@@ -2,7 +2,7 @@
 """
 
 import numpy
-from scipy.special import eval_chebyt
+from numpy.polynomial.chebyshev import chebvander
 from autoreact.params import RxnParams
 from ratefit.fit import arr
 from ratefit.fit import err
@@ -29,32 +29,68 @@ def get_params(ktp_dct, tdeg=4, pdeg=6, tol=20.0):
         :rtype: dict {pressure: (temps, errs)}
     """
 
-    # Check the viability of the ktp_dct
-    is_viable = check_viability(ktp_dct)
-    assert is_viable, '# of temps is not the same at all pressures'
+    params_lst, err_dcts = get_params_batch(
+        (ktp_dct,), tdeg=tdeg, pdeg=pdeg, tol=tol)
 
-    # Obtain fit params for the 1-atm rate constants (used for printing only)
-    one_atm_arr = get_one_atm_arr(ktp_dct)  # tuple of tuples
+    return params_lst[0], err_dcts[0]
 
-    alpha, tlim, plim = get_alpha(ktp_dct, tdeg=tdeg, pdeg=pdeg)
 
-    # Store items in a cheb_dct and instantiate RxnParams
-    cheb_dct = {
-        'alpha': alpha,
-        'tlim': tlim,
-        'plim': plim,
-        'one_atm_arr': one_atm_arr}
-    params = RxnParams(cheb_dct=cheb_dct)
-    err_dct = err.get_err_dct(ktp_dct, params)
+def get_params_batch(ktp_dcts, tdeg=4, pdeg=6, tol=20.0):
+    """ Gets the fitting parameters and errors for Chebyshev fits to several
+        sets of rate constant data at once. Sets sharing a T, P grid are
+        solved with a single least-squares factorization.
+
+        :param ktp_dcts: rate constants to be fitted; should be P-dependent
+        :type ktp_dcts: list [ktp_dct1, ktp_dct2, ...]
+        :param tdeg: number of temperature coefficients
+        :type tdeg: int
+        :param pdeg: number of pressure coefficients
+        :type pdeg: int
+        :param tol: percent error tolerance, above which to warn the user of a
+            bad Chebyshev fit
+        :type tol: float
+        :return params_lst: fitted parameters, in the order of ktp_dcts
+        :rtype: list [autoreact.RxnParams object, ...]
+        :return err_dcts: fitting errors, in the order of ktp_dcts
+        :rtype: list [dict {pressure: (temps, errs)}, ...]
+    """
+
+    for ktp_dct in ktp_dcts:
+        assert check_viability(ktp_dct), (
+            '# of temps is not the same at all pressures')
+
+    params_lst, err_dcts = [], []
+    alpha_lst = get_alphas(ktp_dcts, tdeg=tdeg, pdeg=pdeg)
+    for ktp_dct, (alpha, tlim, plim) in zip(ktp_dcts, alpha_lst):
+        cheb_dct = {
+            'alpha': alpha,
+            'tlim': tlim,
+            'plim': plim,
+            'one_atm_arr': get_one_atm_arr(ktp_dct)}
+        params = RxnParams(cheb_dct=cheb_dct)
+        err_dct = err.get_err_dct(ktp_dct, params)
+        check_max_err(err_dct, tol)
+        params_lst.append(params)
+        err_dcts.append(err_dct)
+
+    return params_lst, err_dcts
+
+
+def check_max_err(err_dct, tol):
+    """ Prints a warning if the maximum error of a Chebyshev fit exceeds the
+        tolerance
+
+        :param err_dct: fitting errors
+        :type err_dct: dict {pressure: (temps, errs)}
+        :param tol: percent error tolerance
+        :type tol: float
+    """
 
-    # Print a warning if the max_err exceeds the input tol
     max_err = err.get_max_err(err_dct)
     if max_err > tol:
         print(f'The maximum Chebyshev fitting error, {max_err:.1f}, is greater'
               f' than the desired max error, {tol:.1f}')
 
-    return params, err_dct
-
 
 def get_alpha(ktp_dct, tdeg=4, pdeg=6):
     """ Performs the Chebyshev fit: gets the alpha matrix
@@ -73,33 +109,92 @@ def get_alpha(ktp_dct, tdeg=4, pdeg=6):
         :rtype: tuple (pmin, pmax)
     """
 
-    def conv_dct_to_array(ktp_dct):
-        """ Converts the contents of a ktp_dct to a Numpy array
+    return get_alphas((ktp_dct,), tdeg=tdeg, pdeg=pdeg)[0]
 
-            :return tp_array: array of kts
-            :rtype: Numpy array of shape (num_temps, num_pressures)
-        """
 
-        # Check the first pressure to get the number of temps (same for all)
-        num_temps = len(ktp_dct[list(ktp_dct.keys())[0]][0])
-        num_pressures = len(ktp_dct)
-        pt_array = numpy.ndarray([num_pressures, num_temps])
-        pressures = tuple(pressure for pressure in ktp_dct.keys()
-                          if pressure != 'high')
-        for pidx, pressure in enumerate(pressures):
-            _, kts = ktp_dct[pressure]
-            pt_array[pidx, :] = kts
-
-        tp_array = numpy.transpose(pt_array)
+def get_alphas(ktp_dcts, tdeg=4, pdeg=6):
+    """ Performs the Chebyshev fits for several ktp_dcts: gets the alpha
+        matrix of each. The ktp_dcts are grouped by T, P grid; within a
+        group, all fits with rate constants defined on the full grid share
+        one design matrix and are solved in a single call to lstsq.
 
-        return tp_array
+        :param ktp_dcts: rate constants to be fitted; should be P-dependent
+        :type ktp_dcts: list [ktp_dct1, ktp_dct2, ...]
+        :param tdeg: number of temperature coefficients
+        :type tdeg: int
+        :param pdeg: number of pressure coefficients
+        :type pdeg: int
+        :return alpha_lst: (alpha, tlim, plim) for each ktp_dct, in order
+        :rtype: list [(numpy.ndarray, (tmin, tmax), (pmin, pmax)), ...]
+    """
 
-    pressures = tuple(pressure for pressure in ktp_dct.keys()
-                      if pressure != 'high')
-    temps = ktp_dct[pressures[0]][0]  # all temp vectors should be the same
+    # Group the ktp_dcts by grid so each design matrix is built only once
+    grid_dct = {}
+    for idx, ktp_dct in enumerate(ktp_dcts):
+        pressures = tuple(pressure for pressure in ktp_dct.keys()
+                          if pressure != 'high')
+        temps = numpy.asarray(ktp_dct[pressures[0]][0], dtype=numpy.float64)
+        grid_key = (pressures, temps.tobytes())
+        if grid_key not in grid_dct:
+            grid_dct[grid_key] = (pressures, temps, [])
+        grid_dct[grid_key][2].append(idx)
+
+    alpha_dct = {}
+    for pressures, temps, idxs in grid_dct.values():
+        amat, tlim, plim = design_matrix(temps, pressures, tdeg, pdeg)
+
+        # Rows are ordered pressure-major, i.e., row = pidx * tnum + tidx;
+        # log10 of zero or negative rate constants gives -inf or nan, so
+        # those rows are dropped; a single nonfinite value in the batched
+        # lstsq would otherwise make every fit in the group nan
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            bmat = numpy.log10(numpy.array(
+                [[ktp_dcts[idx][pressure][1] for pressure in pressures]
+                 for idx in idxs], dtype=numpy.float64).reshape(len(idxs), -1))
+        complete = numpy.isfinite(bmat).all(axis=1)
+
+        # Solve all fits without missing values together...
+        thetas = numpy.zeros((len(idxs), tdeg * pdeg))
+        if complete.any():
+            thetas[complete] = numpy.linalg.lstsq(
+                amat, bmat[complete].T, rcond=RCOND)[0].T
+        # ...and the remaining ones one at a time on their nonmissing rows
+        for bidx in numpy.flatnonzero(~complete):
+            keep = numpy.isfinite(bmat[bidx])
+            thetas[bidx] = numpy.linalg.lstsq(
+                amat[keep], bmat[bidx, keep], rcond=RCOND)[0]
+
+        # Columns are ordered pidx2 * tdeg + tidx2
+        for idx, theta in zip(idxs, thetas):
+            alpha = theta.reshape(pdeg, tdeg).T.copy()
+            alpha_dct[idx] = (alpha, tlim, plim)
+
+    return [alpha_dct[idx] for idx in range(len(ktp_dcts))]
+
+
+def design_matrix(temps, pressures, tdeg, pdeg):
+    """ Builds the least-squares design matrix of a Chebyshev fit as the
+        Kronecker product of the Chebyshev Vandermonde matrices in reduced
+        pressure and reduced temperature
+
+        :param temps: temperatures (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures (atm)
+        :type pressures: tuple
+        :param tdeg: number of temperature coefficients
+        :type tdeg: int
+        :param pdeg: number of pressure coefficients
+        :type pdeg: int
+        :return amat: design matrix; element [pidx * tnum + tidx,
+            pidx2 * tdeg + tidx2] is T_tidx2(tred[tidx]) * T_pidx2(pred[pidx])
+        :rtype: numpy.ndarray of shape (tnum * pnum, tdeg * pdeg)
+        :return tlim: minimum and maximum temperatures of fit
+        :rtype: tuple (tmin, tmax)
+        :return plim: minimum and maximum pressures of fit
+        :rtype: tuple (pmin, pmax)
+    """
 
-    # Get info on temps and pressures
-    tnum, pnum = len(temps), len(pressures)
+    temps = numpy.asarray(temps, dtype=numpy.float64)
     tmin, tmax = min(temps), max(temps)
     pmin, pmax = min(pressures), max(pressures)
 
@@ -109,49 +204,9 @@ def get_alpha(ktp_dct, tdeg=4, pdeg=6):
     pred = (2*numpy.log10(pressures) - numpy.log10(pmin) - numpy.log10(pmax))\
         / (numpy.log10(pmax) - numpy.log10(pmin))
 
-    # Convert the ktp_dct to a Numpy array of shape (num_temps, num_pressures)
-    tp_array = conv_dct_to_array(ktp_dct)
-
-    # Create matrices for fits
-    amat = numpy.zeros((tnum * pnum, tdeg * pdeg), numpy.float64)
-    bvec = numpy.zeros((tnum * pnum), numpy.float64)
-    nzero = 0
-    for tidx1, temp in enumerate(tred):
-        for pidx1, press in enumerate(pred):
-            for tidx2 in range(tdeg):
-                for pidx2 in range(pdeg):
-                    idx1 = (pidx1 * tnum + tidx1)
-                    idx2 = (pidx2 * tdeg + tidx2)
-                    amat[idx1, idx2] = (
-                        eval_chebyt(tidx2, temp) * eval_chebyt(pidx2, press))
-            if tp_array[tidx1, pidx1] is not None:
-                bvec[idx1] = numpy.log10(tp_array[tidx1, pidx1])
-            else:
-                bvec[idx1] = None
-                nzero += 1
-
-    nnonzero = tnum * pnum - nzero
-    idxp = -1
-    amatp = numpy.zeros((nnonzero, tdeg * pdeg), numpy.float64)
-    bvecp = numpy.zeros((nnonzero), numpy.float64)
-    for idx in range(tnum*pnum):
-        if not numpy.isnan(bvec[idx]):
-            idxp += 1
-            bvecp[idxp] = bvec[idx]
-            for idx2 in range(tdeg*pdeg):
-                amatp[idxp, idx2] = amat[idx, idx2]
-
-    # Perform least-squares fit to get alpha coefficients
-    theta = numpy.linalg.lstsq(amatp, bvecp, rcond=RCOND)[0]
-
-    alpha = numpy.zeros((tdeg, pdeg), numpy.float64)
-    for tidx2 in range(tdeg):
-        for pidx2 in range(pdeg):
-            alpha[tidx2, pidx2] = theta[pidx2 * tdeg + tidx2]
-    tlim = (tmin, tmax)
-    plim = (pmin, pmax)
-
-    return alpha, tlim, plim
+    amat = numpy.kron(chebvander(pred, pdeg - 1), chebvander(tred, tdeg - 1))
+
+    return amat, (tmin, tmax), (pmin, pmax)
 
 
 def check_viability(ktp_dct):
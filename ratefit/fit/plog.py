@@ -5,7 +5,7 @@ from autoreact.params import RxnParams
 from ratefit.fit import arr
 
 
-def get_params(ktp_dct, dbltol=15, dbl_iter=1, tref=1.0):
+def get_params(ktp_dct, dbltol=15, dbl_iter=1, tref=1.0, fit_info=None):
     """ Gets the fitting parameters for a PLOG fit to rate constant data.
         Also gets the errors of that fit. Performs either a single or double
         Arrhenius fit at each pressure
@@ -18,6 +18,9 @@ def get_params(ktp_dct, dbltol=15, dbl_iter=1, tref=1.0):
         :type dbl_iter: int
         :param tref: reference temp for the modified Arrhenius form
         :type tref: float
+        :param fit_info: if given, 'niter' is incremented by the number of
+            least-squares fits performed at all pressures
+        :type fit_info: dict
         :return params: fitted Arrhenius parameters
         :rtype: autoreact.RxnParams object
         :return err_dct: fitting errors
@@ -35,7 +38,8 @@ def get_params(ktp_dct, dbltol=15, dbl_iter=1, tref=1.0):
         # Create a ktp_dct with only one pressure for use with Arrhenius fitter
         temp_ktp_dct = {pressure: ktp_dct[pressure]}
         temp_params, temp_err_dct = arr.get_params(
-            temp_ktp_dct, dbltol=dbltol, dbl_iter=dbl_iter, tref=tref)
+            temp_ktp_dct, dbltol=dbltol, dbl_iter=dbl_iter, tref=tref,
+            fit_info=fit_info)
         arr_params = temp_params.arr  # get the Arrhenius parameters
         plog_dct[pressure] = arr_params  # update the plog_dct
         err_dct[pressure] = temp_err_dct[pressure]  # update the err_dct
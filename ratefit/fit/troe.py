@@ -0,0 +1,242 @@
+""" Fits rate constants to a Troe or Lindemann form
+
+    The high- and low-pressure limits (modified Arrhenius) and the Troe
+    broadening parameters are fitted together by nonlinear least squares on
+    ln k, using the expressions in ratefit.calc
+"""
+
+import numpy
+from scipy.optimize import least_squares
+from autoreact.params import RxnParams
+from ratefit import calc
+from ratefit.fit import arr
+from ratefit.fit import err
+
+TROE_NAMES = ('alpha', 'ts3', 'ts1', 'ts2')  # order used in troe_params
+TROE_GUESS = {'alpha': 0.19, 'ts3': 6.0e4, 'ts1': 590.0, 'ts2': 1.0e6}
+TROE_SEEDS = (  # further (alpha, ts3, ts1, ts2) starting points
+    (0.5, 1.0e3, 1.0e4, 5.0e3),
+    (0.8, 1.0e2, 2.0e3, 5.0e3),
+    (0.3, 1.0e4, 1.0e2, 1.0e4))
+LOG_TS_BNDS = (-30.0, 30.0)  # bounds on log10 of the Troe temperatures
+MAX_RESID = 1.0e3  # stands in for non-finite residuals
+
+
+def get_params(ktp_dct, params=('ts1', 'ts2', 'ts3', 'alpha'), tol=20.0,
+               lind=False, tref=1.0, fit_info=None):
+    """ Gets the fitting parameters for a Troe (or Lindemann) fit to rate
+        constant data. Also gets the errors of that fit.
+
+        A Lindemann fit is done first and used as the starting point of the
+        Troe fit, which is restarted from a few other broadening parameters
+        if its error is above tol. Troe parameters that are not fitted are
+        held at their usual defaults; if T** is not fitted, it is left out.
+
+        :param ktp_dct: rate constants to be fitted; should be P-dependent
+            and may include a 'high' entry for the high-P limit
+        :type ktp_dct: dict {pressure: (temps, kts)}
+        :param params: Troe parameters to fit; any of 'alpha', 'ts1' (T*),
+            'ts2' (T**), and 'ts3' (T***)
+        :type params: tuple
+        :param tol: max error (%) at which a Troe fit is accepted without
+            trying other starting points
+        :type tol: float
+        :param lind: whether to stop at the Lindemann form
+        :type lind: bool
+        :param tref: reference temp for the modified Arrhenius form
+        :type tref: float
+        :param fit_info: if given, 'niter' is incremented by the number of
+            least-squares fits performed
+        :type fit_info: dict
+        :return params: fitted Troe or Lindemann parameters
+        :rtype: autoreact.RxnParams object
+        :return err_dct: fitting errors
+        :rtype: dict {pressure: (temps, errs)}
+    """
+
+    assert any(pressure != 'high' for pressure in ktp_dct), (
+        'ktp_dct for a Troe or Lindemann fit needs numerical pressures')
+    data = _flatten(ktp_dct)
+
+    # Fit the Lindemann form, starting from single Arrhenius fits to the limits
+    highp_guess, lowp_guess = _limit_guesses(ktp_dct, tref)
+    lind_vars = numpy.concatenate(
+        (_arr_to_vars(highp_guess), _arr_to_vars(lowp_guess)))
+    lind_vars, lind_err = _fit(lind_vars, (), {}, data, tref)
+    niter = 1
+    best_vars, best_names, best_err = lind_vars, (), lind_err
+    fixed = {}
+    print(f'Lindemann fit obtained with max error of {lind_err:.1f}%.')
+
+    # Fit the Troe form, starting from the Lindemann limits
+    if not lind:
+        names = tuple(name for name in TROE_NAMES[:3] if name in params)
+        if 'ts2' in params:
+            names += ('ts2',)
+        fixed = {name: TROE_GUESS[name] for name in TROE_NAMES[:3]
+                 if name not in names}
+        seeds = (tuple(TROE_GUESS[name] for name in TROE_NAMES),)
+        seeds += TROE_SEEDS if names else ()
+        best_err = numpy.inf
+        for seed in seeds:
+            seed = dict(zip(TROE_NAMES, seed))
+            init_vars = numpy.concatenate(
+                (lind_vars, _troe_to_vars(seed, names)))
+            fit_vars, max_err = _fit(init_vars, names, fixed, data, tref)
+            niter += 1
+            if max_err < best_err:
+                best_vars, best_names, best_err = fit_vars, names, max_err
+            if best_err < tol:
+                break
+        print(f'Troe fit obtained with max error of {best_err:.1f}% '
+              f'after {niter - 1} iteration(s).')
+
+    # Build the RxnParams and get the errors against the input rate constants
+    highp_arr, lowp_arr, troe_params = _unpack(best_vars, best_names, fixed)
+    if lind:
+        params = RxnParams(lind_dct={'highp_arr': [highp_arr],
+                                     'lowp_arr': [lowp_arr]})
+    else:
+        params = RxnParams(troe_dct={'highp_arr': [highp_arr],
+                                     'lowp_arr': [lowp_arr],
+                                     'troe_params': troe_params})
+    err_dct = err.get_err_dct(ktp_dct, params)
+    if fit_info is not None:
+        fit_info['niter'] = fit_info.get('niter', 0) + niter
+
+    return params, err_dct
+
+
+def _flatten(ktp_dct):
+    """ Puts the positive rate constants at all pressures into flat arrays
+
+        :return data: temps, pressures (1.0 for 'high'), mask of the 'high'
+            entries, and ln k
+        :rtype: tuple of numpy.ndarray
+    """
+
+    temps, pressures, highp_mask, ln_kts = [], [], [], []
+    for pressure, (ptemps, kts) in ktp_dct.items():
+        ptemps = numpy.asarray(ptemps, dtype=float)
+        kts = numpy.asarray(kts, dtype=float)
+        valid = kts > 0.0
+        temps.append(ptemps[valid])
+        ln_kts.append(numpy.log(kts[valid]))
+        is_high = pressure == 'high'
+        pressures.append(numpy.full(valid.sum(), 1.0 if is_high else pressure))
+        highp_mask.append(numpy.full(valid.sum(), is_high))
+
+    return tuple(map(numpy.concatenate,
+                     (temps, pressures, highp_mask, ln_kts)))
+
+
+def _limit_guesses(ktp_dct, tref):
+    """ Single Arrhenius guesses for the high- and low-pressure limits: the
+        high-P limit from the 'high' (or highest-pressure) rate constants and
+        the low-P limit from the lowest-pressure rate constants over [M]
+    """
+
+    pressures = sorted(pressure for pressure in ktp_dct if pressure != 'high')
+    guesses = []
+    for pressure, scale in (('high' if 'high' in ktp_dct else pressures[-1],
+                             None),
+                            (pressures[0], pressures[0])):
+        temps = numpy.asarray(ktp_dct[pressure][0], dtype=float)
+        kts = numpy.asarray(ktp_dct[pressure][1], dtype=float)
+        valid = kts > 0.0
+        temps, kts = temps[valid], kts[valid]
+        if scale is not None:
+            kts = kts / calc.p_to_m(scale, temps)
+        guesses.append(arr.single_arr(temps, kts, tref=tref).arr[0])
+
+    return guesses
+
+
+def _fit(init_vars, names, fixed, data, tref):
+    """ Runs the least-squares fit from one starting point
+
+        :return fit_vars: fitted variables
+        :rtype: numpy.ndarray
+        :return max_err: max absolute error of the fit (%)
+        :rtype: float
+    """
+
+    lower = numpy.full(len(init_vars), -numpy.inf)
+    upper = numpy.full(len(init_vars), numpy.inf)
+    for idx, name in enumerate(names, start=6):
+        lower[idx], upper[idx] = (0.0, 1.0) if name == 'alpha' else LOG_TS_BNDS
+    init_vars = numpy.clip(init_vars, lower, upper)
+
+    fit = least_squares(_resid_func, init_vars, bounds=(lower, upper),
+                        x_scale='jac', args=(names, fixed, data, tref))
+    max_err = 100.0 * numpy.max(numpy.abs(numpy.expm1(fit.fun)))
+
+    return fit.x, max_err
+
+
+def _resid_func(fit_vars, names, fixed, data, tref):
+    """ Residuals in ln k between the Troe (or Lindemann) form and the data
+    """
+
+    temps, pressures, highp_mask, ln_kts = data
+    highp_arr, lowp_arr, troe_params = _unpack(fit_vars, names, fixed)
+    with numpy.errstate(all='ignore'):
+        highp_kts = calc.single_arrhenius(*highp_arr, tref, temps)
+        lowp_kts = calc.single_arrhenius(*lowp_arr, tref, temps)
+        if troe_params is None:
+            kts = calc.lindemann_one_pressure(
+                highp_kts, lowp_kts, temps, pressures)
+        else:
+            alpha, ts3, ts1 = troe_params[:3]
+            ts2 = troe_params[3] if len(troe_params) == 4 else None
+            kts = calc.troe_one_pressure(
+                highp_kts, lowp_kts, temps, pressures, alpha, ts3, ts1,
+                ts2=ts2)
+        kts = numpy.where(highp_mask, highp_kts, kts)
+        resid = numpy.log(kts) - ln_kts
+
+    return numpy.where(numpy.isnan(resid), MAX_RESID,
+                       numpy.clip(resid, -MAX_RESID, MAX_RESID))
+
+
+def _arr_to_vars(arr_params):
+    """ Converts [A, n, Ea] to the fitted variables [ln A, n, Ea]
+    """
+    a_par, n_par, ea_par = arr_params
+    return numpy.array([numpy.log(a_par), n_par, ea_par])
+
+
+def _troe_to_vars(troe_dct, names):
+    """ Converts the Troe parameters in names to the fitted variables; alpha
+        is fitted as is and the temperatures as log10
+    """
+    return numpy.array([troe_dct[name] if name == 'alpha'
+                        else numpy.log10(troe_dct[name]) for name in names])
+
+
+def _unpack(fit_vars, names, fixed):
+    """ Converts the fitted variables back to Arrhenius and Troe parameters
+
+        :return highp_arr: [A, n, Ea] for the high-P limit
+        :rtype: list
+        :return lowp_arr: [A, n, Ea] for the low-P limit
+        :rtype: list
+        :return troe_params: [alpha, T***, T*] or [alpha, T***, T*, T**];
+            None for the Lindemann form
+        :rtype: list
+    """
+
+    highp_arr = [float(numpy.exp(fit_vars[0])), float(fit_vars[1]),
+                 float(fit_vars[2])]
+    lowp_arr = [float(numpy.exp(fit_vars[3])), float(fit_vars[4]),
+                float(fit_vars[5])]
+    if len(fit_vars) == 6 and not fixed:
+        troe_params = None
+    else:
+        troe_dct = dict(fixed)
+        for name, val in zip(names, fit_vars[6:]):
+            troe_dct[name] = float(val if name == 'alpha' else 10**val)
+        troe_params = [troe_dct[name] for name in TROE_NAMES
+                       if name in troe_dct]
+
+    return highp_arr, lowp_arr, troe_params
@@ -1,12 +0,0 @@
-"""
-Functions to fit rate constants to Lindemann or Troe expressions
-"""
-
-from ratefit.fit.troe._fitfxn import reaction
-from ratefit.fit.troe._fitdct import pes
-
-
-__all__ = [
-    'reaction',
-    'pes'
-]
@@ -1,8 +0,0 @@
- ${fit_tol_str}
- ${fit_idx_str}
- ${fit_option_idx}
- ${highp_params_str}
- ${lowp_params_str}
- ${troe_params_str}
- ${num_tk} 
-${kpt_str}
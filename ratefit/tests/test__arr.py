@@ -1,6 +1,8 @@
 """ Test arrhenius fitter
 """
 
+# pylint: disable=protected-access
+
 import numpy
 from ratefit.fit import arr
 from ratefit.fit import err
@@ -57,6 +59,32 @@ def test_double():
     assert max_err < 1  # %
 
 
+def test_resid_jac():
+    """ Test the analytic Jacobians of the double fitter residuals against
+        finite differences
+    """
+    tref = 500.0
+    guess = numpy.array([1e12, 0.5, 3000.0, 1e9, 2.2, -500.0])
+    log_guess = guess.copy()
+    log_guess[[0, 3]] = numpy.log(guess[[0, 3]])
+    for resid_func, jac_func, params in (
+            (arr._resid_func, arr._resid_jac, guess),
+            (arr._log_resid_func, arr._log_resid_jac, log_guess)):
+        jac = jac_func(params, TEMPS_2, KTS_2, tref)
+        assert jac.shape == (len(TEMPS_2), 6)
+        for idx in range(6):
+            step = 1e-6 * max(abs(params[idx]), 1.0)
+            fwd, bwd = params.copy(), params.copy()
+            fwd[idx] += step
+            bwd[idx] -= step
+            fd_jac = resid_func(fwd, TEMPS_2, KTS_2, tref)
+            fd_jac -= resid_func(bwd, TEMPS_2, KTS_2, tref)
+            fd_jac /= 2 * step
+            max_diff = numpy.max(numpy.abs(jac[:, idx] - fd_jac))
+            assert max_diff < 1e-6 * numpy.max(numpy.abs(fd_jac))
+
+
 if __name__ == '__main__':
     test_single()
     test_double()
+    test_resid_jac()
@@ -2,6 +2,7 @@
 """
 
 import numpy
+from scipy.special import eval_chebyt
 from ratefit.fit import cheb
 from ratefit.fit import err
 
@@ -89,5 +90,78 @@ def test_cheb():
     assert max_err < 5
 
 
+def _ref_alpha(ktp_dct, tdeg, pdeg):
+    """ Chebyshev fit built point by point over the reduced T and P grid,
+        as a reference independent of cheb.design_matrix
+    """
+
+    pressures = tuple(pressure for pressure in ktp_dct if pressure != 'high')
+    temps = ktp_dct[pressures[0]][0]
+    tmin, tmax = min(temps), max(temps)
+    pmin, pmax = min(pressures), max(pressures)
+    tred = (2/temps - 1/tmin - 1/tmax) / (1/tmax - 1/tmin)
+    pred = ((2*numpy.log10(pressures) - numpy.log10(pmin) - numpy.log10(pmax))
+            / (numpy.log10(pmax) - numpy.log10(pmin)))
+
+    rows, bvec = [], []
+    for pidx, pressure in enumerate(pressures):
+        for tidx, ktp in enumerate(ktp_dct[pressure][1]):
+            if ktp <= 0.0:
+                continue
+            rows.append([eval_chebyt(tidx2, tred[tidx]) *
+                         eval_chebyt(pidx2, pred[pidx])
+                         for tidx2 in range(tdeg) for pidx2 in range(pdeg)])
+            bvec.append(numpy.log10(ktp))
+    theta = numpy.linalg.lstsq(numpy.array(rows), numpy.array(bvec),
+                               rcond=None)[0]
+
+    return theta.reshape(tdeg, pdeg), (tmin, tmax), (pmin, pmax)
+
+
+def test_get_alphas():
+    """ test ratefit.fit.cheb.get_alphas
+    """
+
+    # Scaled copy on the same grid, plus a copy with a missing value
+    scaled_ktp_dct = {pressure: (temps, 10 * kts)
+                      for pressure, (temps, kts) in KTP_DCT.items()}
+    missing_ktp_dct = {pressure: (temps, kts.copy())
+                       for pressure, (temps, kts) in KTP_DCT.items()}
+    missing_ktp_dct[1.0][1][3] = -1.0  # log10 gives nan; point is dropped
+    ktp_dcts = [KTP_DCT, scaled_ktp_dct, missing_ktp_dct]
+
+    alpha_lst = cheb.get_alphas(ktp_dcts, tdeg=TDEG, pdeg=PDEG)
+    assert len(alpha_lst) == 3
+    for ktp_dct, (alpha, tlim, plim) in zip(ktp_dcts, alpha_lst):
+        ref_alpha, ref_tlim, ref_plim = _ref_alpha(ktp_dct, TDEG, PDEG)
+        assert numpy.allclose(alpha, ref_alpha)
+        assert numpy.allclose(tlim, ref_tlim)
+        assert numpy.allclose(plim, ref_plim)
+
+    # Scaling k by 10 only shifts the constant term by 1
+    shift = alpha_lst[1][0] - alpha_lst[0][0]
+    assert numpy.isclose(shift[0, 0], 1.0)
+    assert numpy.allclose(shift.ravel()[1:], 0.0)
+
+
+def test_get_alphas_zero_rate():
+    """ test ratefit.fit.cheb.get_alphas with a zero rate constant batched
+        alongside a complete ktp_dct on the same grid
+    """
+
+    zero_ktp_dct = {pressure: (temps, kts.copy())
+                    for pressure, (temps, kts) in KTP_DCT.items()}
+    zero_ktp_dct[5.0][1][0] = 0.0  # log10 gives -inf; point is dropped
+    ktp_dcts = [KTP_DCT, zero_ktp_dct]
+
+    alpha_lst = cheb.get_alphas(ktp_dcts, tdeg=TDEG, pdeg=PDEG)
+    for ktp_dct, (alpha, _, _) in zip(ktp_dcts, alpha_lst):
+        assert numpy.all(numpy.isfinite(alpha))
+        ref_alpha, _, _ = _ref_alpha(ktp_dct, TDEG, PDEG)
+        assert numpy.allclose(alpha, ref_alpha)
+
+
 if __name__ == '__main__':
     test_cheb()
+    test_get_alphas()
+    test_get_alphas_zero_rate()
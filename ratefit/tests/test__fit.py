@@ -2,7 +2,9 @@
 """
 
 import numpy
+import ratefit
 from ratefit.fit import _fit as fit
+from ratefit.fit import err
 
 
 # Define things for the assess_fit_method test
@@ -108,10 +110,21 @@ CHEB_KTP_DCT = {
          6.81694453e+09, 8.58518980e+09, 1.04565997e+10, 1.23853058e+10,
          1.43297921e+10, 1.62545195e+10]))}
 
+# Define things for the Troe test
+TROE_TEMPS = numpy.linspace(300.0, 2000.0, 18)
+
 # Define things for the fit_rxn_ktp_dct test
 RXN1 = (('H', 'O2'), ('OH', 'O'), (None,))
 RXN2 = (('N', 'O2'), ('NO', 'O'), (None,))
 RXN_KTP_DCT = {RXN1: ARR_KTP_DCT, RXN2: ARR_KTP_DCT}
+RXN3 = (('H', 'HO2'), ('OH', 'OH'), (None,))
+CHEB_RXN_KTP_DCT = {
+    RXN1: CHEB_KTP_DCT,
+    RXN2: {pressure: (temps, 10 * kts)
+           for pressure, (temps, kts) in CHEB_KTP_DCT.items()}}
+BAD_RXN_KTP_DCT = {RXN1: ARR_KTP_DCT,
+                   RXN3: {'high': (None, None)},  # makes the fitter raise
+                   RXN2: PLOG_KTP_DCT}
 
 
 def test_assess_fit_method():
@@ -207,6 +220,33 @@ def test_fit_cheb():
     assert numpy.allclose(params.cheb['plim'], (ref_pmin, ref_pmax))
 
 
+def test_fit_troe():
+    """ Tests the fitting of a ktp_dct with the Troe and Lindemann forms
+    """
+
+    # Troe k(T,P)s for CH3 + H (+M) = CH4 from GRI-Mech 3.0
+    highp_kts = ratefit.calc.single_arrhenius(
+        1.27e16, -0.63, 383.0, 1.0, TROE_TEMPS)
+    lowp_kts = ratefit.calc.single_arrhenius(
+        2.477e33, -4.76, 2440.0, 1.0, TROE_TEMPS)
+    ktp_dct = ratefit.calc.troe(
+        highp_kts, lowp_kts, TROE_TEMPS, (0.01, 0.1, 1.0, 10.0, 100.0),
+        0.783, 74.0, 2941.0, ts2=6964.0)
+
+    fit_info = {}
+    params, err_dct = fit.fit_ktp_dct(ktp_dct, 'troe', fit_info=fit_info)
+    assert fit_info['method'] == 'troe'
+    assert params.troe is not None
+    assert err.get_max_err(err_dct) < fit.DEFAULT_TROE['tol']
+
+    # A Lindemann fit misses the broadening, so it falls back to PLOG
+    troefit_dct = {'params': (), 'tol': 5.0}
+    params, _ = fit.fit_ktp_dct(ktp_dct, 'lind', troefit_dct=troefit_dct,
+                                fit_info=fit_info)
+    assert fit_info['method'] == 'plog'
+    assert params.plog is not None
+
+
 def test_fit_rxn_ktp_dct():
     """ Tests the fitting of a rxn_ktp_dct
     """
@@ -217,9 +257,47 @@ def test_fit_rxn_ktp_dct():
         assert numpy.allclose(ref_arr_params, params.arr)
 
 
+def test_fit_rxn_ktp_dct_batch():
+    """ Tests the fitting of a rxn_ktp_dct over several processes, with
+        a reaction that fails to fit
+    """
+
+    ref_arr_params = numpy.asarray((1651834009420615.0, -0.0582113, 59922.119))
+    for nprocs in (1, 2):
+        rxn_param_dct, rxn_err_dct, rxn_info_dct = fit.fit_rxn_ktp_dct_batch(
+            BAD_RXN_KTP_DCT, 'arr', nprocs=nprocs, timeout=60.0)
+        assert tuple(rxn_param_dct.keys()) == (RXN1, RXN2)
+        assert tuple(rxn_err_dct.keys()) == (RXN1, RXN2)
+        assert tuple(rxn_info_dct.keys()) == (RXN1, RXN3, RXN2)
+        assert numpy.allclose(ref_arr_params, rxn_param_dct[RXN1].arr)
+        assert rxn_info_dct[RXN1]['status'] == 'ok'
+        assert rxn_info_dct[RXN1]['method'] == 'arr'
+        assert rxn_info_dct[RXN2]['method'] == 'plog'
+        assert rxn_info_dct[RXN2]['niter'] >= 3  # one fit per pressure
+        assert rxn_info_dct[RXN3]['status'] == 'error'
+    assert 'error' in fit.fit_report(rxn_info_dct)
+
+
+def test_fit_rxn_ktp_dct_batch_cheb():
+    """ Tests the batched Chebyshev fitting of reactions on the same grid
+    """
+
+    for nprocs in (1, 2):
+        rxn_param_dct, _, rxn_info_dct = fit.fit_rxn_ktp_dct_batch(
+            CHEB_RXN_KTP_DCT, 'cheb', nprocs=nprocs)
+        for rxn, ktp_dct in CHEB_RXN_KTP_DCT.items():
+            assert rxn_info_dct[rxn]['method'] == 'cheb'
+            ref_params, _ = fit.fit_ktp_dct(ktp_dct, 'cheb')
+            assert numpy.allclose(rxn_param_dct[rxn].cheb['alpha'],
+                                  ref_params.cheb['alpha'])
+
+
 if __name__ == '__main__':
     test_assess_fit_method()
     test_fit_arr()
     test_fit_plog()
     test_fit_cheb()
+    test_fit_troe()
     test_fit_rxn_ktp_dct()
+    test_fit_rxn_ktp_dct_batch()
+    test_fit_rxn_ktp_dct_batch_cheb()
@@ -0,0 +1,71 @@
+""" Test the Troe and Lindemann fitters
+"""
+
+import numpy
+import ratefit
+from ratefit.fit import troe
+from ratefit.fit import err
+
+
+TEMPS = numpy.linspace(300.0, 2000.0, 18)
+PRESSURES = (0.01, 0.1, 1.0, 10.0, 100.0)
+
+# CH3 + H (+M) = CH4 from GRI-Mech 3.0
+HIGHP_ARR = (1.27e16, -0.63, 383.0)
+LOWP_ARR = (2.477e33, -4.76, 2440.0)
+TROE_PARAMS = (0.783, 74.0, 2941.0, 6964.0)  # alpha, T***, T*, T**
+
+
+def _ktp_dct(troe_params=TROE_PARAMS):
+    """ Builds the k(T,P)s to be fitted, including the high-P limit
+    """
+
+    highp_kts = ratefit.calc.single_arrhenius(*HIGHP_ARR, 1.0, TEMPS)
+    lowp_kts = ratefit.calc.single_arrhenius(*LOWP_ARR, 1.0, TEMPS)
+    ktp_dct = {}
+    for pressure in PRESSURES:
+        if troe_params is None:
+            kts = ratefit.calc.lindemann_one_pressure(
+                highp_kts, lowp_kts, TEMPS, pressure)
+        else:
+            alpha, ts3, ts1, ts2 = troe_params
+            kts = ratefit.calc.troe_one_pressure(
+                highp_kts, lowp_kts, TEMPS, pressure, alpha, ts3, ts1, ts2=ts2)
+        ktp_dct[pressure] = (TEMPS, kts)
+    ktp_dct['high'] = (TEMPS, highp_kts)
+
+    return ktp_dct
+
+
+def test_troe():
+    """ test ratefit.fit.troe.get_params
+    """
+
+    fit_info = {}
+    params, err_dct = troe.get_params(_ktp_dct(), tol=1.0, fit_info=fit_info)
+    assert err.get_max_err(err_dct) < 1.0
+    assert set(err_dct) == set(PRESSURES) | {'high'}
+    assert fit_info['niter'] >= 2  # Lindemann, then at least one Troe fit
+    assert numpy.allclose(params.troe['troe_params'], TROE_PARAMS, rtol=1e-3)
+    assert numpy.allclose(params.troe['highp_arr'][0], HIGHP_ARR, rtol=1e-3)
+    assert numpy.allclose(params.troe['lowp_arr'][0], LOWP_ARR, rtol=1e-3)
+
+    # Without T**, only three Troe parameters are returned
+    params, _ = troe.get_params(_ktp_dct(), params=('alpha', 'ts1', 'ts3'))
+    assert len(params.troe['troe_params']) == 3
+
+
+def test_lind():
+    """ test ratefit.fit.troe.get_params for the Lindemann form
+    """
+
+    params, err_dct = troe.get_params(_ktp_dct(troe_params=None), lind=True)
+    assert err.get_max_err(err_dct) < 0.1
+    assert params.troe is None
+    assert numpy.allclose(params.lind['highp_arr'][0], HIGHP_ARR, rtol=1e-3)
+    assert numpy.allclose(params.lind['lowp_arr'][0], LOWP_ARR, rtol=1e-3)
+
+
+if __name__ == '__main__':
+    test_troe()
+    test_lind()
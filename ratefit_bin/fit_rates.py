@@ -24,6 +24,10 @@ PAR.add_argument('-c', '--chemkin', default='rate.ckin',
                  help='Chemkin ouput name (rate.ckin)')
 PAR.add_argument('-f', '--fit-method', default='plog',
                  help='method to fit the rates (plog, chebyshev)')
+PAR.add_argument('-n', '--nprocs', default='1',
+                 help='number of processes for fitting (1, auto)')
+PAR.add_argument('-t', '--timeout', type=float, default=None,
+                 help='time limit in seconds for fitting one reaction')
 OPTS = vars(PAR.parse_args())
 
 # Read label dct
@@ -38,6 +42,9 @@ rxn_ktp_dct = mess_io.reader.rates.get_rxn_ktp_dct(
 # Fit rates
 rxn_param_dct, rxn_err_dct = ratefit.fit.fit_rxn_ktp_dct(
     rxn_ktp_dct, OPTS['fit_method'],
+    nprocs=(OPTS['nprocs'] if OPTS['nprocs'] == 'auto'
+            else int(OPTS['nprocs'])),
+    timeout=OPTS['timeout']
 )
 
 # Get the comments dct and write the Chemkin string
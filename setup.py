@@ -17,7 +17,6 @@ setup(
         'ratefit',
         'ratefit.calc',
         'ratefit.fit',
-        'ratefit.fit.troe',
         'thermfit',
         'thermfit.cbh'
     ],
@@ -31,8 +30,7 @@ setup(
                          'tests/data/*.dat',
                          'tests/data/*.csv'],
         'ratefit': ['tests/data/*',
-                    'fit/arrhenius/dsarrfit.mako',
-                    'fit/troe/troefit.mako'],
+                    'fit/arrhenius/dsarrfit.mako'],
         'thermfit': ['thermdb/*.csv']
     }
 )
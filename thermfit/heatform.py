@@ -3,6 +3,7 @@
 
 import os
 import csv
+import functools
 from phydat import phycon
 
 
@@ -31,10 +32,12 @@ def calc_hform_0k(spc_h0, basis_h0,
 
     dhzero = spc_h0
 
+    # Read reference enthalpies for all basis molecules
+    ref_h0s = reference_enthalpies(basis_ichs, ref_set, 0)
+
     for i, ich in enumerate(basis_ichs):
 
-        # Read reference enthalpies for basis molecule
-        ref_h0 = reference_enthalpy(ich, ref_set, 0)
+        ref_h0 = ref_h0s[i]
         ref_h0 = ref_h0 if ref_h0 is not None else 0.0  # break loop?
 
         # Add basis and reference energies to overall va
@@ -64,28 +67,24 @@ def reference_enthalpy(ich_lookup, ref_set, temp, rxn=False):
         :type ref_set: str
         :param temp: temperature to obtain enthalpy value for
         :type temp: int
-        :param rxn: parameter to read value for species or reaction
+        :param rxn: parameter to read value for species or reaction;
+            always True if ich_lookup is not a string
         :type rxn: bool
     """
 
-    # Set path and name to thermo database file
-    rxn = True
-    if isinstance(ich_lookup, str):
-        rxn = False
-    thermodb_file = _thermo_database(temp, rxn=rxn)
+    # Format the reaction InChI if needed
+    rxn = rxn or not isinstance(ich_lookup, str)
     if rxn:
-        ich_lookup = '+'.join(ich_lookup[0]) + '=' + '+'.join(ich_lookup[1])
+        if not isinstance(ich_lookup, str):
+            ich_lookup = format_reaction_inchi(ich_lookup)
         ref_set = 'ANL0'
 
     # Find the energy value for the given species and enery type
+    row = enthalpy_table(temp, rxn=rxn).get(ich_lookup)
     hf_val = None
-    with open(thermodb_file, mode='r', encoding='utf-8') as db_file:
-        reader = csv.DictReader(db_file)
-        for row in reader:
-            if row['inchi'] == ich_lookup:
-                val = row[ref_set]
-                hf_val = float(val) if val != '' else None
-                break
+    if row is not None:
+        val = row[ref_set]
+        hf_val = float(val) if val != '' else None
 
     # Convert units if val found, else print error message
     assert hf_val is not None, (
@@ -100,6 +99,56 @@ def reference_enthalpy(ich_lookup, ref_set, temp, rxn=False):
     return hf_val
 
 
+def reference_enthalpies(ich_lookups, ref_set, temp, rxn=False):
+    """ Reads the reference enthalpies for a list of species or transition
+        states; see reference_enthalpy. Values returned in Hartrees.
+
+        :param ich_lookups: InChI strings of species/TSs to lookup
+        :type ich_lookups: tuple(str)
+        :param ref_set: database set to read value from
+        :type ref_set: str
+        :param temp: temperature to obtain enthalpy value for
+        :type temp: int
+        :param rxn: parameter to read value for species or reaction
+        :type rxn: bool
+        :rtype: tuple(float)
+    """
+    return tuple(reference_enthalpy(ich, ref_set, temp, rxn=rxn)
+                 for ich in ich_lookups)
+
+
+def enthalpy_table(temp, rxn=False):
+    """ Reads a thermo database file into a dictionary indexed by InChI.
+        Each file is only read once per process; worker processes forked
+        after the first call share the table. If an InChI appears more
+        than once, the first row is kept.
+
+        The table is shared by all callers and must not be modified.
+
+        :param temp: temperature to obtain enthalpy values for
+        :type temp: int
+        :param rxn: parameter to read values for species or reactions
+        :type rxn: bool
+        :return: rows of the database, with the reference sets as keys
+        :rtype: dict[str: dict[str: str]]
+    """
+    return _read_enthalpy_table(_thermo_database(temp, rxn=rxn))
+
+
+@functools.lru_cache(maxsize=None)
+def _read_enthalpy_table(db_path):
+    """ Reads a thermo database file into a dictionary indexed by InChI;
+        cached on the file path so that every call form shares one table
+    """
+
+    table = {}
+    with open(db_path, mode='r', encoding='utf-8') as db_file:
+        for row in csv.DictReader(db_file):
+            table.setdefault(row['inchi'], row)
+
+    return table
+
+
 def format_reaction_inchi(rxn_ichs):
     """ Format the InChI strings of the reaction into a string to
         look up a reaction enthalpy in the database.
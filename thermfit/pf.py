@@ -53,16 +53,13 @@ def _combine_pfs(pfa, pfb, coeff, operator):
         :param operator: multiplication/division operator
     """
 
-    tempsa, logqa, dq_dta, d2q_dt2a = pfa
-    _, logqb, dq_dtb, d2q_dt2b = pfb
+    tempsa = pfa[0]
+    arrsa = numpy.array(pfa[1:], dtype=float)
+    arrsb = numpy.array(pfb[1:], dtype=float)
     if operator == 'multiply':
-        logq = [a+b+numpy.log(coeff) for a, b in zip(logqa, logqb)]
-        dq_dt = [a+b+numpy.log(coeff) for a, b in zip(dq_dta, dq_dtb)]
-        d2q_dt2 = [a+b+numpy.log(coeff) for a, b in zip(d2q_dt2a, d2q_dt2b)]
+        logq, dq_dt, d2q_dt2 = arrsa + arrsb + numpy.log(coeff)
     elif operator == 'divide':
-        logq = [a-b-numpy.log(coeff) for a, b in zip(logqa, logqb)]
-        dq_dt = [a-b-numpy.log(coeff) for a, b in zip(dq_dta, dq_dtb)]
-        d2q_dt2 = [a-b-numpy.log(coeff) for a, b in zip(d2q_dt2a, d2q_dt2b)]
+        logq, dq_dt, d2q_dt2 = arrsa - arrsb - numpy.log(coeff)
 
     return tempsa, tuple(logq), tuple(dq_dt), tuple(d2q_dt2)
 
@@ -107,43 +104,89 @@ def q_rotational(i_a, i_b, i_c, sigma, temp, linear=False):
 
 
 def q_vibrational(freqs, temp):
-    """ Caulculate the vibrational partition function
+    """ Caulculate the vibrational partition function;
+        temp may be an array of temperatures
     """
-    q_vib = 1.
-    for freq in freqs:
-        # nu_i = freq * phycon.WAVEN2EH * phycon.EH2KJ * 1000.  # in J/mol
-        nu_i = freq * phycon.SOLMS * 100.   # in 1/s
-        # numerator = numpy.exp(-(phycon.H * nu_i) / (2 * phycon.KB * temp))
-        numerator = 1.
-        denominator = 1 - numpy.exp(-(phycon.H * nu_i) / (phycon.KB * temp))
-        q_vib *= numerator / denominator
-    return q_vib
+    lnq_vib, _, _ = ln_q_vibrational(freqs, temp)
+    return numpy.exp(lnq_vib)
 
 
-def rrho_partition_function(geo, freqs, temp_range=None, nlog=0):
-    """ Calculate the total rrho partition function
+def ln_q_vibrational(freqs, temps):
+    """ Calculate the natural log of the vibrational partition function
+        (energies relative to the zero-point) and its first and second
+        derivatives with respect to temperature, over all
+        temperatures and frequencies at once
+
+        :param freqs: vibrational frequencies (cm-1)
+        :type freqs: list(float)
+        :param temps: temperature(s) (K)
+        :type temps: float or numpy.ndarray
+        :rtype: (numpy.ndarray, numpy.ndarray, numpy.ndarray)
     """
-    q_total = {}
-    if temp_range is None:
-        temp_range = list(range(300, 3000, 100))
+    temps = numpy.asarray(temps, dtype=float)[..., numpy.newaxis]
+    # vibrational temperatures: h*nu/kB, with nu in 1/s
+    vib_temps = (phycon.H * numpy.asarray(freqs, dtype=float)
+                 * phycon.SOLMS * 100. / phycon.KB)
+    x_vals = vib_temps / temps
+    expm1_x = numpy.expm1(x_vals)
+    lnq = -numpy.sum(numpy.log1p(-numpy.exp(-x_vals)), axis=-1)
+    dlnqdt = numpy.sum(x_vals / expm1_x, axis=-1) / temps[..., 0]
+    d2lnqdt2 = numpy.sum(
+        x_vals * ((expm1_x + 1) * x_vals / expm1_x - 2) / expm1_x,
+        axis=-1) / temps[..., 0]**2
+
+    return lnq, dlnqdt, d2lnqdt2
+
+
+def rrho_ln_partition_function(geo, freqs, temps):
+    """ Calculate the natural log of the total rrho partition function
+        and its first and second derivatives with respect to temperature,
+        all analytic, over an array of temperatures
+
+        :param geo: molecular geometry
+        :type geo: automol geometry data structure
+        :param freqs: vibrational frequencies (cm-1)
+        :type freqs: list(float)
+        :param temps: temperature(s) (K)
+        :type temps: float or numpy.ndarray
+        :return: temps, lnq, dlnqdt, d2lnqdt2 in the layout used by
+            combine and boltzmann_pf_combination
+        :rtype: tuple(numpy.ndarray)
+    """
+    temps = numpy.asarray(temps, dtype=float)
     mass = automol.geom.total_mass(geo)
     moms = automol.geom.moments_of_inertia(geo)
     linear = automol.geom.is_linear(geo)
     ext_symm = automol.geom.external_symmetry_factor(geo)
     int_symm, _ = automol.symm.oxygenated_hydrocarbon_symm_num(geo)
     sigma = int_symm * ext_symm
-    for temp in temp_range:
-        q_elec = 1.
-        q_trans = q_translational(mass, temp)
-        q_rot = q_rotational(*moms, sigma, temp, linear=linear)
-        q_vib = q_vibrational(freqs, temp)
-        q_all = q_elec * q_trans * q_rot * q_vib
+
+    # q_trans ~ T^3/2 and q_rot ~ T (linear) or T^3/2 (nonlinear); q_elec = 1
+    temp_exp = 1.5 + (1. if linear else 1.5)
+    lnq_vib, dlnqdt_vib, d2lnqdt2_vib = ln_q_vibrational(freqs, temps)
+    lnq = (numpy.log(q_translational(mass, temps))
+           + numpy.log(q_rotational(*moms, sigma, temps, linear=linear))
+           + lnq_vib)
+    dlnqdt = temp_exp / temps + dlnqdt_vib
+    d2lnqdt2 = -temp_exp / temps**2 + d2lnqdt2_vib
+
+    return temps, lnq, dlnqdt, d2lnqdt2
+
+
+def rrho_partition_function(geo, freqs, temp_range=None, nlog=0):
+    """ Calculate the total rrho partition function
+    """
+    q_total = {}
+    if temp_range is None:
+        temp_range = list(range(300, 3000, 100))
+    temps, lnqs, _, _ = rrho_ln_partition_function(geo, freqs, temp_range)
+    for temp, lnq in zip(temps, lnqs):
         if nlog == 0:
-            q_total[round(temp, 4)] = q_all
+            q_total[round(temp, 4)] = numpy.exp(lnq)
         elif nlog == 1:
-            q_total[round(temp, 4)] = numpy.log(q_all)
+            q_total[round(temp, 4)] = lnq
         elif nlog == 2:
-            q_total[round(numpy.log(temp), 4)] = numpy.log(q_all)
+            q_total[round(numpy.log(temp), 4)] = lnq
     return q_total
 
 
@@ -204,58 +247,67 @@ def rel_gibbs_energy_from_pf(pf_fun, temp, zero_ene):
     return energy * phycon.J2CAL / 1000.
 
 
+def properties_from_ln_pf(temps, lnq, dlnqdt, d2lnqdt2):
+    """ Calculate the enthalpy [kcal/mol], entropy and heat capacity
+        [cal/(mol K)] from ln Q and its analytic derivatives, with the same
+        expressions as enthalpy_from_pf, entropy_from_pf and
+        heat_capacity_from_pf; works on arrays of temperatures
+
+        :rtype: (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+    """
+    temps = numpy.asarray(temps, dtype=float)
+    rgas = phycon.NAVO * phycon.KB * phycon.J2CAL
+    enthalpy = phycon.RC_KCAL * temps * (temps * dlnqdt + 1)
+    entropy = rgas * (
+        temps * dlnqdt + lnq - numpy.log(phycon.NAVO) + 5.4
+        + numpy.log(temps))
+    heat_cap = rgas * (temps**2 * d2lnqdt2 + 2 * temps * dlnqdt + 1)
+    return enthalpy, entropy, heat_cap
+
+
 def rrho_del_enthalpy(geo, freqs, temp=298.15):
     """ Get enthalpy from RRHO?
     """
-    temp_range = numpy.arange(temp, temp+20, .05)
-    q_total = rrho_partition_function(geo, freqs, temp_range, nlog=0)
-    pf_fun, dqdt, _ = pf_polys(q_total)
-    enthalpy = enthalpy_from_pf(pf_fun, dqdt, temp)
-    return enthalpy
+    ln_pf_array = rrho_ln_partition_function(geo, freqs, temp)
+    enthalpy, _, _ = properties_from_ln_pf(*ln_pf_array)
+    return float(enthalpy)
 
 
 def rrho_entropy(geo, freqs, temp=298.15):
     """ Entropy from RRHO?
     """
-    temp_range = numpy.arange(temp, temp+20, .05)
-    q_total = rrho_partition_function(geo, freqs, temp_range, nlog=0)
-    pf_fun, dqdt, _ = pf_polys(q_total)
-    entropy = entropy_from_pf(pf_fun, dqdt, temp)
-    return entropy
+    ln_pf_array = rrho_ln_partition_function(geo, freqs, temp)
+    _, entropy, _ = properties_from_ln_pf(*ln_pf_array)
+    return float(entropy)
 
 
 def rrho_heat_capacity(geo, freqs, temp=298.15):
     """ Heat Capacity from RRHO?
     """
-    temp_range = numpy.arange(temp, temp+20, .05)
     heat_cap = None
     if temp > 20:
-        lnq_total = rrho_partition_function(geo, freqs, temp_range, nlog=1)
-        lnq, _, d2lnqdt2 = pf_polys(lnq_total)
-        lnq_lnt = rrho_partition_function(geo, freqs, temp_range, nlog=2)
-        _, dlnqdlnt, _ = pf_polys(lnq_lnt)
-        heat_cap = heat_capacity_from_pf(lnq, dlnqdlnt, d2lnqdt2, temp)
+        ln_pf_array = rrho_ln_partition_function(geo, freqs, temp)
+        _, _, heat_cap = properties_from_ln_pf(*ln_pf_array)
+        heat_cap = float(heat_cap)
     return heat_cap
 
 
 def rrho_gibbs(geo, freqs, temp=298.15):
     """ RRHO Gibbs function
     """
-    temp_range = numpy.arange(temp, temp+20, .05)
-    q_total = rrho_partition_function(geo, freqs, temp_range, nlog=0)
-    pf_fun, _, _ = pf_polys(q_total)
-    gibbs = gibbs_energy_from_pf(pf_fun, temp)
-    return gibbs
+    _, lnq, _, _ = rrho_ln_partition_function(geo, freqs, temp)
+    gibbs = - phycon.NAVO * phycon.KB * temp * lnq
+    return float(gibbs * phycon.J2CAL / 1000.)
 
 
 def rrho_gibbs_factor(geo, freqs, zero_ene, temp):
     """ RRHO Gibbs factor
     """
     zero_ene = zero_ene * 1000. / phycon.J2CAL
-    temp_range = numpy.arange(temp, temp+20, .05)
-    q_total = rrho_partition_function(geo, freqs, temp_range, nlog=0)
-    pf_fun, _, _ = pf_polys(q_total)
-    return rel_gibbs_energy_from_pf(pf_fun, temp, zero_ene)
+    _, lnq, _, _ = rrho_ln_partition_function(geo, freqs, temp)
+    rel_lnq = lnq - zero_ene / (phycon.KB * phycon.NAVO * temp)
+    energy = - phycon.NAVO * phycon.KB * temp * rel_lnq
+    return float(energy * phycon.J2CAL / 1000.)
 
 
 def rrho_properties(geo, freqs, temps=None):
@@ -263,22 +315,19 @@ def rrho_properties(geo, freqs, temps=None):
     """
     if temps is None:
         temps = [200, 300, 400, 500, 600, 700, 800, 900, 1000, 1500]
-    for temp in temps:
-        temp_range = numpy.arange(temp, temp+20, .05)
-        heat_cap = 0
-        if temp > 20:
-            lnq_total = rrho_partition_function(geo, freqs, temp_range, nlog=1)
-            lnq, _, d2lnqdt2 = pf_polys(lnq_total)
-            # print('Q:', temp, lnq(temp), dlnqdt(temp), d2lnqdt2(temp))
-            lnq_lnt = rrho_partition_function(geo, freqs, temp_range, nlog=2)
-            _, dlnqdlnt, _ = pf_polys(lnq_lnt)
-            heat_cap = heat_capacity_from_pf(lnq, dlnqdlnt, d2lnqdt2, temp)
-        q_total = rrho_partition_function(geo, freqs, temp_range, nlog=0)
-        pf_fun, dqdt, _ = pf_polys(q_total)
-        entropy = entropy_from_pf(pf_fun, dqdt, temp)
-        enthalpy = enthalpy_from_pf(pf_fun, dqdt, temp)
+    ln_pf_array = rrho_ln_partition_function(geo, freqs, temps)
+    enthalpies, entropies, heat_caps = properties_from_ln_pf(*ln_pf_array)
+    heat_caps = numpy.where(ln_pf_array[0] > 20, heat_caps, 0)
+    for temp, heat_cap, entropy, enthalpy in zip(
+            temps, heat_caps, entropies, enthalpies):
         # gibbs = enthalpy - entropy * temp / 1000.
         print('Prop:', temp, heat_cap, entropy, enthalpy)
+
+    # properties at the last temperature
+    enthalpy = float(enthalpies[-1])
+    entropy = float(entropies[-1])
+    heat_cap = float(heat_caps[-1])
+
     return enthalpy, entropy, heat_cap
 
 
@@ -372,28 +421,23 @@ def from_ln_partition_function(lnq_tuple, dlnqdt_tuple, d2lnqdt2_tuple):
     """Translate partition functions as natural logs into
         nonlogged partition functions
     """
-    pf_tuple = ()
-    dqdt_tuple = ()
-    d2qdt2_tuple = ()
-    for lnq, dlnqdt, d2lnqdt2 in zip(lnq_tuple, dlnqdt_tuple, d2lnqdt2_tuple):
-        pf_tuple += (numpy.exp(lnq),)
-        dqdt_tuple += (numpy.exp(lnq) * dlnqdt,)
-        d2qdt2_tuple += (numpy.exp(lnq) * (dlnqdt**2 + d2lnqdt2),)
-    return (pf_tuple, dqdt_tuple, d2qdt2_tuple,)
+    lnq, dlnqdt, d2lnqdt2 = (
+        numpy.asarray(arr, dtype=float)
+        for arr in (lnq_tuple, dlnqdt_tuple, d2lnqdt2_tuple))
+    pf_arr = numpy.exp(lnq)
+    return (tuple(pf_arr), tuple(pf_arr * dlnqdt),
+            tuple(pf_arr * (dlnqdt**2 + d2lnqdt2)),)
 
 
 def to_ln_partition_function(pf_tuple, dqdt_tuple, d2qdt2_tuple):
     """Translate partition functions to natural logs from
        nonlogged partition functions
     """
-    lnq_tuple = ()
-    dlnqdt_tuple = ()
-    d2lnqdt2_tuple = ()
-    for pf_val, dqdt, d2qdt2 in zip(pf_tuple, dqdt_tuple, d2qdt2_tuple):
-        lnq_tuple += (numpy.log(pf_val),)
-        dlnqdt_tuple += (dqdt / pf_val,)
-        d2lnqdt2_tuple += (d2qdt2/pf_val - dqdt**2/pf_val**2,)
-    return (lnq_tuple, dlnqdt_tuple, d2lnqdt2_tuple,)
+    pf_arr, dqdt, d2qdt2 = (
+        numpy.asarray(arr, dtype=float)
+        for arr in (pf_tuple, dqdt_tuple, d2qdt2_tuple))
+    return (tuple(numpy.log(pf_arr)), tuple(dqdt / pf_arr),
+            tuple(d2qdt2/pf_arr - dqdt**2/pf_arr**2),)
 
 
 def additive_pf_combination_at_temp(pf_arrays_lst, weight_lst, idx):
@@ -416,70 +460,71 @@ def weights_at_temp(pf_arrays_lst, hf_lst, temps, idx):
         of partition functions and 0 K heats
         of formations for thtose conformers and a temperature
     """
-    pfs_t_lst = []
-    temp = temps[idx]
-    hf_lst = [hf_i * phycon.EH2KJ * 1000 for hf_i in hf_lst]
-    knt = phycon.KB * phycon.NAVO * temp
-    for pf_array in pf_arrays_lst:
-        pfs_t_lst.append(pf_array[0][idx])
+    pfs = numpy.array([pf_array[0] for pf_array in pf_arrays_lst])
+    weights = _boltzmann_weights(pfs, hf_lst, temps)
+
+    return list(weights[:, idx])
+
+
+def _boltzmann_weights(pfs, hf_lst, temps):
+    """ Weights of each conformer at all temperatures at once
+
+        :param pfs: partition functions, array[conformer, temp]
+        :type pfs: numpy.ndarray
+        :return: weights, array[conformer, temp]
+        :rtype: numpy.ndarray
+    """
+    hfs = numpy.asarray(hf_lst, dtype=float) * phycon.EH2KJ * 1000
+    knt = phycon.KB * phycon.NAVO * numpy.asarray(temps, dtype=float)
+    exponents = numpy.exp(
+        (numpy.min(hfs) - hfs[:, numpy.newaxis]) / knt[numpy.newaxis, :])
+    q_exps = numpy.asarray(pfs, dtype=float) * exponents
 
-    denominator = 0.
-    h_zero = min(hf_lst)
-    for q_val_i, h_val_i in zip(pfs_t_lst, hf_lst):
-        exponent = numpy.exp((h_zero - h_val_i) / knt)
-        denominator += q_val_i * exponent
+    return q_exps / numpy.sum(q_exps, axis=0)
 
-    weight_lst = []
-    for q_val_i, h_val_i in zip(pfs_t_lst, hf_lst):
-        exponent = numpy.exp((h_zero - h_val_i) / knt)
-        weight_lst.append(q_val_i * exponent / denominator)
 
-    return weight_lst
+def _scaled_pf_arrays(ln_pf_arrays_lst):
+    """ Nonlog pfs and derivatives of all conformers, array[conformer,
+        (q, dqdt, d2qdt2), temp], all divided by the largest q at each
+        temperature to avoid overflows; the max ln q is also returned
+    """
+    temps = ln_pf_arrays_lst[-1][0]
+    ln_arrs = numpy.array(
+        [ln_pf_array[1:] for ln_pf_array in ln_pf_arrays_lst], dtype=float)
+    max_lnq = numpy.max(ln_arrs[:, 0], axis=0)
+    ln_arrs[:, 0] -= max_lnq
+    pf_arrs = numpy.array(
+        [from_ln_partition_function(*ln_arr) for ln_arr in ln_arrs])
+
+    return temps, pf_arrs, max_lnq
+
+
+def _weighted_ln_pf_arrays(temps, pf_arrs, max_lnq, weights):
+    """ ln of the weighted sum of scaled pfs, with the derivatives
+    """
+    total_pf_arrays = numpy.sum(weights[:, numpy.newaxis, :] * pf_arrs, axis=0)
+    lnq, dlnqdt, d2lnqdt2 = to_ln_partition_function(*total_pf_arrays)
+
+    return (temps, tuple(numpy.array(lnq) + max_lnq), dlnqdt, d2lnqdt2)
 
 
 def boltzmann_pf_combination(ln_pf_arrays_lst, hf_lst):
     """combine pfs
     """
-    pf_arrays_lst = []
-    for ln_pf_array in ln_pf_arrays_lst:
-        temps, lnq_tuple, dlnqdt_tuple, d2lnqdt2_tuple = ln_pf_array
-        pf_arrays_lst.append(
-            from_ln_partition_function(
-                lnq_tuple, dlnqdt_tuple, d2lnqdt2_tuple))
-    total_pf_arrays = ([], [], [])
+    temps, pf_arrs, max_lnq = _scaled_pf_arrays(ln_pf_arrays_lst)
+    # the weights do not depend on the scaling of the pfs
+    weights = _boltzmann_weights(pf_arrs[:, 0], hf_lst, temps)
     print('Weights:\n', 'Temperature (K)', 'Conformer Weight')
-    for idx, temp in enumerate(temps):
-        weight_lst = weights_at_temp(pf_arrays_lst, hf_lst, temps, idx)
+    for temp, weight_lst in zip(temps, weights.T):
         print(temp, '    ', '    '.join([f'{w:.3f}' for w in weight_lst]))
-        pf_arrays_i = additive_pf_combination_at_temp(
-            pf_arrays_lst, weight_lst, idx)
-        total_pf_arrays[0].append(pf_arrays_i[0])
-        total_pf_arrays[1].append(pf_arrays_i[1])
-        total_pf_arrays[2].append(pf_arrays_i[2])
-    final_ln_pf_arrays = to_ln_partition_function(*total_pf_arrays)
-    final_ln_pf_arrays_with_temps = (temps, *final_ln_pf_arrays)
 
-    return final_ln_pf_arrays_with_temps
+    return _weighted_ln_pf_arrays(temps, pf_arrs, max_lnq, weights)
 
 
 def combine_pfs_additively(ln_pf_arrays_lst):
     """combine pfs additively
     """
-    pf_arrays_lst = []
-    for ln_pf_array in ln_pf_arrays_lst:
-        temps, lnq_tuple, dlnqdt_tuple, d2lnqdt2_tuple = ln_pf_array
-        pf_arrays_lst.append(
-            from_ln_partition_function(
-                lnq_tuple, dlnqdt_tuple, d2lnqdt2_tuple))
-    total_pf_arrays = ([], [], [])
-    for idx, temp in enumerate(temps):
-        weight_lst = [1]*len(pf_arrays_lst)
-        pf_arrays_i = additive_pf_combination_at_temp(
-            pf_arrays_lst, weight_lst, idx)
-        total_pf_arrays[0].append(pf_arrays_i[0])
-        total_pf_arrays[1].append(pf_arrays_i[1])
-        total_pf_arrays[2].append(pf_arrays_i[2])
-    final_ln_pf_arrays = to_ln_partition_function(*total_pf_arrays)
-    final_ln_pf_arrays_with_temps = (temps, *final_ln_pf_arrays)
-
-    return final_ln_pf_arrays_with_temps
+    temps, pf_arrs, max_lnq = _scaled_pf_arrays(ln_pf_arrays_lst)
+    weights = numpy.ones((len(pf_arrs), len(temps)))
+
+    return _weighted_ln_pf_arrays(temps, pf_arrs, max_lnq, weights)
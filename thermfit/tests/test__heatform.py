@@ -77,3 +77,21 @@ def test__ref_enthalpy():
     with pytest.raises(AssertionError):
         _ = thermfit.heatform.reference_enthalpy(
             NON_DB_ICH, REF_SET1, TEMP1, rxn=False)
+
+
+def test__ref_enthalpies():
+    """ test thermfit.heatform.reference_enthalpies
+    """
+
+    ichs = (C3H7OH_ICH,) + C3H7OH_BASIS
+    hf0ks = thermfit.heatform.reference_enthalpies(ichs, REF_SET1, TEMP1)
+    assert numpy.allclose(
+        hf0ks,
+        [thermfit.heatform.reference_enthalpy(ich, REF_SET1, TEMP1)
+         for ich in ichs])
+
+    # The database is only read once, however the table is requested
+    assert (thermfit.heatform.enthalpy_table(TEMP1, rxn=False) is
+            thermfit.heatform.enthalpy_table(TEMP1))
+    assert (thermfit.heatform.enthalpy_table(TEMP1, rxn=True) is
+            thermfit.heatform.enthalpy_table(TEMP1, True))
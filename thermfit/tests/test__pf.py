@@ -0,0 +1,98 @@
+""" test thermfit.pf functions for analytic RRHO partition functions
+"""
+
+import numpy
+import thermfit.pf
+
+
+# Water, coordinates in bohr
+GEO = (('O', (0.0000000000, 0.0000000000, 0.2217348460)),
+       ('H', (0.0000000000, 1.4309093350, -0.8869393840)),
+       ('H', (0.0000000000, -1.4309093350, -0.8869393840)))
+FREQS = (1595., 3657., 3756.)
+TEMPS = numpy.array((300., 1000., 2000.))
+
+
+def test__ln_q_vibrational():
+    """ test thermfit.pf.ln_q_vibrational
+    """
+
+    freqs = (300., 1000., 3000.)
+    lnq, dlnqdt, d2lnqdt2 = thermfit.pf.ln_q_vibrational(freqs, TEMPS)
+    assert numpy.allclose(
+        lnq, [numpy.log(thermfit.pf.q_vibrational(freqs, temp))
+              for temp in TEMPS])
+
+    # analytic derivatives against finite differences
+    dtemp = 1.0e-3
+    lnq_p, dlnqdt_p, _ = thermfit.pf.ln_q_vibrational(freqs, TEMPS+dtemp)
+    lnq_m, dlnqdt_m, _ = thermfit.pf.ln_q_vibrational(freqs, TEMPS-dtemp)
+    assert numpy.allclose(dlnqdt, (lnq_p - lnq_m) / (2*dtemp), rtol=1e-6)
+    assert numpy.allclose(
+        d2lnqdt2, (dlnqdt_p - dlnqdt_m) / (2*dtemp), rtol=1e-6)
+
+
+def test__rrho_ln_partition_function():
+    """ test thermfit.pf.rrho_ln_partition_function
+    """
+
+    temps, lnq, dlnqdt, d2lnqdt2 = thermfit.pf.rrho_ln_partition_function(
+        GEO, FREQS, TEMPS)
+    assert numpy.allclose(temps, TEMPS)
+
+    # analytic derivatives against finite differences
+    dtemp = 1.0e-3
+    _, lnq_p, dlnqdt_p, _ = thermfit.pf.rrho_ln_partition_function(
+        GEO, FREQS, TEMPS+dtemp)
+    _, lnq_m, dlnqdt_m, _ = thermfit.pf.rrho_ln_partition_function(
+        GEO, FREQS, TEMPS-dtemp)
+    assert numpy.allclose(dlnqdt, (lnq_p - lnq_m) / (2*dtemp), rtol=1e-6)
+    assert numpy.allclose(
+        d2lnqdt2, (dlnqdt_p - dlnqdt_m) / (2*dtemp), rtol=1e-6)
+
+    # a single temperature gives the same values
+    _, lnq_one, _, _ = thermfit.pf.rrho_ln_partition_function(
+        GEO, FREQS, TEMPS[1])
+    assert numpy.isclose(lnq_one, lnq[1])
+
+
+def test__properties_from_ln_pf():
+    """ test thermfit.pf.properties_from_ln_pf against enthalpy_from_pf,
+        entropy_from_pf and heat_capacity_from_pf
+    """
+
+    def _lnq(temp):
+        return thermfit.pf.ln_q_vibrational(FREQS, temp)
+
+    def pf_fun(temp):
+        return numpy.exp(_lnq(temp)[0])
+
+    def dqdt(temp):
+        lnq, dlnqdt, _ = _lnq(temp)
+        return numpy.exp(lnq) * dlnqdt
+
+    def dlnqdlnt(lntemp):
+        temp = numpy.exp(lntemp)
+        return temp * _lnq(temp)[1]
+
+    def d2lnqdt2(temp):
+        return _lnq(temp)[2]
+
+    enthalpy, entropy, heat_cap = thermfit.pf.properties_from_ln_pf(
+        TEMPS, *_lnq(TEMPS))
+    assert numpy.allclose(
+        enthalpy,
+        [thermfit.pf.enthalpy_from_pf(pf_fun, dqdt, temp) for temp in TEMPS])
+    assert numpy.allclose(
+        entropy,
+        [thermfit.pf.entropy_from_pf(pf_fun, dqdt, temp) for temp in TEMPS])
+    assert numpy.allclose(
+        heat_cap,
+        [thermfit.pf.heat_capacity_from_pf(None, dlnqdlnt, d2lnqdt2, temp)
+         for temp in TEMPS])
+
+
+if __name__ == '__main__':
+    test__ln_q_vibrational()
+    test__rrho_ln_partition_function()
+    test__properties_from_ln_pf()